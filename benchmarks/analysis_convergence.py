@@ -0,0 +1,88 @@
+"""Compare engine CPU time of fixed-depth and converged analysis per position.
+
+Each mode gets its own engine process, so neither reuses hash entries of
+the other. CPU time is read from engine process itself.
+
+Run from StrikeChess's top-level directory, optionally with path to UCI
+engine (bundled Stockfish by default):
+
+    python -m benchmarks.analysis_convergence [path/to/engine]
+"""
+
+from __future__ import annotations
+
+import sys
+
+from chess import Board, Move
+from chess.engine import Limit, SimpleEngine
+from psutil import Process
+
+from benchmarks.game_review import game_positions
+from strikechess.logic import ConvergenceDetector, path_to_stockfish
+
+ANALYSIS_DEPTH: int = 20
+POSITION_STEP: int = 6
+
+
+def cpu_seconds(process: Process) -> float:
+    """Get CPU seconds that `process` has spent so far."""
+    cpu_times = process.cpu_times()
+    return cpu_times.user + cpu_times.system
+
+
+def analysis_cost(
+    engine: SimpleEngine, board: Board, is_early_stop_on: bool
+) -> tuple[float, int, Move | None]:
+    """Get CPU seconds, reached depth, and best move of analysing `board`."""
+    process: Process = Process(engine.transport.get_pid())
+    detector: ConvergenceDetector = ConvergenceDetector()
+    start: float = cpu_seconds(process)
+
+    with engine.analysis(board, Limit(depth=ANALYSIS_DEPTH)) as analysis:
+        for info in analysis:
+            if is_early_stop_on and detector.update(info):
+                analysis.stop()
+
+    pv: list[Move] = analysis.info.get("pv", [])
+    depth: int = analysis.info.get("depth", 0)
+    return cpu_seconds(process) - start, depth, pv[0] if pv else None
+
+
+def main() -> None:
+    """Print CPU seconds saved by early stop for positions of random game."""
+    path_to_file: str = sys.argv[1] if len(sys.argv) > 1 else path_to_stockfish()
+    fixed_engine: SimpleEngine = SimpleEngine.popen_uci(path_to_file)
+    converged_engine: SimpleEngine = SimpleEngine.popen_uci(path_to_file)
+    saved_seconds: list[float] = []
+    agreements: int = 0
+
+    try:
+        for ply, fen in game_positions()[::POSITION_STEP]:
+            board: Board = Board(fen)
+
+            if board.is_game_over():
+                continue
+
+            fixed_seconds, _, fixed_move = analysis_cost(fixed_engine, board, False)
+            seconds, depth, move = analysis_cost(converged_engine, board, True)
+            saved_seconds.append(fixed_seconds - seconds)
+            agreements += move == fixed_move
+
+            print(
+                f"ply {ply:>3} fixed {fixed_seconds:>6.2f} s "
+                f"converged {seconds:>6.2f} s at depth {depth:>2} "
+                f"saved {fixed_seconds - seconds:>6.2f} s"
+            )
+    finally:
+        fixed_engine.quit()
+        converged_engine.quit()
+
+    if saved_seconds:
+        print(
+            f"saved {sum(saved_seconds) / len(saved_seconds):.2f} CPU-seconds "
+            f"per position, same best move in {agreements}/{len(saved_seconds)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measure cost of journaling game events and of recovering from journal.
+
+Run from StrikeChess's top-level directory:
+
+    python -m benchmarks.game_journal
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from chess import Move
+
+from benchmarks.position_history import random_game
+from strikechess.logic import GameCore, GameJournal, MoveFacts, read_journal
+
+EVENT_COUNT: int = 10_000
+RECOVERY_SAMPLES: int = 5
+
+
+def write_journal(path_to_file: str, seed: int = 11) -> list[float]:
+    """Journal mix of pushes, clock ticks, and navigation; get caller timings."""
+    rng: random.Random = random.Random(seed)
+    moves: list[Move] = random_game(EVENT_COUNT // 2)
+    game: GameCore = GameCore()
+    journal: GameJournal = GameJournal(path_to_file)
+    timings: list[float] = []
+    event_count: int = 0
+
+    journal.restart(game.fen)
+
+    for move in moves:
+        if event_count >= EVENT_COUNT:
+            break
+
+        facts: MoveFacts | None = game.push(move)
+
+        start: float = time.perf_counter()
+        journal.record_push(facts)
+        journal.record_clocks(60.0, 60.0)
+        timings.append((time.perf_counter() - start) / 2)
+        event_count += 2
+
+        if rng.random() < 0.1:
+            journal.record_navigation(rng.randint(0, game.ply))
+            journal.record_navigation(game.ply)
+            event_count += 2
+
+    journal.close()
+    return timings
+
+
+def recovery_seconds(path_to_file: str) -> tuple[int, float, float]:
+    """Get record count and median seconds of reading and replaying journal."""
+    read_timings: list[float] = []
+    replay_timings: list[float] = []
+
+    for _ in range(RECOVERY_SAMPLES):
+        start: float = time.perf_counter()
+        records, _ = read_journal(path_to_file)
+        read_timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        GameCore().replay(records)
+        replay_timings.append(time.perf_counter() - start)
+
+    return (
+        len(records),
+        statistics.median(read_timings),
+        statistics.median(replay_timings),
+    )
+
+
+def main() -> None:
+    """Print per-event cost on calling thread and recovery latency."""
+    with tempfile.TemporaryDirectory() as directory:
+        path_to_file: str = os.path.join(directory, "game.journal")
+        timings: list[float] = write_journal(path_to_file)
+        record_count, read_seconds, replay_seconds = recovery_seconds(path_to_file)
+
+        print(
+            f"median record cost on caller {statistics.median(timings) * 1e6:>8.1f} us"
+        )
+        print(f"journal size {os.path.getsize(path_to_file) / 1024:>25.0f} KiB")
+        print(f"read {record_count} records {read_seconds * 1e3:>18.1f} ms")
+        print(f"replay {record_count} records {replay_seconds * 1e3:>16.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare serial and parallel review of a 60-move game at fixed depth.
+
+Run from StrikeChess's top-level directory, optionally with path to UCI
+engine (bundled Stockfish by default):
+
+    python -m benchmarks.game_review [path/to/engine]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from psutil import cpu_count
+from PySide6.QtCore import QCoreApplication, Qt
+
+from benchmarks.position_history import random_game
+from strikechess.core import EnginePool
+from strikechess.logic import (
+    PlyReview,
+    PositionHistory,
+    path_to_stockfish,
+    review_positions,
+)
+
+PLY_COUNT: int = 120
+REVIEW_DEPTH: int = 12
+
+
+def game_positions() -> list[tuple[int, str]]:
+    """Get ply and FEN of every position of random 60-move game."""
+    history: PositionHistory = PositionHistory()
+    board = history.root()
+
+    for move in random_game(PLY_COUNT):
+        san: str = board.san(move)
+        board.push(move)
+        history.append(move, san, board)
+
+    return review_positions(history)
+
+
+def review_seconds(
+    path_to_file: str, engine_count: int, positions: list[tuple[int, str]]
+) -> float:
+    """Get seconds that `engine_count` engines take to review `positions`."""
+    pool: EnginePool = EnginePool(path_to_file, engine_count)
+    reviews: list[PlyReview] = []
+    pool.position_reviewed.connect(
+        lambda _, review: reviews.append(review), Qt.ConnectionType.DirectConnection
+    )
+
+    start: float = time.perf_counter()
+    pool.review(positions, REVIEW_DEPTH)
+    pool.wait()
+    seconds: float = time.perf_counter() - start
+
+    assert len(reviews) == len(positions)
+    return seconds
+
+
+def main() -> None:
+    """Print review time and speedup for growing number of engines."""
+    QCoreApplication.instance() or QCoreApplication([])
+
+    path_to_file: str = sys.argv[1] if len(sys.argv) > 1 else path_to_stockfish()
+    positions: list[tuple[int, str]] = game_positions()
+    core_count: int = cpu_count(logical=False) or 1
+    engine_counts: list[int] = sorted({1, max(core_count // 2, 1), core_count})
+    serial_seconds: float = 0.0
+
+    for engine_count in engine_counts:
+        seconds: float = review_seconds(path_to_file, engine_count, positions)
+        serial_seconds = serial_seconds or seconds
+        print(
+            f"{engine_count:>2} engines {seconds:>8.2f} s "
+            f"speedup {serial_seconds / seconds:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Measure GUI-side overhead of engine analysis and moves with mock engine.
+
+Mock engine answers at once, so measured time is spent by engine worker,
+python-chess, Qt signals, and main window slots rather than by search.
+Main window runs in temporary copy of StrikeChess's data directory, so
+its journal, analysis cache, and settings are left untouched, and it
+starts with mock engine, so no Stockfish binary is needed. It is not
+shown on screen unless `QT_QPA_PLATFORM` selects another Qt platform.
+
+Run from StrikeChess's top-level directory on Linux or macOS:
+
+    python -m benchmarks.gui_overhead
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from strikechess.logic import AnalysisInfo, PositionSnapshot
+
+MOCK_ENGINE: str = os.path.abspath("benchmarks/mock_engine.py")
+INFO_LINES: int = 20_000
+ANALYSIS_LINE_RATE: int = 1000
+ENGINE_MOVES: int = 200
+PLIES_PER_GAME: int = 40
+ANALYSIS_CYCLES: int = 200
+POLL_INTERVAL: int = 1
+TIMEOUT: float = 60.0
+
+
+def create_data_directory() -> str:
+    """Get temporary directory with copy of settings, openings, and assets."""
+    directory: str = tempfile.mkdtemp(prefix="strikechess-benchmark-")
+    os.mkdir(os.path.join(directory, "strikechess"))
+
+    for file_name in ("settings.json", "openings.json"):
+        shutil.copy(
+            os.path.join("strikechess", file_name),
+            os.path.join(directory, "strikechess", file_name),
+        )
+
+    shutil.copytree(
+        os.path.join("strikechess", "assets"),
+        os.path.join(directory, "strikechess", "assets"),
+        ignore=shutil.ignore_patterns("engines"),
+    )
+    return directory
+
+
+def wait_until(condition: Callable[[], bool]) -> None:
+    """Process events until `condition` holds, or fail after timeout.
+
+    Waiting for events instead of spinning leaves GIL to engine threads,
+    which would otherwise be measured as slower than they are.
+    """
+    deadline: float = time.perf_counter() + TIMEOUT
+    poll_timer: QTimer = QTimer()
+    poll_timer.start(POLL_INTERVAL)
+
+    try:
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise TimeoutError("mock engine did not answer in time")
+
+            QApplication.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+    finally:
+        poll_timer.stop()
+
+
+def load_mock_engine(window, lines: int, rate: int) -> None:
+    """Load mock engine emitting `lines` info lines at `rate` per second."""
+    os.environ["MOCK_ENGINE_LINES"] = str(lines)
+    os.environ["MOCK_ENGINE_RATE"] = str(rate)
+    loaded: list[str] = []
+    window.engine.engine_loaded.connect(loaded.append)
+
+    window.start_new_engine(MOCK_ENGINE)
+    wait_until(lambda: loaded)
+
+    window.engine.engine_loaded.disconnect(loaded.append)
+
+
+def info_line_seconds(window) -> float:
+    """Get seconds from mock engine emitting info line to its display."""
+    depths: list[int] = [0]
+
+    def on_analysis_updated(
+        lines: tuple[AnalysisInfo, ...], snapshot: PositionSnapshot
+    ) -> None:
+        depths[0] = max(lines[0].depth, depths[0])
+
+    window.engine.analysis_updated.connect(on_analysis_updated)
+    cancellations: int = window.engine.metrics.cancellations
+
+    start: float = time.perf_counter()
+    window.start_analysis()
+    wait_until(lambda: depths[0] >= INFO_LINES)
+    seconds: float = time.perf_counter() - start
+
+    window.stop_analysis()
+    wait_until(lambda: window.engine.metrics.cancellations > cancellations)
+    window.engine.analysis_updated.disconnect(on_analysis_updated)
+    return seconds / INFO_LINES
+
+
+def engine_move_seconds(window) -> float:
+    """Get seconds from invoking engine to its move being shown."""
+    moves: list[object] = []
+    window.engine.move_played.connect(lambda *_: moves.append(None))
+    seconds: float = 0.0
+
+    while len(moves) < ENGINE_MOVES:
+        window.start_new_game()
+        wait_until(lambda: not window.should_invoke_engine())
+        moves_before_game: int = len(moves)
+
+        while len(moves) - moves_before_game < PLIES_PER_GAME:
+            target: int = len(moves) + 1
+            start: float = time.perf_counter()
+            window.invoke_engine(by_force=True)
+            wait_until(
+                lambda: len(moves) >= target and not window.should_invoke_engine()
+            )
+            seconds += time.perf_counter() - start
+
+    return seconds / len(moves)
+
+
+def analysis_cycle_seconds(window) -> float:
+    """Get seconds that starting and stopping analysis takes end to end."""
+    engine = window.engine
+    start: float = time.perf_counter()
+
+    for _ in range(ANALYSIS_CYCLES):
+        cancellations: int = engine.metrics.cancellations
+        window.start_analysis()
+        wait_until(lambda: engine.metrics.queue_depth == 0)
+        window.stop_analysis()
+        wait_until(lambda: engine.metrics.cancellations > cancellations)
+
+    return (time.perf_counter() - start) / ANALYSIS_CYCLES
+
+
+def main() -> None:
+    """Print GUI overhead per info line, engine move, and analysis cycle."""
+    top_level_directory: str = os.getcwd()
+    data_directory: str = create_data_directory()
+    os.chdir(data_directory)
+
+    try:
+        from strikechess.ui import MainWindow
+        from strikechess.utils import create_app, flush_settings, set_setting_value
+
+        set_setting_value("clock", "time", 7200.0)
+        set_setting_value("engine", "path", MOCK_ENGINE)
+        set_setting_value("engine", "is_white", False)
+        set_setting_value("engine", "is_ponder_on", False)
+        set_setting_value("engine", "is_standby_on", False)
+        set_setting_value("engine", "analysis_lines", 1)
+
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        create_app()
+        window: MainWindow = MainWindow()
+        window.show()
+
+        load_mock_engine(window, INFO_LINES, 0)
+        print(f"info line      {info_line_seconds(window) * 1e6:>8.2f} µs")
+
+        load_mock_engine(window, INFO_LINES, ANALYSIS_LINE_RATE)
+        print(f"engine move    {engine_move_seconds(window) * 1e3:>8.2f} ms")
+        print(f"analysis cycle {analysis_cycle_seconds(window) * 1e3:>8.2f} ms")
+
+        window.destruct()
+        flush_settings()
+    finally:
+        os.chdir(top_level_directory)
+        shutil.rmtree(data_directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+
+"""Deterministic fake UCI engine replaying info lines at fixed rate.
+
+Lines are either synthetic or replayed verbatim from recorded script of
+`info` lines, which should be recorded in position being analyzed for
+their principal variations to be legal. Synthetic lines cycle through
+legal moves and scores, so search never converges.
+
+Search started by `go infinite` or `go ponder` emits its lines and then
+waits for `stop` or `ponderhit`. Any other search emits fewer lines and
+then plays best move at once, whatever its limits are.
+
+Options are given on command line or, when engine is started by
+StrikeChess, through environment variables:
+
+    python benchmarks/mock_engine.py [--rate 0] [--lines 1000]
+        [--move-lines 10] [--script path/to/info/lines]
+
+    MOCK_ENGINE_RATE, MOCK_ENGINE_LINES, MOCK_ENGINE_MOVE_LINES,
+    MOCK_ENGINE_SCRIPT
+
+Rate is in lines per second, where 0 emits lines as fast as possible.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from itertools import cycle, islice
+
+from chess import Board, Move
+
+CHUNKS_PER_SECOND: int = 100
+MAX_CHUNK_SIZE: int = 1000
+
+
+class MockEngine:
+    """UCI engine whose search output depends only on position and options."""
+
+    def __init__(self, arguments: argparse.Namespace) -> None:
+        self._rate: float = arguments.rate
+        self._lines: int = arguments.lines
+        self._move_lines: int = arguments.move_lines
+        self._script: list[str] = []
+
+        if arguments.script:
+            with open(arguments.script, encoding="utf-8") as script_file:
+                self._script = [
+                    line.strip() for line in script_file if line.startswith("info")
+                ]
+
+        self._board: Board = Board()
+        self._multipv: int = 1
+        self._output_lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+        self._ponderhit: threading.Event = threading.Event()
+        self._search: threading.Thread | None = None
+
+    def _send(self, lines: list[str]) -> None:
+        """Write `lines` to standard output at once."""
+        with self._output_lock:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def _variations(self) -> list[list[Move]]:
+        """Get every legal move of position followed by one legal reply."""
+        variations: list[list[Move]] = []
+
+        for move in self._board.legal_moves:
+            self._board.push(move)
+            variations.append([move, *islice(self._board.legal_moves, 1)])
+            self._board.pop()
+
+        return variations
+
+    def _synthetic_lines(self, pvs: list[str]) -> Iterator[str]:
+        """Get endless info lines cycling through `pvs`, one depth per round."""
+        if not pvs:
+            while True:
+                yield "info depth 0 score mate 0"
+
+        for index in range(sys.maxsize):
+            depth: int = index // self._multipv + 1
+            yield (
+                f"info depth {depth} seldepth {depth} "
+                f"multipv {index % self._multipv + 1} "
+                f"score cp {(index * 37) % 201 - 100} nodes {index * 1000} "
+                f"nps 1000000 time {index} pv {pvs[index % len(pvs)]}"
+            )
+
+    def _emit(self, count: int, pvs: list[str]) -> int:
+        """Emit up to `count` info lines at configured rate until stopped."""
+        lines: Iterator[str] = (
+            cycle(self._script) if self._script else self._synthetic_lines(pvs)
+        )
+        chunk_size: int = (
+            MAX_CHUNK_SIZE
+            if self._rate <= 0
+            else max(min(int(self._rate / CHUNKS_PER_SECOND), MAX_CHUNK_SIZE), 1)
+        )
+        start_time: float = time.perf_counter()
+        emitted: int = 0
+
+        while emitted < count and not self._stopped.is_set():
+            chunk: list[str] = list(islice(lines, min(chunk_size, count - emitted)))
+            self._send(chunk)
+            emitted += len(chunk)
+
+            if self._rate > 0:
+                delay: float = start_time + emitted / self._rate - time.perf_counter()
+
+                if delay > 0:
+                    self._stopped.wait(delay)
+
+        return emitted
+
+    def _run_search(self, is_infinite: bool) -> None:
+        """Emit info lines, wait for stop if infinite, and play best move."""
+        variations: list[list[Move]] = self._variations()
+        pvs: list[str] = [
+            " ".join(move.uci() for move in variation) for variation in variations
+        ]
+        emitted: int = self._emit(self._lines if is_infinite else self._move_lines, pvs)
+
+        if is_infinite:
+            while not self._stopped.wait(0.01) and not self._ponderhit.is_set():
+                pass
+
+            if self._ponderhit.is_set() and not self._stopped.is_set():
+                emitted += self._emit(self._move_lines, pvs)
+
+        if not variations:
+            self._send(["bestmove (none)"])
+            return
+
+        best_line: int = max(emitted - 1, 0) // self._multipv * self._multipv
+        variation: list[Move] = variations[best_line % len(variations)]
+        self._send(["bestmove " + " ponder ".join(move.uci() for move in variation)])
+
+    def _set_position(self, parts: list[str]) -> None:
+        """Set up board from arguments of `position` command."""
+        moves_index: int = parts.index("moves") if "moves" in parts else len(parts)
+
+        if parts[1] == "startpos":
+            self._board = Board()
+        else:
+            self._board = Board(" ".join(parts[2:moves_index]))
+
+        for uci in parts[moves_index + 1 :]:
+            self._board.push_uci(uci)
+
+    def _stop_search(self) -> None:
+        """Stop running search and wait until it has played its move."""
+        self._stopped.set()
+
+        if self._search is not None:
+            self._search.join()
+            self._search = None
+
+    def run(self) -> None:
+        """Answer UCI commands from standard input until `quit`."""
+        for line in sys.stdin:
+            parts: list[str] = line.split()
+
+            if not parts:
+                continue
+
+            if parts[0] == "uci":
+                self._send(
+                    [
+                        "id name MockEngine",
+                        "id author StrikeChess",
+                        "option name Hash type spin default 16 min 1 max 33554432",
+                        "option name Threads type spin default 1 min 1 max 1024",
+                        "option name MultiPV type spin default 1 min 1 max 500",
+                        "option name Ponder type check default false",
+                        "uciok",
+                    ]
+                )
+            elif parts[0] == "isready":
+                self._send(["readyok"])
+            elif parts[:3] == ["setoption", "name", "MultiPV"]:
+                self._multipv = max(int(parts[-1]), 1)
+            elif parts[0] == "position":
+                self._set_position(parts)
+            elif parts[0] == "go":
+                self._stop_search()
+                self._stopped.clear()
+                self._ponderhit.clear()
+                self._search = threading.Thread(
+                    target=self._run_search,
+                    args=("infinite" in parts or "ponder" in parts,),
+                    daemon=True,
+                )
+                self._search.start()
+            elif parts[0] == "ponderhit":
+                self._ponderhit.set()
+            elif parts[0] == "stop":
+                self._stop_search()
+            elif parts[0] == "quit":
+                break
+
+        self._stop_search()
+
+
+def main() -> None:
+    """Parse options and serve UCI on standard input and output."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Deterministic fake UCI engine."
+    )
+    parser.add_argument(
+        "--rate", type=float, default=float(os.environ.get("MOCK_ENGINE_RATE", 0))
+    )
+    parser.add_argument(
+        "--lines", type=int, default=int(os.environ.get("MOCK_ENGINE_LINES", 1000))
+    )
+    parser.add_argument(
+        "--move-lines",
+        type=int,
+        default=int(os.environ.get("MOCK_ENGINE_MOVE_LINES", 10)),
+    )
+    parser.add_argument("--script", default=os.environ.get("MOCK_ENGINE_SCRIPT"))
+
+    MockEngine(parser.parse_args()).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Compare memory and navigation latency of position history storage.
+
+Run from StrikeChess's top-level directory:
+
+    python -m benchmarks.position_history
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import tracemalloc
+
+from chess import Board, Move
+
+from strikechess.logic import PositionHistory
+
+
+PLY_COUNTS: tuple[int, ...] = (500, 5_000)
+NAVIGATIONS: int = 1_000
+MEMORY_SAMPLES: int = 40
+
+
+def random_game(ply_count: int, seed: int = 2025) -> list[Move]:
+    """Get `ply_count` random legal moves that never end the game."""
+    rng: random.Random = random.Random(seed)
+    board: Board = Board()
+    moves: list[Move] = []
+
+    while len(moves) < ply_count:
+        legal_moves: list[Move] = list(board.legal_moves)
+        rng.shuffle(legal_moves)
+
+        for move in legal_moves:
+            board.push(move)
+
+            if any(board.generate_legal_moves()):
+                moves.append(move)
+                break
+
+            board.pop()
+
+    return moves
+
+
+def _traced_bytes(function) -> tuple[object, int]:
+    """Get result of `function` and bytes it left allocated."""
+    tracemalloc.start()
+    result: object = function()
+    traced_bytes: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, traced_bytes
+
+
+def copies_memory(moves: list[Move]) -> int:
+    """Estimate bytes of one full `Board.copy()` per ply from samples."""
+    board: Board = Board()
+    sample_plies: set[int] = {
+        len(moves) * sample // MEMORY_SAMPLES for sample in range(1, MEMORY_SAMPLES + 1)
+    }
+    samples: list[tuple[int, int]] = []
+
+    for ply, move in enumerate(moves, start=1):
+        board.push(move)
+
+        if ply in sample_plies:
+            samples.append((ply, _traced_bytes(board.copy)[1]))
+
+    total_bytes: int = 0
+    previous_ply: int = 0
+
+    for ply, sample_bytes in samples:
+        total_bytes += (ply - previous_ply) * sample_bytes
+        previous_ply = ply
+
+    return total_bytes
+
+
+def copies_navigation(moves: list[Move], targets: list[int]) -> float:
+    """Get median seconds of copying full board at each target ply."""
+    boards: dict[int, Board] = {}
+    board: Board = Board()
+    wanted_plies: set[int] = set(targets)
+
+    for ply, move in enumerate(moves, start=1):
+        board.push(move)
+
+        if ply in wanted_plies:
+            boards[ply] = board.copy()
+
+    timings: list[float] = []
+
+    for target in targets:
+        start: float = time.perf_counter()
+        boards[target].copy()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def build_history(moves: list[Move]) -> PositionHistory:
+    """Build position history the way `Game.push` does."""
+    board: Board = Board()
+    history: PositionHistory = PositionHistory(board)
+
+    for move in moves:
+        san: str = board.san(move)
+        board.push(move)
+        history.append(move, san, board)
+
+    return history
+
+
+def history_navigation(history: PositionHistory, targets: list[int]) -> float:
+    """Get median seconds of seeking to each target ply."""
+    board: Board = history.board_at(len(history))
+    board_ply: int = len(history)
+    timings: list[float] = []
+
+    for target in targets:
+        start: float = time.perf_counter()
+        board = history.seek(board, board_ply, target)
+        timings.append(time.perf_counter() - start)
+        board_ply = target
+
+    return statistics.median(timings)
+
+
+def navigation_targets(ply_count: int, seed: int = 7) -> list[int]:
+    """Get mix of random jumps and single wheel steps through history."""
+    rng: random.Random = random.Random(seed)
+    targets: list[int] = []
+    current: int = ply_count
+
+    for _ in range(NAVIGATIONS):
+        if rng.random() < 0.5:
+            current = rng.randint(1, ply_count)
+        else:
+            current = min(max(current + rng.choice((-1, 1)), 1), ply_count)
+        targets.append(current)
+
+    return targets
+
+
+def main() -> None:
+    """Print memory and navigation latency before and after."""
+    print(f"{'plies':>7}{'storage':>18}{'memory KiB':>14}{'median nav us':>16}")
+
+    for ply_count in PLY_COUNTS:
+        moves: list[Move] = random_game(ply_count)
+        targets: list[int] = navigation_targets(ply_count)
+
+        history, history_bytes = _traced_bytes(lambda: build_history(moves))
+
+        rows: tuple[tuple[str, int, float], ...] = (
+            (
+                "copies (before)",
+                copies_memory(moves),
+                copies_navigation(moves, targets),
+            ),
+            (
+                "keyframes (after)",
+                history_bytes,
+                history_navigation(history, targets),
+            ),
+        )
+
+        for storage, memory_bytes, navigation_seconds in rows:
+            print(
+                f"{ply_count:>7}{storage:>18}"
+                f"{memory_bytes / 1024:>14.0f}"
+                f"{navigation_seconds * 1e6:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measure startup, pickling, and process pool throughput of game core.
+
+Run from StrikeChess's top-level directory:
+
+    python -m benchmarks.process_pool
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from chess import Move
+
+from benchmarks.position_history import random_game
+from strikechess.logic import GameCore
+
+
+IMPORT_SAMPLES: int = 5
+PICKLE_SAMPLES: int = 20
+GAME_COUNT: int = 32
+GAME_PLIES: int = 300
+
+IMPORT_STATEMENT: str = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_seconds(module: str) -> float:
+    """Get median seconds of importing `module` in fresh interpreter."""
+    timings: list[float] = []
+
+    for _ in range(IMPORT_SAMPLES):
+        output: str = subprocess.run(
+            [sys.executable, "-c", IMPORT_STATEMENT.format(module=module)],
+            capture_output=True,
+            check=True,
+            env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+            text=True,
+        ).stdout
+        timings.append(float(output))
+
+    return statistics.median(timings)
+
+
+def play(moves: list[Move]) -> GameCore:
+    """Get game core after pushing `moves` from starting position."""
+    game: GameCore = GameCore()
+
+    for move in moves:
+        game.push(move)
+
+    return game
+
+
+def review(moves: list[Move]) -> tuple[str, int]:
+    """Replay `moves`, step back through them, and get result and check count."""
+    game: GameCore = play(moves)
+    checks: int = 0
+
+    for item_index in reversed(range(game.history.item_count)):
+        game.update_state(item_index)
+        checks += game.check is not None
+
+    return game.result, checks
+
+
+def main() -> None:
+    """Print import, pickling, and serial versus process pool timings."""
+    for module in ("strikechess.logic", "strikechess.core"):
+        print(f"import {module:<20}{import_seconds(module) * 1e3:>10.1f} ms")
+
+    game: GameCore = play(random_game(500))
+    payload: bytes = pickle.dumps(game)
+    timings: list[float] = []
+
+    for _ in range(PICKLE_SAMPLES):
+        start: float = time.perf_counter()
+        pickle.loads(pickle.dumps(game))
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"pickle 500 plies {len(payload) / 1024:>14.1f} KiB"
+        f"{statistics.median(timings) * 1e3:>10.2f} ms round trip"
+    )
+
+    games: list[list[Move]] = [
+        random_game(GAME_PLIES, seed=seed) for seed in range(GAME_COUNT)
+    ]
+
+    start = time.perf_counter()
+    serial_results: list[tuple[str, int]] = [review(moves) for moves in games]
+    serial_seconds: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor() as executor:
+        pool_results: list[tuple[str, int]] = list(executor.map(review, games))
+    pool_seconds: float = time.perf_counter() - start
+
+    assert pool_results == serial_results
+    print(f"review {GAME_COUNT} games serial {serial_seconds:>13.2f} s")
+    print(
+        f"review {GAME_COUNT} games pool {pool_seconds:>15.2f} s"
+        f" ({os.cpu_count()} CPUs)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Measure SAN conversion cost of MultiPV analysis updates.
+
+Replays an engine log in UCI format through plain `Board.variation_san`
+and through `SanCache`. The log is synthesized like output of a fast
+engine: iterative deepening with several lines, where consecutive PVs of
+one line share a long prefix and diverge near the tips.
+
+Run from StrikeChess's top-level directory:
+
+    python -m benchmarks.san_conversion
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from chess import Board, Move
+from chess.polyglot import zobrist_hash
+
+from benchmarks.position_history import random_game
+from strikechess.logic import SanCache
+
+POSITION_COUNT: int = 8
+MAX_DEPTH: int = 30
+LINE_COUNT: int = 3
+UPDATES_PER_DEPTH: int = 4
+NODES_PER_SECOND: int = 20_000_000
+
+
+def random_line(
+    board: Board, prefix: list[Move], length: int, rng: random.Random
+) -> list[Move]:
+    """Get legal line of up to `length` moves that starts with `prefix`."""
+    line_board: Board = board.copy(stack=False)
+    line: list[Move] = []
+
+    for move in prefix[:length]:
+        line_board.push(move)
+        line.append(move)
+
+    while len(line) < length:
+        legal_moves: list[Move] = list(line_board.legal_moves)
+
+        if not legal_moves:
+            break
+
+        move: Move = rng.choice(legal_moves)
+        line_board.push(move)
+        line.append(move)
+
+    return line
+
+
+def engine_log(board: Board, seed: int) -> list[str]:
+    """Get info lines that fast engine could print while analyzing `board`."""
+    rng: random.Random = random.Random(seed)
+    first_moves: list[Move] = list(board.legal_moves)[:LINE_COUNT]
+    pvs: list[list[Move]] = [[move] for move in first_moves]
+    info_lines: list[str] = []
+    nodes: int = 0
+
+    for depth in range(1, MAX_DEPTH + 1):
+        for _ in range(UPDATES_PER_DEPTH):
+            for multipv, pv in enumerate(pvs, start=1):
+                kept_length: int = max(1, len(pv) - rng.randint(1, 4))
+                pv[:] = random_line(board, pv[:kept_length], depth, rng)
+                nodes += NODES_PER_SECOND // 100
+                info_lines.append(
+                    f"info depth {depth} multipv {multipv} score cp "
+                    f"{rng.randint(-50, 50)} nodes {nodes} nps {NODES_PER_SECOND} "
+                    f"pv {' '.join(move.uci() for move in pv)}"
+                )
+
+    return info_lines
+
+
+def parsed_pvs(info_lines: list[str]) -> list[list[Move]]:
+    """Get PVs of `info_lines`."""
+    return [
+        [Move.from_uci(uci) for uci in line.split(" pv ", 1)[1].split()]
+        for line in info_lines
+    ]
+
+
+def replay_plain(board: Board, pvs: list[list[Move]]) -> tuple[int, float]:
+    """Get SAN conversions and seconds of converting every PV from scratch."""
+    start: float = time.perf_counter()
+
+    for pv in pvs:
+        board.variation_san(pv)
+
+    return sum(len(pv) for pv in pvs), time.perf_counter() - start
+
+
+def replay_cached(board: Board, pvs: list[list[Move]]) -> tuple[int, float]:
+    """Get SAN conversions and seconds of converting PVs through cache."""
+    san_cache: SanCache = SanCache()
+    key: int = zobrist_hash(board)
+    start: float = time.perf_counter()
+
+    for pv in pvs:
+        san_cache.variation_san(board, key, pv)
+
+    return san_cache.conversions, time.perf_counter() - start
+
+
+def main() -> None:
+    """Print update rate and SAN conversions per second of both replays."""
+    moves: list[Move] = random_game(POSITION_COUNT * 10)
+    boards: list[Board] = []
+    board: Board = Board()
+
+    for ply, move in enumerate(moves, start=1):
+        board.push(move)
+
+        if ply % 10 == 0:
+            boards.append(board.copy(stack=False))
+
+    logs: list[list[list[Move]]] = [
+        parsed_pvs(engine_log(board, seed)) for seed, board in enumerate(boards)
+    ]
+    update_count: int = sum(len(pvs) for pvs in logs)
+
+    for name, replay in (("plain", replay_plain), ("cached", replay_cached)):
+        conversions: int = 0
+        seconds: float = 0.0
+
+        for board, pvs in zip(boards, logs):
+            replay_conversions, replay_seconds = replay(board, pvs)
+            conversions += replay_conversions
+            seconds += replay_seconds
+
+        print(
+            f"{name:<6} {update_count / seconds:>9.0f} updates/s "
+            f"{conversions:>8} conversions {conversions / seconds:>9.0f} conversions/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare setting reads in the mouse-move path before and after caching.
+
+Run from StrikeChess's top-level directory:
+
+    python -m benchmarks.settings_reads
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from strikechess.utils import setting_value
+
+
+READS: int = 100_000
+
+
+def _file_setting_value(section: str, key: str) -> Any:
+    """Get value of `key` from `section` by parsing settings file."""
+    with open("strikechess/settings.json") as settings_file:
+        return json.load(settings_file)[section][key]
+
+
+def _can_drag(read: Callable[[str, str], Any]) -> bool:
+    """Mirror setting read done by `SvgBoard.can_drag` per mouse move."""
+    return read("engine", "is_white") is not True
+
+
+def _baseline_read(section: str, key: str) -> Any:
+    """Get constant value to measure loop overhead."""
+    return False
+
+
+def _peak_bytes(read: Callable[[str, str], Any], reads: int) -> int:
+    """Get peak traced memory in bytes above loop overhead for `reads` calls."""
+    peaks: list[int] = []
+
+    for function in (_baseline_read, read):
+        function("engine", "is_white")
+        tracemalloc.start()
+
+        for _ in range(reads):
+            _can_drag(function)
+
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return max(peaks[1] - peaks[0], 0)
+
+
+def main() -> None:
+    """Print per-read latency and allocations for both implementations."""
+    file_reads: int = READS // 100
+
+    file_seconds: float = timeit.timeit(
+        lambda: _can_drag(_file_setting_value), number=file_reads
+    )
+    memory_seconds: float = timeit.timeit(
+        lambda: _can_drag(setting_value), number=READS
+    )
+
+    print(f"{'implementation':<16}{'ns/read':>12}{'peak bytes':>14}")
+    print(
+        f"{'file (before)':<16}"
+        f"{file_seconds / file_reads * 1e9:>12.0f}"
+        f"{_peak_bytes(_file_setting_value, file_reads):>14}"
+    )
+    print(
+        f"{'memory (after)':<16}"
+        f"{memory_seconds / READS * 1e9:>12.0f}"
+        f"{_peak_bytes(setting_value, READS):>14}"
+    )
+
+
+if __name__ == "__main__":
+    main()
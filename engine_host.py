@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+
+"""Serve local UCI engine to StrikeChess over TCP or Unix socket.
+
+Each connection gets its own engine process, whose standard input and
+output are relayed to and from the socket. Engine process is terminated
+when its connection closes.
+
+Run from StrikeChess's top-level directory, optionally with path to UCI
+engine (bundled Stockfish by default):
+
+    python engine_host.py [--host 127.0.0.1] [--port 9999] [path/to/engine]
+    python engine_host.py --unix /tmp/strikechess-engine.sock [path/to/engine]
+
+Then load engine at address `tcp://127.0.0.1:9999` or
+`unix:///tmp/strikechess-engine.sock` in StrikeChess.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from asyncio.subprocess import PIPE, Process
+from typing import Final
+
+from strikechess.logic import path_to_stockfish
+
+
+DEFAULT_HOST: Final[str] = "127.0.0.1"
+DEFAULT_PORT: Final[int] = 9999
+QUIT_TIMEOUT: Final[float] = 2.0
+CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+async def _relay(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Copy bytes from `reader` to `writer` until end of stream."""
+    while data := await reader.read(CHUNK_SIZE):
+        writer.write(data)
+        await writer.drain()
+
+
+async def _terminate(process: Process) -> None:
+    """Ask engine `process` to quit and kill it if it does not."""
+    if process.returncode is not None:
+        return
+
+    try:
+        process.stdin.write(b"quit\n")
+        await asyncio.wait_for(process.wait(), QUIT_TIMEOUT)
+    except (ConnectionError, TimeoutError):
+        process.kill()
+        await process.wait()
+
+
+async def serve_connection(
+    path_to_file: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Relay UCI between connection and engine process of its own."""
+    try:
+        process: Process = await asyncio.create_subprocess_exec(
+            path_to_file, stdin=PIPE, stdout=PIPE
+        )
+    except OSError:
+        writer.close()
+        return
+
+    relays: set[asyncio.Task] = {
+        asyncio.create_task(_relay(reader, process.stdin)),
+        asyncio.create_task(_relay(process.stdout, writer)),
+    }
+
+    try:
+        await asyncio.wait(relays, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for relay in relays:
+            relay.cancel()
+
+        await _terminate(process)
+        writer.close()
+
+
+async def serve(arguments: argparse.Namespace) -> None:
+    """Accept connections on TCP port or Unix socket until interrupted."""
+
+    async def on_connected(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        await serve_connection(arguments.engine, reader, writer)
+
+    if arguments.unix:
+        server: asyncio.Server = await asyncio.start_unix_server(
+            on_connected, arguments.unix
+        )
+    else:
+        server = await asyncio.start_server(
+            on_connected, arguments.host, arguments.port
+        )
+
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    """Parse command-line arguments and serve engine until interrupted."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Serve UCI engine to StrikeChess over a socket."
+    )
+    parser.add_argument("engine", nargs="?", default=path_to_stockfish())
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="path to Unix socket instead of TCP port")
+
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,20 @@
-from .engine import Engine
+from .calibration import EngineProfile
+from .engine import Engine, PonderStatistics
+from .engine_pool import EnginePool
 from .game import Game
+from .remote import ConnectionMetrics, is_host_address
+from .speculator import Speculator
+from .supervisor import saved_engine_path
 
 
-__all__: list[str] = ["Engine", "Game"]
+__all__: list[str] = [
+    "ConnectionMetrics",
+    "Engine",
+    "EnginePool",
+    "EngineProfile",
+    "Game",
+    "PonderStatistics",
+    "Speculator",
+    "is_host_address",
+    "saved_engine_path",
+]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import threading
+from time import perf_counter
+from typing import Final, NamedTuple
+
+from chess import Board
+from chess.engine import InfoDict, Limit, SimpleEngine
+
+from strikechess.core.remote import open_engine, release_engine
+
+
+CALIBRATION_DEPTH: Final[int] = 16
+CALIBRATION_HASH: Final[int] = 64
+CALIBRATION_FENS: Final[tuple[str, ...]] = (
+    "r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+)
+FILE_MODE: Final[int] = 0o644
+
+
+class EngineProfile(NamedTuple):
+    """Fastest measured hash and threads of one engine binary on this host."""
+
+    threads: int
+    hash: int
+    nps: int
+    time_to_depth: float
+
+
+def binary_digest(path_to_file: str) -> str:
+    """Get SHA-256 digest of engine binary at `path_to_file`."""
+    with open(path_to_file, "rb") as binary_file:
+        return hashlib.file_digest(binary_file, "sha256").hexdigest()
+
+
+def measure_profile(path_to_file: str, threads: int, hash: int) -> EngineProfile:
+    """Get speed of engine searching calibration positions to fixed depth."""
+    engine: SimpleEngine = open_engine(path_to_file)
+
+    try:
+        engine.configure({"Hash": hash, "Threads": threads})
+        engine.ping()
+
+        nodes: int = 0
+        seconds: float = 0.0
+
+        for fen in CALIBRATION_FENS:
+            start_time: float = perf_counter()
+            info: InfoDict = engine.analyse(Board(fen), Limit(depth=CALIBRATION_DEPTH))
+            seconds += perf_counter() - start_time
+            nodes += info.get("nodes", 0)
+    finally:
+        release_engine(engine)
+
+    return EngineProfile(threads, hash, int(nodes / max(seconds, 1e-9)), seconds)
+
+
+def calibrate_engine(
+    path_to_file: str, cpu_count: int, hash_budget: int
+) -> EngineProfile:
+    """Get fastest profile of engine within `cpu_count` and `hash_budget`.
+
+    Threads are measured first at small hash, then hash sizes with the
+    fastest thread count, which needs far fewer runs than every pair.
+    """
+    thread_counts: list[int] = sorted({1, max(cpu_count // 2, 1), cpu_count})
+    hash_sizes: list[int] = sorted(
+        {min(size, hash_budget) for size in (CALIBRATION_HASH, 256, 1024)}
+    )
+
+    best_profile: EngineProfile = min(
+        (
+            measure_profile(path_to_file, threads, min(CALIBRATION_HASH, hash_budget))
+            for threads in thread_counts
+        ),
+        key=lambda profile: profile.time_to_depth,
+    )
+
+    for hash_size in hash_sizes:
+        if hash_size == best_profile.hash:
+            continue
+
+        profile: EngineProfile = measure_profile(
+            path_to_file, best_profile.threads, hash_size
+        )
+
+        if profile.time_to_depth < best_profile.time_to_depth:
+            best_profile = profile
+
+    return best_profile
+
+
+class EngineProfileStore:
+    """Calibrated engine profiles saved to disk keyed by binary digest."""
+
+    def __init__(self, path_to_file: str) -> None:
+        self._path_to_file: str = path_to_file
+        self._lock: threading.Lock = threading.Lock()
+        self._profiles: dict[str, EngineProfile] = self._read()
+
+    def _read(self) -> dict[str, EngineProfile]:
+        """Get all saved profiles, or none if profile file is unreadable."""
+        try:
+            with open(self._path_to_file) as profile_file:
+                return {
+                    digest: EngineProfile(**fields)
+                    for digest, fields in json.load(profile_file).items()
+                }
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def _file_mode(self) -> int:
+        """Get permission bits of profile file or default ones if it is missing."""
+        try:
+            return stat.S_IMODE(os.stat(self._path_to_file).st_mode)
+        except OSError:
+            return FILE_MODE
+
+    def get(self, digest: str) -> EngineProfile | None:
+        """Get saved profile of engine binary with `digest`."""
+        with self._lock:
+            return self._profiles.get(digest)
+
+    def save(self, digest: str, profile: EngineProfile) -> None:
+        """Save `profile` of engine binary with `digest` atomically to disk."""
+        with self._lock:
+            self._profiles[digest] = profile
+
+            directory: str = os.path.dirname(self._path_to_file) or "."
+            file_descriptor, temp_path = tempfile.mkstemp(
+                prefix=".engine-profiles-",
+                suffix=".tmp",
+                dir=directory,
+            )
+
+            try:
+                with os.fdopen(file_descriptor, "w", newline="\n") as temp_file:
+                    json.dump(
+                        {
+                            digest: profile._asdict()
+                            for digest, profile in self._profiles.items()
+                        },
+                        temp_file,
+                        indent=2,
+                    )
+                    temp_file.write("\n")
+                os.chmod(temp_path, self._file_mode())
+                os.replace(temp_path, self._path_to_file)
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
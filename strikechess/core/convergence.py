@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from chess import Board
+from chess.engine import InfoDict, Limit, SimpleEngine
+
+from strikechess.logic import ConvergenceDetector
+from strikechess.utils import setting_value
+
+
+def convergence_detector() -> ConvergenceDetector | None:
+    """Get detector with tolerances from settings, or None if early stop is off."""
+    if not setting_value("engine", "is_early_stop_on"):
+        return None
+
+    return ConvergenceDetector(
+        stable_depths=setting_value("engine", "convergence_depths"),
+        score_tolerance=setting_value("engine", "convergence_tolerance"),
+        min_depth=setting_value("engine", "convergence_min_depth"),
+    )
+
+
+def analyse_until_converged(
+    engine: SimpleEngine, board: Board, limit: Limit
+) -> InfoDict:
+    """Analyse `board` within `limit`, stopping early once search converges."""
+    detector: ConvergenceDetector | None = convergence_detector()
+
+    with engine.analysis(board, limit) as analysis:
+        for info in analysis:
+            if detector is not None and detector.update(info):
+                analysis.stop()
+
+    return analysis.info
@@ -1,96 +1,870 @@
 from __future__ import annotations
 
-from typing import ClassVar
+import heapq
+import threading
+from functools import partial
+from itertools import count
+from time import perf_counter
+from typing import ClassVar, Final, NamedTuple
 
-from chess import Move
-from chess.engine import Limit, PlayResult, Score, SimpleEngine
-from PySide6.QtCore import QObject, Signal
+from chess import Board, Move
+from chess.engine import (
+    EngineError,
+    EngineTerminatedError,
+    Info,
+    Limit,
+    PlayResult,
+    SimpleAnalysisResult,
+    SimpleEngine,
+)
+from PySide6.QtCore import QObject, QTimer, Signal
 
+from strikechess.core.calibration import (
+    EngineProfile,
+    EngineProfileStore,
+    calibrate_engine,
+)
+from strikechess.core.convergence import convergence_detector
+from strikechess.core.remote import (
+    ConnectionMetrics,
+    HeartbeatProtocol,
+    close_host_connections,
+    connection_metrics,
+    release_engine,
+)
+from strikechess.core.supervisor import (
+    HEARTBEAT_INTERVAL,
+    EngineProcess,
+    EngineSupervisor,
+    is_hung,
+    is_responsive,
+    kill_engine,
+    saved_engine_path,
+    search_deadline,
+    send_heartbeat,
+)
+from strikechess.logic import (
+    AnalysisCache,
+    AnalysisInfo,
+    AnalysisStream,
+    ConvergenceDetector,
+    OpeningBook,
+    PositionSnapshot,
+)
 from strikechess.utils import (
-    delete_quarantine_attribute,
-    engine_configuration,
-    make_executable,
-    path_to_stockfish,
+    EngineAllocation,
+    EngineRole,
+    resource_governor,
     setting_value,
 )
 
 
+QUIT_PRIORITY: Final[int] = 0
+PLAY_PRIORITY: Final[int] = 1
+ANALYSIS_PRIORITY: Final[int] = 2
+
+
+class EngineCommand(NamedTuple):
+    """Queued engine job ordered by priority and then by submission."""
+
+    priority: int
+    sequence: int
+    snapshot: PositionSnapshot | None = None
+    limit: Limit | None = None
+
+
+class EngineMetrics(NamedTuple):
+    """Queue depth, latency of cancelling jobs, and crash recoveries."""
+
+    queue_depth: int
+    cancellations: int
+    last_cancellation_latency: float
+    max_cancellation_latency: float
+    recoveries: int
+    last_recovery_time: float
+
+
+class PonderPrediction(NamedTuple):
+    """Predicted reply position that engine searches on opponent's time."""
+
+    board: Board
+    fen: str
+    started_at: float
+
+
+class PonderStatistics(NamedTuple):
+    """Predicted replies, ponder hits, and search time saved by hits."""
+
+    predictions: int
+    hits: int
+    saved_time: float
+
+    @property
+    def hit_rate(self) -> float:
+        """Get share of predicted replies that opponent actually played."""
+        return self.hits / self.predictions if self.predictions else 0.0
+
+
 class Engine(QObject):
-    """Communication with UCI-compliant engine."""
+    """Communication with UCI-compliant engine through dedicated worker thread."""
 
-    best_move_analyzed: ClassVar[Signal] = Signal(Move)
+    analysis_converged: ClassVar[Signal] = Signal(PositionSnapshot)
+    analysis_updated: ClassVar[Signal] = Signal(tuple, PositionSnapshot)
+    calibration_finished: ClassVar[Signal] = Signal(object)
+    engine_loaded: ClassVar[Signal] = Signal(str)
     load_failed: ClassVar[Signal] = Signal(str)
-    move_played: ClassVar[Signal] = Signal(Move)
-    score_analyzed: ClassVar[Signal] = Signal(Score)
-    variation_analyzed: ClassVar[Signal] = Signal(str)
+    move_played: ClassVar[Signal] = Signal(Move, PositionSnapshot, float)
 
-    def __init__(self, game: Game) -> None:
+    def __init__(self, analysis_cache: AnalysisCache | None = None) -> None:
         super().__init__()
 
-        self._game: Game = game
-        self._analyzing: bool = False
+        self._analysis_cache: AnalysisCache | None = analysis_cache
+        self._condition: threading.Condition = threading.Condition()
+        self._pending: list[EngineCommand] = []
+        self._sequence: count = count()
+
+        self._running: EngineCommand | None = None
+        self._analysis: SimpleAnalysisResult | None = None
+        self._cancel_requested_at: float | None = None
+        self._is_search_started: bool = False
+        self._search_deadline: float | None = None
+
+        self._cancellations: int = 0
+        self._last_cancellation_latency: float = 0.0
+        self._max_cancellation_latency: float = 0.0
+
+        self._supervisor: EngineSupervisor = EngineSupervisor()
+        self._replacement: EngineProcess | None = None
+        self._loads_in_progress: int = 0
+        self._is_quitting: bool = False
+        self._recoveries: int = 0
+        self._last_recovery_time: float = 0.0
 
-        self.load_from_file_at(path_to_stockfish())
+        self._prediction: PonderPrediction | None = None
+        self._ponder_generation: int = 0
+        self._predictions: int = 0
+        self._ponder_hits: int = 0
+        self._ponder_saved_time: float = 0.0
+
+        self._governor_key: int | None = None
+        self._allocation: EngineAllocation | None = None
+
+        self._profiles: EngineProfileStore = EngineProfileStore(
+            "strikechess/engine_profiles.json"
+        )
+        self._profile: EngineProfile | None = None
+        self._path_to_file: str | None = None
+        self._digest: str | None = None
+        self._book: OpeningBook | None = None
+
+        self._stream: AnalysisStream = AnalysisStream()
+        self._frame_timer: QTimer = QTimer(self)
+        self._frame_timer.setInterval(
+            round(1000 / setting_value("engine", "analysis_rate"))
+        )
+        self._frame_timer.timeout.connect(self._deliver_analysis)
+
+        self._worker: threading.Thread = threading.Thread(
+            target=self._run_commands,
+            name="EngineWorker",
+            daemon=True,
+        )
+        self._worker.start()
+
+        self._watchdog_stopped: threading.Event = threading.Event()
+        self._watchdog: threading.Thread = threading.Thread(
+            target=self._watch_searches,
+            name="EngineWatchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+        self.load_book(setting_value("book", "path"))
+        path_to_file: str | None = saved_engine_path()
+
+        if path_to_file is not None:
+            self.load_from_file_at(path_to_file)
 
     @property
     def name(self) -> str:
         """Get engine name if engine is loaded."""
-        if hasattr(self, "_engine"):
-            name: str = self._engine.id["name"]
+        engine: SimpleEngine | None = getattr(self, "_engine", None)
+
+        if engine is not None:
+            name: str = engine.id["name"]
             return f"{name[0:15]}..." if len(name) > 15 else name
         return "(no engine loaded)"
 
+    @property
+    def path_to_file(self) -> str | None:
+        """Get path to file or address of host of loaded engine."""
+        with self._condition:
+            return self._path_to_file
+
+    @property
+    def digest(self) -> str | None:
+        """Get digest of binary or address of host of loaded engine."""
+        with self._condition:
+            return self._digest
+
+    @property
+    def metrics(self) -> EngineMetrics:
+        """Get current queue depth and cancellation latency statistics."""
+        with self._condition:
+            return EngineMetrics(
+                queue_depth=len(self._pending),
+                cancellations=self._cancellations,
+                last_cancellation_latency=self._last_cancellation_latency,
+                max_cancellation_latency=self._max_cancellation_latency,
+                recoveries=self._recoveries,
+                last_recovery_time=self._last_recovery_time,
+            )
+
+    @property
+    def connection_metrics(self) -> ConnectionMetrics | None:
+        """Get latency of connection to engine host if engine runs on one."""
+        engine: SimpleEngine | None = getattr(self, "_engine", None)
+        return connection_metrics(engine) if engine is not None else None
+
+    @property
+    def ponder_statistics(self) -> PonderStatistics:
+        """Get ponder hits and saved time since statistics were last reset."""
+        with self._condition:
+            return PonderStatistics(
+                predictions=self._predictions,
+                hits=self._ponder_hits,
+                saved_time=self._ponder_saved_time,
+            )
+
+    def reset_ponder_statistics(self) -> None:
+        """Start counting ponder hits and saved time from zero."""
+        with self._condition:
+            self._predictions = 0
+            self._ponder_hits = 0
+            self._ponder_saved_time = 0.0
+
     def load_from_file_at(self, path_to_file: str) -> None:
-        """Load engine from file at `path_to_file`."""
-        try:
-            delete_quarantine_attribute(path_to_file)
-            make_executable(path_to_file)
+        """Load engine from file at `path_to_file` in background.
+
+        Current engine keeps serving until new one is ready, and worker
+        then swaps it in between commands.
+        """
+        with self._condition:
+            self._loads_in_progress += 1
 
-            new_engine: SimpleEngine = SimpleEngine.popen_uci(path_to_file)
-            new_engine.configure(engine_configuration())
+        threading.Thread(
+            target=self._load,
+            args=(path_to_file,),
+            name="EngineLoader",
+            daemon=True,
+        ).start()
 
-            self.quit()
-            self._engine: SimpleEngine = new_engine
+    def _load(self, path_to_file: str) -> None:
+        """Start engine from file at `path_to_file` and hand it to worker."""
+        process: EngineProcess | None = None
 
+        try:
+            process = self._supervisor.launch(path_to_file)
         except Exception as exception:
             self.load_failed.emit(f"UCI engine failed to load.\n\n{exception}")
 
-    def play_move(self) -> None:
-        """Invoke engine to play move."""
+        with self._condition:
+            self._loads_in_progress -= 1
+            unused: EngineProcess | None = process
+
+            if process is not None and not self._is_quitting:
+                unused, self._replacement = self._replacement, process
+
+                if self._running is not None and self._running.limit is None:
+                    self._submit(self._running._replace(sequence=next(self._sequence)))
+                    self._stop_running()
+
+            self._condition.notify()
+
+        if unused is not None:
+            unused.engine.quit()
+
+    def load_book(self, path_to_file: str) -> bool:
+        """Open Polyglot book at `path_to_file` and return True if it opened.
+
+        Empty path closes current book, and book that fails to open leaves
+        current one in place.
+        """
+        book: OpeningBook | None = None
+
+        if path_to_file:
+            try:
+                book = OpeningBook(path_to_file)
+            except (OSError, ValueError):
+                return False
+
+        if self._book is not None:
+            self._book.close()
+
+        self._book = book
+        return True
+
+    def _book_move(self, snapshot: PositionSnapshot) -> Move | None:
+        """Get book move in position of `snapshot` if it is within book depth."""
+        if self._book is None or snapshot.ply >= setting_value("book", "depth"):
+            return None
+        return self._book.choose(snapshot.board(), setting_value("book", "variety"))
+
+    def calibrate(self) -> None:
+        """Measure loaded engine in background and save its fastest profile.
+
+        Profile is saved under digest of engine binary, so later loads of
+        same binary apply it without calibrating again.
+        """
+        with self._condition:
+            path_to_file: str | None = self._path_to_file
+            digest: str | None = self._digest
+
+        if path_to_file is None:
+            self.calibration_finished.emit(None)
+            return
+
+        threading.Thread(
+            target=self._calibrate,
+            args=(path_to_file, digest),
+            name="EngineCalibration",
+            daemon=True,
+        ).start()
+
+    def _calibrate(self, path_to_file: str, digest: str) -> None:
+        """Calibrate engine at `path_to_file` and save profile under `digest`.
+
+        Profile that cannot be written to disk is still kept until quit.
+        """
+        try:
+            profile: EngineProfile = calibrate_engine(
+                path_to_file,
+                resource_governor().cpu_count,
+                resource_governor().hash_budget,
+            )
+        except (EngineError, OSError):
+            self.calibration_finished.emit(None)
+            return
+
+        try:
+            self._profiles.save(digest, profile)
+        except OSError:
+            pass
+
+        with self._condition:
+            if digest == self._digest:
+                self._profile = profile
+
+        self.calibration_finished.emit(profile)
+
+    def _submit(self, command: EngineCommand) -> None:
+        """Queue `command` and wake up worker thread."""
+        heapq.heappush(self._pending, command)
+        self._condition.notify()
+
+    def _drop_pending(self, priority: int | None = None) -> None:
+        """Drop queued commands of `priority`, or all of them if it is None."""
+        self._pending = [
+            command
+            for command in self._pending
+            if priority is not None and command.priority != priority
+        ]
+        heapq.heapify(self._pending)
+
+    def _stop_running(self) -> None:
+        """Send UCI stop to running command right away."""
+        if self._running is None or self._cancel_requested_at is not None:
+            return
+
+        self._cancel_requested_at = perf_counter()
+
+        if self._analysis is not None:
+            self._analysis.stop()
+        elif self._running.limit is not None and self._is_search_started:
+            self._send_stop()
+
+    def _on_search_started(self, protocol: HeartbeatProtocol) -> None:
+        """Note that `protocol` sent `go`, stopping play cancelled before it.
+
+        Called on event loop of engine, so `stop` is sent right after `go`.
+        """
+        with self._condition:
+            self._is_search_started = True
+
+            if (
+                self._cancel_requested_at is not None
+                and self._running is not None
+                and self._running.limit is not None
+            ):
+                protocol.send_line("stop")
+
+    def _send_stop(self) -> None:
+        """Send UCI stop to engine from any thread."""
+        if hasattr(self, "_engine"):
+            protocol = self._engine.protocol
+            protocol.loop.call_soon_threadsafe(protocol.send_line, "stop")
+
+    def _stop_pondering(self) -> None:
+        """Stop search of predicted reply and discard prediction."""
+        self._ponder_generation += 1
+
+        if self._prediction is not None:
+            self._prediction = None
+            self._send_stop()
+
+    def _close_stream(self) -> None:
+        """Stop delivering analysis and drop undelivered updates."""
+        self._frame_timer.stop()
+        self._stream.reset()
+
+    def _deliver_analysis(self) -> None:
+        """Emit latest analysis lines if they have changed since last frame."""
+        update: tuple[tuple[AnalysisInfo, ...], PositionSnapshot] | None = (
+            self._stream.take()
+        )
+
+        if update is not None:
+            self.analysis_updated.emit(*update)
+
+    def play_move(self, snapshot: PositionSnapshot, limit: Limit) -> None:
+        """Queue engine move in position of `snapshot` ahead of any analysis.
+
+        If engine is already searching for its move in same position, it
+        is told to stop and play best move found so far instead. Book move
+        is played without engine, once control returns to event loop.
+        """
+        start_time: float = perf_counter()
+        book_move: Move | None = self._book_move(snapshot)
+
+        if book_move is not None:
+            self.cancel_all()
+            QTimer.singleShot(
+                0,
+                partial(
+                    self.move_played.emit,
+                    book_move,
+                    snapshot,
+                    perf_counter() - start_time,
+                ),
+            )
+            return
+
+        self._close_stream()
+
+        with self._condition:
+            self._drop_pending()
+
+            if self._running is not None:
+                is_same_search: bool = (
+                    self._running.priority == PLAY_PRIORITY
+                    and self._running.snapshot.is_same_position(snapshot)
+                )
+                self._stop_running()
+
+                if is_same_search:
+                    return
+
+            self._submit(
+                EngineCommand(PLAY_PRIORITY, next(self._sequence), snapshot, limit)
+            )
+
+    def start_analysis(self, snapshot: PositionSnapshot) -> None:
+        """Queue analysis of position of `snapshot`, replacing stale analysis.
+
+        Cached lines of position are shown at once and stay shown until
+        search gets deeper than them.
+        """
+        cached: tuple[AnalysisInfo, ...] = self._cached_lines(snapshot)
+        self._stream.reset(snapshot, cached)
+        self._frame_timer.start()
+
+        if cached:
+            self.analysis_updated.emit(cached, snapshot)
+
+        with self._condition:
+            self._drop_pending(ANALYSIS_PRIORITY)
+
+            if self._running is not None and self._running.limit is None:
+                self._stop_running()
+
+            self._submit(
+                EngineCommand(ANALYSIS_PRIORITY, next(self._sequence), snapshot)
+            )
+
+    def _cached_lines(self, snapshot: PositionSnapshot) -> tuple[AnalysisInfo, ...]:
+        """Get cached analysis lines of `snapshot` within analysis line count."""
+        if self._analysis_cache is None or self._digest is None:
+            return ()
+
+        analysis_lines: int = setting_value("engine", "analysis_lines")
+        return tuple(
+            line
+            for line in self._analysis_cache.get(self._digest, snapshot.key)
+            if line.multipv <= analysis_lines
+        )
+
+    def stop_analysis(self) -> None:
+        """Stop analyzing current position and drop queued analysis."""
+        self._close_stream()
+
+        with self._condition:
+            self._drop_pending(ANALYSIS_PRIORITY)
+
+            if self._running is not None and self._running.limit is None:
+                self._stop_running()
+
+    def stop_pondering(self) -> None:
+        """Stop searching predicted reply, for example after game is over."""
+        with self._condition:
+            self._stop_pondering()
+
+    def cancel_all(self) -> None:
+        """Drop queued commands and stop running one and pondering."""
+        self._close_stream()
+
+        with self._condition:
+            self._drop_pending()
+            self._stop_running()
+            self._stop_pondering()
+
+    def _has_work(self) -> bool:
+        """Return True if worker has engine to swap in or command to run.
+
+        Commands wait while first engine is still loading, so they are not
+        dropped for lack of engine.
+        """
+        if self._replacement is not None:
+            return True
+
+        if not self._pending:
+            return False
+
+        return (
+            hasattr(self, "_engine")
+            or not self._loads_in_progress
+            or self._pending[0].priority == QUIT_PRIORITY
+        )
+
+    def _run_commands(self) -> None:
+        """Run queued commands one at a time until asked to quit.
+
+        While idle, worker sends heartbeat to engine and replaces engine
+        that has crashed or stopped responding. Searching engine is
+        watched by watchdog thread instead.
+        """
+        while True:
+            command: EngineCommand | None = None
+
+            with self._condition:
+                has_work: bool = self._condition.wait_for(
+                    self._has_work, HEARTBEAT_INTERVAL
+                )
+                replacement: EngineProcess | None = self._replacement
+                self._replacement = None
+
+                if has_work and replacement is None:
+                    command = heapq.heappop(self._pending)
+
+                    if command.priority == QUIT_PRIORITY:
+                        return
+
+                    if command.limit is None:
+                        self._prediction = None
+
+                    self._running = command
+
+                is_pondering: bool = self._prediction is not None
+
+            if replacement is not None:
+                self._install(replacement)
+                continue
+
+            if command is None:
+                if (
+                    hasattr(self, "_engine")
+                    and not is_pondering
+                    and not is_responsive(self._engine)
+                ):
+                    self._recover()
+                continue
+
+            try:
+                self._execute(command)
+            except (EngineTerminatedError, TimeoutError):
+                if self._recover() and self._cancel_requested_at is None:
+                    try:
+                        self._execute(command)
+                    except (AttributeError, EngineError, TimeoutError):
+                        pass
+            except (AttributeError, EngineError):
+                pass
+
+            with self._condition:
+                if self._cancel_requested_at is not None:
+                    latency: float = perf_counter() - self._cancel_requested_at
+                    self._cancellations += 1
+                    self._last_cancellation_latency = latency
+                    self._max_cancellation_latency = max(
+                        latency, self._max_cancellation_latency
+                    )
+
+                self._running = None
+                self._analysis = None
+                self._cancel_requested_at = None
+                self._search_deadline = None
+
+    def _watch_searches(self) -> None:
+        """Kill searching engine that hangs, so worker recovers it.
+
+        Searching engine gets heartbeat every interval. Engine that leaves
+        it unanswered, or whose search runs past its deadline, is killed,
+        which makes running command fail and worker replace engine.
+        """
+        while not self._watchdog_stopped.wait(HEARTBEAT_INTERVAL):
+            with self._condition:
+                engine: SimpleEngine | None = getattr(self, "_engine", None)
+                is_searching: bool = (
+                    self._running is not None or self._prediction is not None
+                )
+                deadline: float | None = self._search_deadline
+
+            if engine is None or not is_searching:
+                continue
+
+            if is_hung(engine, deadline):
+                with self._condition:
+                    self._prediction = None
+
+                kill_engine(engine)
+            else:
+                send_heartbeat(engine)
+
+    def _execute(self, command: EngineCommand) -> None:
+        """Run play or analysis `command` on current engine."""
+        self._apply_allocation()
+
+        if command.limit is None:
+            self._analyze(command.snapshot)
+        else:
+            self._play(command.snapshot, command.limit)
+
+    def _install(self, process: EngineProcess, is_forced: bool = False) -> bool:
+        """Replace current engine with started `process` and return True if done.
+
+        Current engine is killed when `is_forced` is True, for example
+        after it crashed or stopped responding.
+        """
+        self._terminate_engine(is_forced)
+
+        key: int = resource_governor().register(
+            process.engine.transport.get_pid(), EngineRole.Foreground
+        )
+        profile: EngineProfile | None = self._profiles.get(process.digest)
+        allocation: EngineAllocation = (
+            resource_governor().allocation(key).limited_to(profile)
+        )
+        start_time: float = perf_counter()
+
+        try:
+            process.engine.configure(allocation.configuration())
+            process.engine.ping()
+        except EngineError as exception:
+            resource_governor().unregister(key)
+            process.engine.close()
+            self.load_failed.emit(f"UCI engine failed to load.\n\n{exception}")
+            return False
+
+        resource_governor().record_startup(
+            allocation, process.startup_time + perf_counter() - start_time
+        )
+
+        with self._condition:
+            self._prediction = None
+            self._governor_key = key
+            self._allocation = allocation
+            self._profile = profile
+            self._path_to_file = process.path_to_file
+            self._digest = process.digest
+            self._engine: SimpleEngine = process.engine
+            self._engine.protocol.on_search_started = partial(
+                self._on_search_started, self._engine.protocol
+            )
+
+        self.engine_loaded.emit(self.name)
+        return True
+
+    def _recover(self) -> bool:
+        """Replace crashed or hung engine and return True if it succeeded."""
+        start_time: float = perf_counter()
+
+        try:
+            process: EngineProcess = self._supervisor.launch(
+                self._path_to_file, self._digest
+            )
+        except Exception as exception:
+            self._terminate_engine(is_forced=True)
+            self.load_failed.emit(f"UCI engine failed to restart.\n\n{exception}")
+            return False
+
+        if not self._install(process, is_forced=True):
+            return False
+
+        with self._condition:
+            self._recoveries += 1
+            self._last_recovery_time = perf_counter() - start_time
+
+        return True
+
+    def _apply_allocation(self) -> None:
+        """Reconfigure engine if governor has rebalanced its hash or threads."""
+        allocation: EngineAllocation = (
+            resource_governor().allocation(self._governor_key).limited_to(self._profile)
+        )
+
+        if allocation.configuration() != self._allocation.configuration():
+            with self._condition:
+                self._prediction = None
+
+            self._engine.configure(allocation.configuration())
+
+        self._allocation = allocation
+
+    def _play(self, snapshot: PositionSnapshot, limit: Limit) -> None:
+        """Play move in position of `snapshot` within `limit`.
+
+        If opponent played predicted reply, engine is given exact board it
+        has been pondering on, so python-chess sends ponderhit and engine
+        continues its search instead of starting a new one.
+        """
+        board: Board = snapshot.board()
+        is_ponder_on: bool = setting_value("engine", "is_ponder_on")
+
+        with self._condition:
+            if self._cancel_requested_at is not None:
+                return
+
+            prediction: PonderPrediction | None = self._prediction
+            self._prediction = None
+            ponder_generation: int = self._ponder_generation
+            self._search_deadline = search_deadline(limit, board.turn)
+            self._is_search_started = False
+
+            if prediction is not None and prediction.fen == snapshot.fen:
+                board = prediction.board
+                self._is_search_started = True
+                self._ponder_hits += 1
+                self._ponder_saved_time += perf_counter() - prediction.started_at
+
+        start_time: float = perf_counter()
+
         play_result: PlayResult = self._engine.play(
-            limit=Limit(depth=20),
-            board=self._game.board,
-            ponder=setting_value("engine", "is_ponder_on"),
+            limit=limit,
+            board=board,
+            ponder=is_ponder_on,
+            info=Info.BASIC | Info.SCORE | Info.PV,
         )
-        self.move_played.emit(play_result.move)
 
-    def start_analysis(self) -> None:
-        """Start analyzing current position."""
-        self._analyzing = True
+        if self._analysis_cache is not None and play_result.info.get("pv"):
+            self._analysis_cache.store(
+                self._digest, snapshot.key, [AnalysisInfo().merged(play_result.info)]
+            )
+
+        if is_ponder_on and play_result.move and play_result.ponder:
+            self._predict(board, play_result, ponder_generation)
+
+        self.move_played.emit(play_result.move, snapshot, perf_counter() - start_time)
+
+    def _predict(
+        self, board: Board, play_result: PlayResult, ponder_generation: int
+    ) -> None:
+        """Remember reply that engine ponders on after `play_result` move."""
+        predicted_board: Board = board.copy()
+        predicted_board.push(play_result.move)
+        predicted_board.push(play_result.ponder)
+
+        with self._condition:
+            if ponder_generation != self._ponder_generation:
+                self._send_stop()
+                return
+
+            self._prediction = PonderPrediction(
+                predicted_board, predicted_board.fen(), perf_counter()
+            )
+            self._predictions += 1
+
+    def _analyze(self, snapshot: PositionSnapshot) -> None:
+        """Analyze position of `snapshot` until stopped or converged."""
+        board: Board = snapshot.board()
+        lines: dict[int, AnalysisInfo] = {}
+        detector: ConvergenceDetector | None = convergence_detector()
+        is_converged: bool = False
+
+        with self._engine.analysis(
+            board, multipv=setting_value("engine", "analysis_lines")
+        ) as analysis:
+            with self._condition:
+                self._analysis = analysis
+
+                if self._cancel_requested_at is not None:
+                    analysis.stop()
 
-        with self._engine.analysis(self._game.board) as analysis:
             for info in analysis:
-                if not self._analyzing:
-                    break
+                self._stream.merge(snapshot, info)
+                multipv: int = info.get("multipv", 1)
+                lines[multipv] = lines.get(multipv, AnalysisInfo(multipv)).merged(info)
 
-                if "pv" in info:
-                    pv: list[Move] = info["pv"]
+                if not is_converged and detector is not None and detector.update(info):
+                    is_converged = True
+                    analysis.stop()
 
-                    best_move: Move = pv[0]
-                    score: Score = info["score"].white()
-                    variation: str = self._game.board.variation_san(pv)
+        if self._analysis_cache is not None:
+            self._analysis_cache.store(self._digest, snapshot.key, lines.values())
 
-                    self.best_move_analyzed.emit(best_move)
-                    self.score_analyzed.emit(score)
-                    self.variation_analyzed.emit(variation)
+        if is_converged and self._cancel_requested_at is None:
+            self.analysis_converged.emit(snapshot)
 
-    def stop_analysis(self) -> None:
-        """Stop analyzing current position."""
-        self._analyzing = False
+    def _terminate_engine(self, is_forced: bool = False) -> None:
+        """Terminate engine process if engine is loaded, killing it if forced."""
+        with self._condition:
+            if not hasattr(self, "_engine"):
+                return
+
+            engine: SimpleEngine = self._engine
+            engine.protocol.on_search_started = None
+            del self._engine
+
+        try:
+            if is_forced:
+                engine.close()
+            else:
+                release_engine(engine)
+        except (EngineError, TimeoutError):
+            engine.close()
+
+        resource_governor().unregister(self._governor_key)
 
     def quit(self) -> None:
-        """Stop analysis and terminate engine."""
-        self.stop_analysis()
+        """Stop all engine work, worker thread, and engine process."""
+        self._close_stream()
 
-        if hasattr(self, "_engine"):
-            self._engine.quit()
+        with self._condition:
+            self._is_quitting = True
+            self._drop_pending()
+            self._stop_running()
+            self._submit(EngineCommand(QUIT_PRIORITY, next(self._sequence)))
+
+        self._worker.join()
+        self._watchdog_stopped.set()
+        self._watchdog.join()
+
+        if self._replacement is not None:
+            self._replacement.engine.quit()
+            self._replacement = None
+
+        self._supervisor.close()
+        self._terminate_engine()
+        close_host_connections()
+
+        if self._book is not None:
+            self._book.close()
+            self._book = None
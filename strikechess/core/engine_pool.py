@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import ClassVar, Final
+
+from chess import Board, Move
+from chess.engine import Cp, EngineError, InfoDict, Limit, Score, SimpleEngine
+from chess.polyglot import zobrist_hash
+from psutil import cpu_count
+from PySide6.QtCore import QObject, Signal
+
+from strikechess.core.convergence import analyse_until_converged
+from strikechess.core.remote import open_engine, release_engine
+from strikechess.core.supervisor import engine_digest
+from strikechess.logic import (
+    AnalysisCache,
+    AnalysisInfo,
+    PlyReview,
+    path_to_stockfish,
+)
+from strikechess.utils import (
+    EngineAllocation,
+    EngineRole,
+    resource_governor,
+)
+
+
+REVIEW_DEPTH: Final[int] = 18
+
+
+class EnginePool(QObject):
+    """Engine processes that review positions of a game in parallel.
+
+    Engines run as background jobs, so resource governor gives them lower
+    priority and their own share of hash and CPUs.
+
+    Results are tagged with generation of review that produced them, so
+    results of a cancelled review can be told apart from current ones.
+
+    Search of a position ends before review depth once it converges.
+    Positions already in analysis cache at review depth or deeper are
+    reviewed from cache without searching them again.
+    """
+
+    position_reviewed: ClassVar[Signal] = Signal(int, PlyReview)
+    review_finished: ClassVar[Signal] = Signal(int)
+
+    def __init__(
+        self,
+        path_to_file: str | list[str] | None = None,
+        engine_count: int | None = None,
+        analysis_cache: AnalysisCache | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._analysis_cache: AnalysisCache | None = analysis_cache
+        self._path_to_file: str | list[str] = path_to_file or path_to_stockfish()
+        self._digest: str | None = None
+        self._engine_count: int = engine_count or cpu_count(logical=False) or 1
+
+        self._positions: queue.SimpleQueue[tuple[int, str]] = queue.SimpleQueue()
+        self._cancelled: threading.Event = threading.Event()
+        self._workers: list[threading.Thread] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._remaining: int = 0
+        self.generation: int = 0
+
+    @property
+    def engine_count(self) -> int:
+        """Get number of engine processes used for review."""
+        return self._engine_count
+
+    def use_engine(
+        self, path_to_file: str | list[str], digest: str | None = None
+    ) -> None:
+        """Review with engine at `path_to_file` from next review on.
+
+        Without `digest`, each review computes digest of engine by itself.
+        """
+        self._path_to_file = path_to_file
+        self._digest = digest
+
+    def is_reviewing(self) -> bool:
+        """Return True if any worker is still reviewing positions."""
+        return any(worker.is_alive() for worker in self._workers)
+
+    def review(
+        self, positions: list[tuple[int, str]], depth: int = REVIEW_DEPTH
+    ) -> None:
+        """Review `positions` given as ply and FEN at fixed `depth`."""
+        self.cancel()
+        self.generation += 1
+        self._cancelled = threading.Event()
+        self._positions = queue.SimpleQueue()
+
+        for position in positions:
+            self._positions.put(position)
+
+        engine_count: int = max(min(self._engine_count, len(positions)), 1)
+        self._remaining = engine_count
+        self._workers = [
+            threading.Thread(
+                target=self._review_positions,
+                args=(
+                    self._path_to_file,
+                    self._digest,
+                    self._positions,
+                    self._cancelled,
+                    self.generation,
+                    Limit(depth=depth),
+                ),
+                name=f"ReviewEngine-{number}",
+                daemon=True,
+            )
+            for number in range(engine_count)
+        ]
+
+        for worker in self._workers:
+            worker.start()
+
+    def cancel(self) -> None:
+        """Stop review after positions that engines are searching now."""
+        self._cancelled.set()
+
+    def wait(self) -> None:
+        """Block until all workers have finished."""
+        for worker in self._workers:
+            worker.join()
+
+    def _review_positions(
+        self,
+        path_to_file: str | list[str],
+        digest: str | None,
+        positions: queue.SimpleQueue[tuple[int, str]],
+        cancelled: threading.Event,
+        generation: int,
+        limit: Limit,
+    ) -> None:
+        """Review queued positions in own engine process until none remain."""
+        try:
+            digest = digest or engine_digest(path_to_file)
+            engine: SimpleEngine = open_engine(path_to_file)
+        except (EngineError, OSError):
+            self._finish_worker(cancelled, generation)
+            return
+
+        key: int = resource_governor().register(
+            engine.transport.get_pid(), EngineRole.Background
+        )
+        configuration: dict[str, int] = {}
+
+        try:
+            while not cancelled.is_set():
+                try:
+                    ply, fen = positions.get_nowait()
+                except queue.Empty:
+                    break
+
+                board: Board = Board(fen)
+                line: AnalysisInfo = self._cached_line(digest, board, limit)
+
+                if not line.pv:
+                    allocation: EngineAllocation = resource_governor().allocation(key)
+
+                    if allocation.configuration() != configuration:
+                        configuration = allocation.configuration()
+                        engine.configure(configuration)
+
+                    info: InfoDict = analyse_until_converged(engine, board, limit)
+                    line = AnalysisInfo().merged(info)
+
+                    if self._analysis_cache is not None and line.pv:
+                        self._analysis_cache.store(digest, zobrist_hash(board), [line])
+
+                score: Score = line.score or Cp(0)
+                best_move: Move | None = line.pv[0] if line.pv else None
+
+                self.position_reviewed.emit(
+                    generation, PlyReview(ply, score, best_move)
+                )
+        except EngineError:
+            pass
+        finally:
+            release_engine(engine)
+            resource_governor().unregister(key)
+
+            if self._analysis_cache is not None:
+                self._analysis_cache.close_connection()
+
+            self._finish_worker(cancelled, generation)
+
+    def _cached_line(self, digest: str, board: Board, limit: Limit) -> AnalysisInfo:
+        """Get best line of `board` cached by engine `digest` at `limit` depth."""
+        if self._analysis_cache is not None:
+            for line in self._analysis_cache.get(digest, zobrist_hash(board)):
+                if line.multipv == 1 and line.depth >= (limit.depth or 0):
+                    return line
+
+        return AnalysisInfo()
+
+    def _finish_worker(self, cancelled: threading.Event, generation: int) -> None:
+        """Announce end of review `generation` once its last worker finished."""
+        with self._lock:
+            if cancelled.is_set():
+                return
+
+            self._remaining -= 1
+
+            if self._remaining:
+                return
+
+        self.review_finished.emit(generation)
@@ -1,243 +1,261 @@
 from __future__ import annotations
 
-from contextlib import suppress
-from typing import ClassVar, Iterator
+from collections.abc import Callable, Iterable
+from typing import ClassVar
 
-from chess import BB_SQUARES, BLACK, WHITE, Board, IllegalMoveError, Move
+from chess import Board, Move, SquareSet
 from PySide6.QtCore import QObject, Signal
-from PySide6.QtWidgets import QDialog
 
-from strikechess.ui.dialogs import PromotionDialog
+from strikechess.logic import (
+    GameCore,
+    GameJournal,
+    JournalRecord,
+    LegalMoveMap,
+    MoveFacts,
+    PositionHistory,
+    PositionSnapshot,
+    PremoveQueue,
+    promote_to_queen,
+)
 from strikechess.utils import setting_value
 
 
 class Game(QObject):
-    """Management of game state, logic, and events."""
+    """Qt adapter that exposes game core events as signals."""
 
-    move_played: ClassVar[Signal] = Signal(Move)
-    sound_effect_played: ClassVar[Signal] = Signal(Move)
+    move_played: ClassVar[Signal] = Signal(MoveFacts)
+    sound_effect_played: ClassVar[Signal] = Signal(MoveFacts)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        promotion_piece_type: Callable[[Color], PieceType | None] = promote_to_queen,
+        journal: GameJournal | None = None,
+    ) -> None:
         super().__init__()
 
-        self.board: Board = Board()
+        self.core: GameCore = GameCore(promotion_piece_type)
+        self.journal: GameJournal | None = journal
 
-        self.moves: list[str] = []
-        self.positions: list[Board] = []
-        self.arrow: list[tuple[Square, Square]] = []
+    @property
+    def board(self) -> Board:
+        """Get board with current position."""
+        return self.core.board
 
-        self.move_index: int = -1
-        self.origin_square: Square | None = None
-        self.target_square: Square | None = None
-        self.player_lost_on_time: Color | None = None
+    @property
+    def history(self) -> PositionHistory:
+        """Get history of positions in current line."""
+        return self.core.history
 
-        self.is_history: bool = False
-        self.has_time_expired: bool = False
+    @property
+    def arrow(self) -> list[tuple[Square, Square]]:
+        """Get arrow to be drawn on board."""
+        return self.core.arrow
+
+    @property
+    def premoves(self) -> PremoveQueue:
+        """Get premoves queued while engine is on turn."""
+        return self.core.premoves
 
-        self.reset_selected_squares()
+    @property
+    def premove_board(self) -> Board:
+        """Get board with pieces moved by queued premoves."""
+        return self.core.premoves.board_after(self.core.board, self.core.snapshot.key)
 
     @property
     def fen(self) -> str:
         """Get current position in FEN format."""
-        return self.board.fen()
+        return self.core.fen
 
     @fen.setter
     def fen(self, value) -> None:
         """Set new position in FEN format based on `value`."""
-        self.board.set_fen(value)
-        self._initialize_state()
+        self.core.fen = value
+
+        if self.journal is not None:
+            self.journal.restart(self.core.fen)
 
     @property
     def check(self) -> Square | None:
         """Get square of king in check."""
-        if self.board.is_check():
-            return self.board.king(self.board.turn)
-        return None
+        return self.core.check
+
+    @property
+    def ply(self) -> int:
+        """Get ply of shown position in current line."""
+        return self.core.ply
+
+    @property
+    def snapshot(self) -> PositionSnapshot:
+        """Get immutable snapshot of current position."""
+        return self.core.snapshot
 
     @property
     def result(self) -> str:
         """Get result of current game."""
-        result: str = "*"
-
-        if self.has_time_expired:
-            if self.player_lost_on_time == BLACK:
-                return "White wins on time"
-            elif self.player_lost_on_time == WHITE:
-                return "Black wins on time"
-        else:
-            result = self.board.result(claim_draw=True)
-
-        result_descriptions: dict[str, str] = {
-            "1/2-1/2": "Draw",
-            "0-1": "Black wins",
-            "1-0": "White wins",
-            "*": "Undetermined game",
-        }
-        return result_descriptions[result]
+        return self.core.result
+
+    @property
+    def legal_move_map(self) -> LegalMoveMap:
+        """Get legal moves of current position grouped by squares."""
+        return self.core.legal_move_map
 
     @property
     def turn(self) -> bool:
         """Return True if White is on turn."""
-        return self.board.turn
+        return self.core.turn
+
+    @property
+    def origin_square(self) -> Square | None:
+        """Get selected origin square."""
+        return self.core.origin_square
 
-    def _initialize_state(self) -> None:
-        """Clear game history and set squares to initial value."""
-        self.move_index = -1
+    @origin_square.setter
+    def origin_square(self, value: Square | None) -> None:
+        """Set selected origin square to `value`."""
+        self.core.origin_square = value
 
-        self.has_time_expired = False
-        self.player_lost_on_time = None
+    @property
+    def target_square(self) -> Square | None:
+        """Get selected target square."""
+        return self.core.target_square
+
+    @target_square.setter
+    def target_square(self, value: Square | None) -> None:
+        """Set selected target square to `value`."""
+        self.core.target_square = value
+
+    @property
+    def is_history(self) -> bool:
+        """Return True if earlier position of history is shown."""
+        return self.core.is_history
+
+    @is_history.setter
+    def is_history(self, value: bool) -> None:
+        """Set whether earlier position of history is shown to `value`."""
+        self.core.is_history = value
+
+    def _emit(self, facts: MoveFacts | None) -> None:
+        """Journal and emit signals about pushed move if there are `facts`."""
+        if facts is None:
+            return
 
-        self.moves.clear()
-        self.positions.clear()
+        if self.journal is not None:
+            self.journal.record_push(facts)
 
-        self.clear_arrow()
-        self.reset_selected_squares()
+        self.sound_effect_played.emit(facts)
+        self.move_played.emit(facts)
+
+    def _record_navigation(self) -> None:
+        """Journal ply of position that is shown now."""
+        if self.journal is not None:
+            self.journal.record_navigation(self.core.ply)
 
     def reset_selected_squares(self) -> None:
         """Reset origin and target squares."""
-        self.origin_square = None
-        self.target_square = None
+        self.core.reset_selected_squares()
 
     def set_selected_square(self, square_index: Square) -> None:
         """Set selected square to be `square_index`."""
-        if self.origin_square is None:
-            self.origin_square = square_index
-        else:
-            self.target_square = square_index
-            self.find_legal_move(self.origin_square, self.target_square)
-            self.reset_selected_squares()
+        self._emit(self.core.set_selected_square(square_index))
 
     def prepare_new_game(self) -> None:
-        """Initialize state and reset board for new game."""
-        self._initialize_state()
-        self.board.reset()
+        """Reset board and initialize state for new game."""
+        self.core.prepare_new_game()
+
+        if self.journal is not None:
+            self.journal.restart(self.core.fen)
 
     def declare_time_loss_for(self, player_color: Color) -> None:
         """Declare that `player_color` has lost on time."""
-        self.player_lost_on_time = player_color
-        self.has_time_expired = True
-
-    def maybe_append_ellipsis(self) -> None:
-        """If Black moves first, append ellipsis for White's move."""
-        if self.move_index < 0 and not self.is_white_on_turn():
-            self.moves.append("...")
-            self.positions.append(self.board.copy())
+        self.core.declare_time_loss_for(player_color)
 
     def push(self, move: Move) -> None:
         """Update game state by pushing `move`."""
-        if not self.board.is_legal(move):
-            return
-
-        self.delete_data_after_index()
-        self.maybe_append_ellipsis()
+        self._emit(self.core.push(move))
 
-        self.sound_effect_played.emit(move)
+    def queue_premove(self, origin_square: Square, target_square: Square) -> None:
+        """Queue premove from `origin_square` to `target_square`."""
+        self.core.premoves.append(origin_square, target_square)
 
-        new_move: str = self.board.san_and_push(move)
-        self.moves.append(new_move)
+    def pop_premove(self) -> Move | None:
+        """Get first queued premove if it is legal now, otherwise cancel all."""
+        return self.core.pop_premove()
 
-        position: Board = self.board.copy()
-        self.positions.append(position)
+    def clear_premoves(self) -> None:
+        """Cancel all queued premoves."""
+        self.core.premoves.clear()
 
     def set_arrow(self, move: Move) -> None:
         """Set arrow based on `move`."""
-        self.arrow = [(move.from_square, move.to_square)]
+        self.core.set_arrow(move)
 
     def clear_arrow(self) -> None:
         """Clear arrow from board."""
-        self.arrow.clear()
+        self.core.clear_arrow()
 
     def set_root_position(self) -> None:
         """Reset pieces on board to initial position and clear arrow."""
-        self.move_index = -1
-        self.board = self.board.root()
+        self.core.set_root_position()
+        self._record_navigation()
 
-        self.clear_arrow()
-
-    def legal_targets(self, square: Square | None = None) -> list[Square]:
+    def legal_targets(self, square: Square | None = None) -> SquareSet:
         """Get target squares as legal moves for piece at `square`."""
-        if square is None:
-            return []
-
-        square_bit: int = BB_SQUARES[square]
-        targets: Iterator[Move] = self.board.generate_legal_moves(square_bit)
-        return [move.to_square for move in targets]
+        return self.core.legal_targets(square)
 
     def find_legal_move(self, origin_square: Square, target_square: Square) -> None:
         """Find legal move for `origin_square` and `target_square`."""
-        if origin_square is None or target_square is None:
-            return
-
-        with suppress(IllegalMoveError):
-            move: Move = self.board.find_move(origin_square, target_square)
-
-            if move.promotion:
-                move.promotion = self.promotion_piece_type()
-
-            self.move_played.emit(move)
-
-    def promotion_piece_type(self) -> PieceType | None:
-        """Get promotion piece type from promotion dialog."""
-        promotion_dialog: PromotionDialog = PromotionDialog(self.board.turn)
-
-        if promotion_dialog.exec() == QDialog.DialogCode.Accepted:
-            return promotion_dialog.piece_type
-
-        return None
+        self._emit(self.core.find_legal_move(origin_square, target_square))
 
     def piece_at(self, square: Square) -> Piece | None:
         """Get piece at `square`."""
-        return self.board.piece_at(square)
+        return self.core.piece_at(square)
 
     def update_state(self, item_index: int) -> None:
         """Update game state based on `item_index`."""
-        self.move_index = item_index
-        self.board = self.positions[item_index].copy()
-
-        if self.moves[item_index] != "...":
-            self.set_arrow(self.board.move_stack[-1])
-        else:
-            self.clear_arrow()
+        self.core.update_state(item_index)
+        self._record_navigation()
 
-    def delete_data_after_index(self) -> None:
-        """Delete moves and positions after internal move index."""
-        last_move_index: int = len(self.moves) - 1
+    def switch_variation(self, item_index: int, step: int) -> bool:
+        """Switch to variation `step` away from move at `item_index`."""
+        if not self.core.switch_variation(item_index, step):
+            return False
 
-        if self.move_index < last_move_index:
-            after_move_index: slice = slice(self.move_index + 1, len(self.moves))
-            del self.moves[after_move_index]
-            del self.positions[after_move_index]
+        if self.journal is not None:
+            self.journal.record_variation(self.core.ply, step)
+        return True
 
-    def gives_check(self, move: Move) -> bool:
-        """Return True if `move` puts opponent's king in check."""
-        return self.board.gives_check(move)
+    def replay(self, records: Iterable[JournalRecord]) -> None:
+        """Restore game by replaying journal `records`."""
+        self.core.replay(records)
 
     def is_engine_on_turn(self) -> bool:
         """Return True if engine is on turn."""
-        return self.board.turn == setting_value("engine", "is_white")
+        return self.core.board.turn == setting_value("engine", "is_white")
+
+    def is_premove_allowed(self) -> bool:
+        """Return True if player may queue premoves in shown position."""
+        return (
+            self.is_engine_on_turn()
+            and not self.is_over()
+            and self.core.ply == len(self.core.history)
+        )
+
+    def is_current(self, snapshot: PositionSnapshot) -> bool:
+        """Return True if `snapshot` still shows current position."""
+        return self.core.is_current(snapshot)
 
     def is_in_progress(self) -> bool:
         """Return True if game is in progress."""
-        return bool(self.moves)
-
-    def is_legal(self, move: Move) -> bool:
-        """Return True if `move` would be considered as legal."""
-        return self.board.is_legal(move)
+        return self.core.is_in_progress()
 
     def is_over(self) -> bool:
         """Return True if game is over or time has expired."""
-        return self.board.is_game_over(claim_draw=True) or self.has_time_expired
-
-    def is_over_after(self, move: Move) -> bool:
-        """Return True if game is over after `move`."""
-        board: Board = self.board.copy()
-        board.push(move)
-        return board.is_game_over(claim_draw=True)
+        return self.core.is_over()
 
     def is_valid(self) -> bool:
         """Return True if board setup is valid."""
-        return self.board.is_valid()
+        return self.core.is_valid()
 
     def is_white_on_turn(self) -> bool:
         """Return True if White is on turn."""
-        return self.board.turn == WHITE
+        return self.core.is_white_on_turn()
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Callable
+from time import perf_counter
+from typing import Final, NamedTuple
+from urllib.parse import urlsplit
+
+from chess.engine import SimpleEngine, UciProtocol, run_in_background
+
+
+CONNECT_TIMEOUT: Final[float] = 10.0
+RECONNECT_ATTEMPTS: Final[int] = 3
+RECONNECT_DELAY: Final[float] = 0.1
+POOL_SIZE: Final[int] = 4
+
+
+class ConnectionMetrics(NamedTuple):
+    """Traffic and `isready` round-trip latency of one engine host connection."""
+
+    address: str
+    connect_time: float
+    round_trips: int
+    last_latency: float
+    max_latency: float
+    bytes_sent: int
+    bytes_received: int
+
+
+def is_host_address(path_to_file: str) -> bool:
+    """Return True if `path_to_file` is engine host address, not a file."""
+    return path_to_file.startswith(("tcp://", "unix://"))
+
+
+class HeartbeatProtocol(UciProtocol):
+    """UCI protocol that can send heartbeat to engine past running command.
+
+    UCI engines must answer `isready` even while searching, so heartbeat
+    is sent as raw `isready` that neither cancels nor disturbs running
+    command. Its `readyok` is consumed here, because command does not
+    expect it, and `readyok` lines are matched to senders in order. Time
+    of last line received is kept too, because engine flooding `info`
+    lines answers heartbeat only after all of them.
+
+    Callback `on_search_started` is called on event loop right after each
+    `go`, so stop requested before search started is not lost.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._readyok_senders: deque[bool] = deque()
+        self.heartbeat_sent_at: float | None = None
+        self.line_received_at: float = perf_counter()
+        self.on_search_started: Callable[[], None] | None = None
+
+    def send_line(self, line: str) -> None:
+        """Send `line` to engine, noting `isready` and `go` sent by command."""
+        if line == "isready":
+            self._readyok_senders.append(False)
+
+        super().send_line(line)
+
+        if line.startswith("go") and self.on_search_started is not None:
+            self.on_search_started()
+
+    def send_heartbeat(self) -> None:
+        """Send heartbeat unless previous one is still unanswered."""
+        if self.heartbeat_sent_at is not None:
+            return
+
+        self.send_line("isready")
+        self._readyok_senders[-1] = True
+        self.heartbeat_sent_at = perf_counter()
+
+    def _line_received(self, line: str) -> None:
+        """Handle `line`, keeping `readyok` of heartbeat from command."""
+        self.line_received_at = perf_counter()
+
+        if line.strip() == "readyok" and self._readyok_senders:
+            if self._readyok_senders.popleft():
+                self.heartbeat_sent_at = None
+                self.line_received(line)
+                return
+
+        super()._line_received(line)
+
+
+class HostTransport(asyncio.SubprocessTransport, asyncio.WriteTransport):
+    """Socket to engine host posing as pipes of local engine process."""
+
+    def __init__(self, socket_transport: asyncio.Transport) -> None:
+        super().__init__()
+
+        self._socket_transport: asyncio.Transport = socket_transport
+        self.returncode: int | None = None
+        self.bytes_sent: int = 0
+
+    def get_pipe_transport(self, fd: int) -> HostTransport:
+        """Get transport that writes to engine, which is socket itself."""
+        return self
+
+    def get_pid(self) -> None:
+        """Get no PID, because engine process runs on engine host."""
+        return None
+
+    def get_returncode(self) -> int | None:
+        """Get exit code once connection to engine host is closed."""
+        return self.returncode
+
+    def write(self, data: bytes) -> None:
+        """Send `data` to engine over socket."""
+        self.bytes_sent += len(data)
+        self._socket_transport.write(data)
+
+    def is_closing(self) -> bool:
+        """Return True if socket is closing or closed."""
+        return self._socket_transport.is_closing()
+
+    def close(self) -> None:
+        """Close socket, so engine host terminates its engine process."""
+        self._socket_transport.close()
+
+
+class HostProtocol(HeartbeatProtocol):
+    """UCI protocol spoken over socket to engine host instead of pipes."""
+
+    def __init__(self, address: str, connect_time: float) -> None:
+        super().__init__()
+
+        self.address: str = address
+        self._connect_time: float = connect_time
+        self._ping_times: deque[float] = deque()
+        self._round_trips: int = 0
+        self._last_latency: float = 0.0
+        self._max_latency: float = 0.0
+        self._bytes_received: int = 0
+
+    @property
+    def metrics(self) -> ConnectionMetrics:
+        """Get traffic and latency of connection so far."""
+        return ConnectionMetrics(
+            address=self.address,
+            connect_time=self._connect_time,
+            round_trips=self._round_trips,
+            last_latency=self._last_latency,
+            max_latency=self._max_latency,
+            bytes_sent=self.transport.bytes_sent if self.transport else 0,
+            bytes_received=self._bytes_received,
+        )
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Wrap socket `transport` to look like engine process pipes."""
+        super().connection_made(HostTransport(transport))
+
+    def data_received(self, data: bytes) -> None:
+        """Handle `data` from engine host as engine output."""
+        self._bytes_received += len(data)
+        self.pipe_data_received(1, data)
+
+    def eof_received(self) -> None:
+        """Let socket close when engine host stops sending."""
+        return None
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Terminate pending commands as if engine process had exited."""
+        self.transport.returncode = 0 if exc is None else 1
+        super().connection_lost(exc)
+
+    def send_line(self, line: str) -> None:
+        """Send `line` to engine, timing `isready` until `readyok` answers."""
+        if line == "isready":
+            self._ping_times.append(perf_counter())
+        super().send_line(line)
+
+    def line_received(self, line: str) -> None:
+        """Record round-trip latency when `line` answers `isready`."""
+        if line.strip() == "readyok" and self._ping_times:
+            latency: float = perf_counter() - self._ping_times.popleft()
+            self._round_trips += 1
+            self._last_latency = latency
+            self._max_latency = max(latency, self._max_latency)
+
+        super().line_received(line)
+
+
+def connect_to_host(address: str) -> SimpleEngine:
+    """Connect to engine host at `address`, retrying refused connections.
+
+    Address is either `tcp://host:port` or `unix:///path/to/socket`.
+    """
+    url = urlsplit(address)
+
+    async def background(future) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        start_time: float = perf_counter()
+
+        for attempt in range(RECONNECT_ATTEMPTS):
+            try:
+                if url.scheme == "unix":
+                    _, protocol = await loop.create_unix_connection(
+                        lambda: HostProtocol(address, perf_counter() - start_time),
+                        url.path,
+                    )
+                else:
+                    _, protocol = await loop.create_connection(
+                        lambda: HostProtocol(address, perf_counter() - start_time),
+                        url.hostname,
+                        url.port,
+                    )
+                break
+            except OSError:
+                if attempt == RECONNECT_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(RECONNECT_DELAY * 2**attempt)
+
+        engine: SimpleEngine = SimpleEngine(
+            protocol.transport, protocol, timeout=CONNECT_TIMEOUT
+        )
+
+        try:
+            await asyncio.wait_for(protocol.initialize(), CONNECT_TIMEOUT)
+            future.set_result(engine)
+            engine.returncode.set_result(await protocol.returncode)
+        finally:
+            engine.close()
+
+        await engine.shutdown_event.wait()
+
+    return run_in_background(background, name=f"SimpleEngine (address={address})")
+
+
+class HostConnectionPool:
+    """Idle connections to engine hosts kept for reuse.
+
+    Engine host starts new engine process for each connection, so reusing
+    idle connection saves both connecting and engine startup.
+    """
+
+    def __init__(self, size: int = POOL_SIZE) -> None:
+        self._size: int = size
+        self._lock: threading.Lock = threading.Lock()
+        self._idle: dict[str, list[SimpleEngine]] = {}
+
+    def acquire(self, address: str) -> SimpleEngine:
+        """Get idle live connection to `address`, or connect if there is none."""
+        while True:
+            with self._lock:
+                idle: list[SimpleEngine] = self._idle.get(address, [])
+                engine: SimpleEngine | None = idle.pop() if idle else None
+
+            if engine is None:
+                return connect_to_host(address)
+
+            if not engine.returncode.done():
+                return engine
+
+    def release(self, engine: SimpleEngine) -> None:
+        """Keep connection of `engine` for reuse, or close it if pool is full."""
+        address: str = engine.protocol.address
+
+        with self._lock:
+            idle: list[SimpleEngine] = self._idle.setdefault(address, [])
+
+            if len(idle) < self._size and not engine.returncode.done():
+                idle.append(engine)
+                return
+
+        engine.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            engines: list[SimpleEngine] = [
+                engine for idle in self._idle.values() for engine in idle
+            ]
+            self._idle = {}
+
+        for engine in engines:
+            engine.close()
+
+
+_host_pool: HostConnectionPool = HostConnectionPool()
+
+
+def open_engine(path_to_file: str | list[str]) -> SimpleEngine:
+    """Start engine from file, or get connection if it is host address."""
+    if isinstance(path_to_file, str) and is_host_address(path_to_file):
+        return _host_pool.acquire(path_to_file)
+    return SimpleEngine.popen(HeartbeatProtocol, path_to_file)
+
+
+def release_engine(engine: SimpleEngine) -> None:
+    """Quit local engine, or return connection to engine host to pool."""
+    if isinstance(engine.protocol, HostProtocol):
+        _host_pool.release(engine)
+    else:
+        engine.quit()
+
+
+def connection_metrics(engine: SimpleEngine) -> ConnectionMetrics | None:
+    """Get latency of connection of `engine` if it runs on engine host."""
+    if isinstance(engine.protocol, HostProtocol):
+        return engine.protocol.metrics
+    return None
+
+
+def close_host_connections() -> None:
+    """Close idle connections to engine hosts, for example when app quits."""
+    _host_pool.close()
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import threading
+from typing import ClassVar, Final
+
+from chess import Board
+from chess.engine import EngineError, Limit, SimpleAnalysisResult, SimpleEngine
+from PySide6.QtCore import QObject, Signal
+
+from strikechess.core.remote import open_engine, release_engine
+from strikechess.core.supervisor import engine_digest
+from strikechess.logic import (
+    AnalysisCache,
+    AnalysisInfo,
+    Neighborhood,
+    path_to_stockfish,
+)
+from strikechess.utils import (
+    EngineAllocation,
+    EngineRole,
+    resource_governor,
+)
+
+
+SPECULATION_DEPTH: Final[int] = 14
+
+
+class Speculator(QObject):
+    """Background engine that analyzes plies around one selected in history.
+
+    Results go to analysis cache, so evaluation of a ply is known by the
+    time user steps onto it. Positions that fall out of navigation window
+    are dropped, and search of such position is stopped. Navigation window
+    is rebuilt and checked against cache by planner thread, so stepping
+    through history does no disk reads.
+    """
+
+    position_analyzed: ClassVar[Signal] = Signal(object, AnalysisInfo)
+
+    def __init__(
+        self,
+        analysis_cache: AnalysisCache,
+        path_to_file: str | list[str] | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._analysis_cache: AnalysisCache = analysis_cache
+        self._path_to_file: str | list[str] = path_to_file or path_to_stockfish()
+        self._digest: str | None = None
+
+        self._condition: threading.Condition = threading.Condition()
+        self._neighborhood: Neighborhood | None = None
+        self._generation: int = 0
+        self._window: list[tuple[int, str]] = []
+        self._searched_key: int | None = None
+        self._analysis: SimpleAnalysisResult | None = None
+        self._is_quitting: bool = False
+        self._worker: threading.Thread | None = None
+        self._planner: threading.Thread | None = None
+
+    def follow(self, neighborhood: Neighborhood | None) -> None:
+        """Analyze plies of `neighborhood` nearest first, dropping others.
+
+        Cached evaluation of its shown ply is sent as `position_analyzed`.
+        """
+        with self._condition:
+            self._neighborhood = neighborhood
+            self._generation += 1
+
+            if neighborhood is None:
+                self._window = []
+
+            if neighborhood is None or self._searched_key not in neighborhood.keys():
+                self._stop_search()
+
+            if (
+                self._planner is None
+                and neighborhood is not None
+                and not self._is_quitting
+            ):
+                self._start_planner()
+
+            self._condition.notify_all()
+
+    def use_engine(
+        self, path_to_file: str | list[str], digest: str | None = None
+    ) -> None:
+        """Speculate with engine at `path_to_file` instead of current one.
+
+        Current search is stopped and worker restarts with new engine.
+        Without `digest`, worker computes digest of engine by itself.
+        """
+        with self._condition:
+            if path_to_file == self._path_to_file:
+                self._digest = digest or self._digest
+                return
+
+            self._path_to_file = path_to_file
+            self._digest = digest
+            self._stop_search()
+            self._condition.notify_all()
+
+    def cancel(self) -> None:
+        """Drop navigation window and stop search of its position."""
+        self.follow(None)
+
+    def quit(self) -> None:
+        """Stop speculating and release engine."""
+        with self._condition:
+            self._is_quitting = True
+            self._neighborhood = None
+            self._window = []
+            self._stop_search()
+            self._condition.notify_all()
+
+    def _start_worker(self) -> None:
+        """Start worker thread with engine, while holding condition."""
+        self._worker = threading.Thread(
+            target=self._run_speculation,
+            args=(self._path_to_file, self._digest),
+            name="SpeculativeEngine",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _start_planner(self) -> None:
+        """Start planner thread of navigation windows, while holding condition."""
+        self._planner = threading.Thread(
+            target=self._run_planner,
+            name="SpeculationPlanner",
+            daemon=True,
+        )
+        self._planner.start()
+
+    def _run_planner(self) -> None:
+        """Plan navigation window of each followed neighborhood until quitting."""
+        try:
+            while (followed := self._next_neighborhood()) is not None:
+                self._plan(*followed)
+        finally:
+            self._analysis_cache.close_connection()
+
+    def _next_neighborhood(self) -> tuple[Neighborhood, int, str | None] | None:
+        """Wait for neighborhood to plan, with its generation and engine digest.
+
+        None is returned when quitting.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._neighborhood is not None or self._is_quitting
+            )
+
+            if self._is_quitting:
+                self._planner = None
+                return None
+
+            neighborhood: Neighborhood = self._neighborhood
+            self._neighborhood = None
+            return neighborhood, self._generation, self._digest
+
+    def _plan(
+        self, neighborhood: Neighborhood, generation: int, digest: str | None
+    ) -> None:
+        """Show cached evaluation of `neighborhood` and queue its other plies.
+
+        Window is dropped if another neighborhood was followed meanwhile.
+        """
+        if digest is not None:
+            lines: tuple[AnalysisInfo, ...] = self._analysis_cache.get(
+                digest, neighborhood.key
+            )
+
+            if lines and lines[0].score is not None:
+                self.position_analyzed.emit(neighborhood.key, lines[0])
+
+        window: list[tuple[int, str]] = [
+            (key, fen)
+            for key, fen in neighborhood.positions()
+            if not self._is_analyzed(digest, key)
+        ]
+
+        with self._condition:
+            if generation != self._generation:
+                return
+
+            self._window = [
+                (key, fen) for key, fen in window if key != self._searched_key
+            ]
+
+            if self._worker is None and self._window and not self._is_quitting:
+                self._start_worker()
+
+            self._condition.notify_all()
+
+    def _is_analyzed(self, digest: str | None, key: int) -> bool:
+        """Return True if position hashed as `key` is cached deep enough."""
+        return digest is not None and any(
+            line.multipv == 1 and line.depth >= SPECULATION_DEPTH
+            for line in self._analysis_cache.get(digest, key)
+        )
+
+    def _stop_search(self) -> None:
+        """Stop running search, if any, while holding condition."""
+        self._searched_key = None
+
+        if self._analysis is not None:
+            self._analysis.stop()
+
+    def _next_position(self, path_to_file: str | list[str]) -> tuple[int, str] | None:
+        """Wait for nearest position of window for engine at `path_to_file`.
+
+        None is returned when quitting or when another engine is to be used.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._window
+                or self._is_quitting
+                or self._path_to_file != path_to_file
+            )
+
+            if self._is_quitting or self._path_to_file != path_to_file:
+                return None
+
+            position: tuple[int, str] = self._window.pop(0)
+            self._searched_key = position[0]
+            return position
+
+    def _run_speculation(
+        self, path_to_file: str | list[str], digest: str | None
+    ) -> None:
+        """Analyze positions of navigation window in engine at `path_to_file`."""
+        try:
+            digest = digest or engine_digest(path_to_file)
+            engine: SimpleEngine = open_engine(path_to_file)
+        except (EngineError, OSError):
+            self._finish_worker(path_to_file)
+            return
+
+        with self._condition:
+            if self._path_to_file == path_to_file:
+                self._digest = digest
+
+        key: int = resource_governor().register(
+            engine.transport.get_pid(), EngineRole.Background
+        )
+        configuration: dict[str, int] = {}
+
+        try:
+            while (position := self._next_position(path_to_file)) is not None:
+                allocation: EngineAllocation = resource_governor().allocation(key)
+
+                if allocation.configuration() != configuration:
+                    configuration = allocation.configuration()
+                    engine.configure(configuration)
+
+                self._speculate(engine, digest, *position)
+        except EngineError:
+            with self._condition:
+                self._analysis = None
+                self._searched_key = None
+        finally:
+            release_engine(engine)
+            resource_governor().unregister(key)
+            self._analysis_cache.close_connection()
+            self._finish_worker(path_to_file)
+
+    def _finish_worker(self, path_to_file: str | list[str]) -> None:
+        """Forget worker of engine at `path_to_file`, restarting it if replaced."""
+        with self._condition:
+            self._worker = None
+
+            if (
+                self._path_to_file != path_to_file
+                and self._window
+                and not self._is_quitting
+            ):
+                self._start_worker()
+
+    def _speculate(self, engine: SimpleEngine, digest: str, key: int, fen: str) -> None:
+        """Analyze position of `fen` hashed as `key` unless it leaves window."""
+        board: Board = Board(fen)
+
+        if board.is_game_over():
+            return
+
+        line: AnalysisInfo = AnalysisInfo()
+
+        with engine.analysis(board, Limit(depth=SPECULATION_DEPTH)) as analysis:
+            with self._condition:
+                if self._searched_key != key or self._is_quitting:
+                    return
+
+                self._analysis = analysis
+
+            for info in analysis:
+                line = line.merged(info)
+
+        with self._condition:
+            self._analysis = None
+            is_stopped: bool = self._searched_key != key or self._is_quitting
+            self._searched_key = None
+
+        if line.pv:
+            self._analysis_cache.store(digest, key, [line])
+
+        if line.score is not None and not is_stopped:
+            self.position_analyzed.emit(key, line)
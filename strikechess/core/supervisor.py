@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from time import perf_counter
+from typing import Final, NamedTuple
+
+from chess import Color
+from chess.engine import (
+    EngineError,
+    EngineTerminatedError,
+    Limit,
+    Protocol,
+    SimpleEngine,
+)
+
+from strikechess.core.calibration import binary_digest
+from strikechess.core.remote import (
+    HeartbeatProtocol,
+    is_host_address,
+    open_engine,
+    release_engine,
+)
+from strikechess.logic import (
+    delete_quarantine_attribute,
+    make_executable,
+    path_to_stockfish,
+)
+from strikechess.utils import setting_value
+
+
+HEARTBEAT_INTERVAL: Final[float] = 1.0
+HEARTBEAT_TIMEOUT: Final[float] = 0.5
+DEADLINE_MARGIN: Final[float] = 5.0
+
+
+class EngineProcess(NamedTuple):
+    """Started engine process that has answered its first heartbeat."""
+
+    engine: SimpleEngine
+    path_to_file: str
+    digest: str
+    startup_time: float
+
+
+def is_responsive(engine: SimpleEngine) -> bool:
+    """Return True if `engine` answers `isready` within heartbeat timeout.
+
+    Heartbeat is a new command, so it must not be sent while engine is
+    searching, because it would cancel the search. Searching engine gets
+    heartbeat from `send_heartbeat` instead.
+    """
+    loop: asyncio.AbstractEventLoop = engine.protocol.loop
+
+    if loop.is_closed():
+        return False
+
+    try:
+        asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(engine.protocol.ping(), HEARTBEAT_TIMEOUT), loop
+        ).result()
+    except (EngineError, TimeoutError, RuntimeError):
+        return False
+
+    return True
+
+
+def send_heartbeat(engine: SimpleEngine) -> None:
+    """Send `isready` to searching `engine` without disturbing its search."""
+    protocol: Protocol = engine.protocol
+
+    if isinstance(protocol, HeartbeatProtocol) and not protocol.loop.is_closed():
+        try:
+            protocol.loop.call_soon_threadsafe(protocol.send_heartbeat)
+        except RuntimeError:
+            pass
+
+
+def is_hung(engine: SimpleEngine, deadline: float | None = None) -> bool:
+    """Return True if searching `engine` ignores heartbeat or overran `deadline`.
+
+    Engine counts as answering while it sends any lines, even if they
+    still hold back `readyok` of heartbeat.
+    """
+    now: float = perf_counter()
+
+    if deadline is not None and now > deadline:
+        return True
+
+    protocol: Protocol = engine.protocol
+
+    if not isinstance(protocol, HeartbeatProtocol):
+        return False
+
+    sent_at: float | None = protocol.heartbeat_sent_at
+
+    if sent_at is None:
+        return False
+    return now - max(sent_at, protocol.line_received_at) > HEARTBEAT_TIMEOUT
+
+
+def kill_engine(engine: SimpleEngine) -> None:
+    """Kill hung `engine`, or drop its connection, so its command fails.
+
+    Engine is left to shut down its event loop by itself, as if it had
+    crashed, so running command ends with error instead of being torn down.
+    """
+    loop: asyncio.AbstractEventLoop = engine.protocol.loop
+    loop.set_exception_handler(_ignore_engine_termination)
+
+    try:
+        loop.call_soon_threadsafe(engine.transport.close)
+    except RuntimeError:
+        pass
+
+
+def _ignore_engine_termination(
+    loop: asyncio.AbstractEventLoop, context: dict[str, object]
+) -> None:
+    """Drop error of killed engine left in future that nobody awaits.
+
+    Analysis result keeps its error in future that is awaited only while
+    event loop runs, and loop of killed engine shuts down before that.
+    """
+    if not isinstance(context.get("exception"), EngineTerminatedError):
+        loop.default_exception_handler(context)
+
+
+def search_deadline(limit: Limit, turn: Color) -> float | None:
+    """Get time by which search within `limit` must have ended, if any.
+
+    Search by depth or nodes has no deadline. Search on clock may take at
+    most whole remaining time of player on `turn` with its increment.
+    """
+    seconds: float | None = limit.time
+
+    if seconds is None:
+        clock: float | None = limit.white_clock if turn else limit.black_clock
+        increment: float | None = limit.white_inc if turn else limit.black_inc
+
+        if clock is not None:
+            seconds = clock + (increment or 0.0)
+
+    if seconds is None:
+        return None
+    return perf_counter() + seconds + DEADLINE_MARGIN
+
+
+def saved_engine_path() -> str | None:
+    """Get path to file or address of host of last loaded engine.
+
+    Bundled Stockfish is used until another engine has been loaded, or
+    None if source checkout has no Stockfish binary to fall back to.
+    """
+    path_to_file: str = setting_value("engine", "path")
+
+    if path_to_file:
+        return path_to_file
+    if os.path.isfile(path_to_stockfish()):
+        return path_to_stockfish()
+    return None
+
+
+def engine_digest(path_to_file: str | list[str]) -> str:
+    """Get digest that identifies engine at `path_to_file`.
+
+    Engine on engine host is identified by its address instead of digest
+    of its binary, which is not available locally, and engine started by
+    command is identified by command itself.
+    """
+    if isinstance(path_to_file, list):
+        return " ".join(path_to_file)
+    if is_host_address(path_to_file):
+        return path_to_file
+    return binary_digest(path_to_file)
+
+
+def start_engine(path_to_file: str, digest: str | None = None) -> EngineProcess:
+    """Start engine from file at `path_to_file` and wait until it is ready."""
+    if not is_host_address(path_to_file):
+        delete_quarantine_attribute(path_to_file)
+        make_executable(path_to_file)
+
+    digest = digest or engine_digest(path_to_file)
+
+    start_time: float = perf_counter()
+    engine: SimpleEngine = open_engine(path_to_file)
+
+    try:
+        engine.ping()
+    except Exception:
+        engine.close()
+        raise
+
+    return EngineProcess(engine, path_to_file, digest, perf_counter() - start_time)
+
+
+class EngineSupervisor:
+    """Starter of engine processes that keeps pre-warmed standby on request.
+
+    With standby on, a spare process of the last started engine is kept
+    idle after its UCI handshake, so replacing a crashed engine or
+    reloading the same one skips process startup.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._standby: EngineProcess | None = None
+        self._is_closed: bool = False
+
+    def launch(self, path_to_file: str, digest: str | None = None) -> EngineProcess:
+        """Get ready engine process, taking standby of same file if any."""
+        with self._lock:
+            standby: EngineProcess | None = self._standby
+            self._standby = None
+
+        process: EngineProcess | None = None
+
+        if standby is not None and standby.path_to_file == path_to_file:
+            if is_responsive(standby.engine):
+                process = standby
+            else:
+                standby.engine.close()
+        elif standby is not None:
+            release_engine(standby.engine)
+
+        process = process or start_engine(path_to_file, digest)
+
+        if setting_value("engine", "is_standby_on"):
+            threading.Thread(
+                target=self._prepare_standby,
+                args=(path_to_file, process.digest),
+                name="EngineStandby",
+                daemon=True,
+            ).start()
+
+        return process
+
+    def _prepare_standby(self, path_to_file: str, digest: str) -> None:
+        """Start spare engine from file at `path_to_file` and keep it idle."""
+        try:
+            process: EngineProcess = start_engine(path_to_file, digest)
+        except (EngineError, OSError):
+            return
+
+        with self._lock:
+            if self._is_closed:
+                spare: EngineProcess | None = process
+            else:
+                spare, self._standby = self._standby, process
+
+        if spare is not None:
+            release_engine(spare.engine)
+
+    def close(self) -> None:
+        """Terminate standby process and stop preparing new ones."""
+        with self._lock:
+            self._is_closed = True
+            standby: EngineProcess | None = self._standby
+            self._standby = None
+
+        if standby is not None:
+            release_engine(standby.engine)
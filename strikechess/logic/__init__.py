@@ -0,0 +1,69 @@
+from .analysis import AnalysisInfo, AnalysisStream, ScoreBound
+from .analysis_cache import AnalysisCache
+from .convergence import ConvergenceDetector
+from .engine_files import (
+    delete_quarantine_attribute,
+    make_executable,
+    path_to_stockfish,
+)
+from .facts import MoveFacts, checked_king
+from .game import GameCore, promote_to_queen
+from .history import Neighborhood, PositionHistory, decode_move, encode_move
+from .journal import GameJournal, JournalEvent, JournalRecord, read_journal
+from .legal_moves import LegalMoveCache, LegalMoveMap
+from .opening_book import OpeningBook
+from .premoves import PremoveQueue, premove_targets
+from .review import (
+    GameReview,
+    MoveJudgement,
+    PlyReview,
+    judge_move,
+    review_positions,
+)
+from .san_cache import SanCache
+from .snapshot import PositionSnapshot
+from .time_control import ClockState, LimitMode, OverheadEstimator, engine_limit
+from .tracker import GameStateTracker
+from .tree import VariationNode
+
+
+__all__: list[str] = [
+    "AnalysisCache",
+    "AnalysisInfo",
+    "AnalysisStream",
+    "ClockState",
+    "ConvergenceDetector",
+    "GameCore",
+    "GameJournal",
+    "GameReview",
+    "GameStateTracker",
+    "JournalEvent",
+    "JournalRecord",
+    "LegalMoveCache",
+    "LegalMoveMap",
+    "LimitMode",
+    "MoveFacts",
+    "MoveJudgement",
+    "Neighborhood",
+    "OpeningBook",
+    "OverheadEstimator",
+    "PlyReview",
+    "PositionHistory",
+    "PositionSnapshot",
+    "PremoveQueue",
+    "SanCache",
+    "ScoreBound",
+    "VariationNode",
+    "checked_king",
+    "decode_move",
+    "delete_quarantine_attribute",
+    "encode_move",
+    "engine_limit",
+    "judge_move",
+    "make_executable",
+    "path_to_stockfish",
+    "premove_targets",
+    "promote_to_queen",
+    "read_journal",
+    "review_positions",
+]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from enum import IntEnum
+from typing import NamedTuple
+
+from chess import Move
+from chess.engine import InfoDict, Score
+
+from strikechess.logic.snapshot import PositionSnapshot
+
+
+class ScoreBound(IntEnum):
+    """Whether score is exact or only bounds true score of position."""
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+class AnalysisInfo(NamedTuple):
+    """Engine analysis line of one position merged from its info updates."""
+
+    multipv: int = 1
+    depth: int = 0
+    score: Score | None = None
+    pv: tuple[Move, ...] = ()
+    nps: int = 0
+    hashfull: int = 0
+    bound: ScoreBound = ScoreBound.EXACT
+
+    def merged(self, info: InfoDict) -> AnalysisInfo:
+        """Get analysis updated with values present in `info`."""
+        score: Score | None = self.score
+        bound: ScoreBound = self.bound
+
+        if "score" in info:
+            score = info["score"].white()
+            bound = (
+                ScoreBound.LOWER
+                if info.get("lowerbound")
+                else ScoreBound.UPPER if info.get("upperbound") else ScoreBound.EXACT
+            )
+
+        return AnalysisInfo(
+            multipv=self.multipv,
+            depth=info.get("depth", self.depth),
+            score=score,
+            pv=tuple(info.get("pv", self.pv)),
+            nps=info.get("nps", self.nps),
+            hashfull=info.get("hashfull", self.hashfull),
+            bound=bound,
+        )
+
+
+class AnalysisStream:
+    """Latest-wins merge of engine info updates awaiting delivery.
+
+    Cached lines of a position stay in place until search reaches their
+    depth, so analysis never looks shallower than what is already known.
+    """
+
+    __slots__ = ("_lock", "_lines", "_cached", "_snapshot", "_is_pending")
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._lines: dict[int, AnalysisInfo] = {}
+        self._cached: dict[int, AnalysisInfo] = {}
+        self._snapshot: PositionSnapshot | None = None
+        self._is_pending: bool = False
+
+    def reset(
+        self,
+        snapshot: PositionSnapshot | None = None,
+        cached: tuple[AnalysisInfo, ...] = (),
+    ) -> None:
+        """Start merging updates for `snapshot` on top of its `cached` lines."""
+        with self._lock:
+            self._lines = {}
+            self._cached = {line.multipv: line for line in cached}
+            self._snapshot = snapshot
+            self._is_pending = False
+
+    def _deepest_line(self, multipv: int) -> AnalysisInfo:
+        """Get searched line of rank `multipv` unless cached one is deeper."""
+        line: AnalysisInfo | None = self._lines.get(multipv)
+        cached: AnalysisInfo | None = self._cached.get(multipv)
+
+        if line is None or not line.pv:
+            return cached or AnalysisInfo(multipv)
+
+        if cached is not None and cached.depth > line.depth:
+            return cached
+
+        return line
+
+    def merge(self, snapshot: PositionSnapshot, info: InfoDict) -> None:
+        """Merge `info` about `snapshot` unless stream has moved on."""
+        with self._lock:
+            if snapshot is not self._snapshot:
+                return
+
+            multipv: int = info.get("multipv", 1)
+            line: AnalysisInfo = self._lines.get(multipv, AnalysisInfo(multipv))
+            line = line.merged(info)
+            self._lines[multipv] = line
+            self._is_pending = self._is_pending or (
+                bool(line.pv) and self._deepest_line(multipv) is line
+            )
+
+    def take(self) -> tuple[tuple[AnalysisInfo, ...], PositionSnapshot] | None:
+        """Get latest undelivered lines ordered by rank and their snapshot."""
+        with self._lock:
+            if not self._is_pending:
+                return None
+
+            self._is_pending = False
+            lines: tuple[AnalysisInfo, ...] = tuple(
+                line
+                for multipv in sorted(self._lines.keys() | self._cached.keys())
+                if (line := self._deepest_line(multipv)).pv
+            )
+            return lines, self._snapshot
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Final
+
+from chess import Move
+from chess.engine import Cp, Mate, Score
+
+from strikechess.logic.analysis import AnalysisInfo, ScoreBound
+
+
+CACHE_CAPACITY: Final[int] = 200_000
+EVICTION_SHARE: Final[float] = 1 / 10
+EVICTION_CHECK_INTERVAL: Final[int] = 256
+SCHEMA_VERSION: Final[int] = 2
+
+SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS analysis (
+    digest TEXT NOT NULL,
+    key INTEGER NOT NULL,
+    multipv INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    is_mate INTEGER,
+    score INTEGER,
+    bound INTEGER NOT NULL,
+    pv TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (digest, key, multipv)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS analysis_eviction ON analysis (depth, stored_at);
+"""
+SELECT_LINES: Final[str] = """
+SELECT multipv, depth, is_mate, score, bound, pv
+FROM analysis WHERE digest = ? AND key = ? ORDER BY multipv
+"""
+UPSERT_LINE: Final[str] = """
+INSERT INTO analysis VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (digest, key, multipv) DO UPDATE SET
+    depth = excluded.depth,
+    is_mate = excluded.is_mate,
+    score = excluded.score,
+    bound = excluded.bound,
+    pv = excluded.pv,
+    stored_at = excluded.stored_at
+WHERE excluded.depth >= analysis.depth
+"""
+EVICT_LINES: Final[str] = """
+DELETE FROM analysis WHERE (digest, key, multipv) IN (
+    SELECT digest, key, multipv FROM analysis ORDER BY depth, stored_at LIMIT ?
+)
+"""
+
+
+def _signed(key: int) -> int:
+    """Get unsigned 64-bit Zobrist `key` as signed integer that SQLite stores."""
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+def _score_columns(score: Score | None) -> tuple[int | None, int | None]:
+    """Get `score` for White as mate flag and value."""
+    if score is None:
+        return None, None
+    if score.is_mate():
+        return 1, score.mate()
+    return 0, score.score()
+
+
+def _score(is_mate: int | None, value: int | None) -> Score | None:
+    """Get score for White from mate flag and value."""
+    if is_mate is None:
+        return None
+    return Mate(value) if is_mate else Cp(value)
+
+
+class AnalysisCache:
+    """Deepest known analysis lines of positions persisted in SQLite.
+
+    Lines are keyed by digest of engine that found them, Zobrist hash of
+    position, and rank of line, so engines never get lines of another
+    engine whose depths and scores mean something else. Database
+    runs in WAL mode with connection per thread, so lookups on GUI thread
+    are not blocked by engine threads storing results. Above capacity,
+    shallowest and then oldest lines are evicted first, because deep
+    lines cost most to recompute.
+    """
+
+    def __init__(self, path_to_file: str, capacity: int = CACHE_CAPACITY) -> None:
+        self._path_to_file: str = path_to_file
+        self._capacity: int = capacity
+        self._local: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._stores_since_check: int = 0
+
+        try:
+            self._create_schema()
+        except sqlite3.DatabaseError:
+            self.close()
+            os.remove(path_to_file)
+            self._create_schema()
+
+    def __len__(self) -> int:
+        """Get number of cached lines."""
+        return self._connection().execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+
+    def _create_schema(self) -> None:
+        """Create table, dropping lines stored in schema of older version."""
+        connection: sqlite3.Connection = self._connection()
+
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS analysis")
+
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        connection.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get database connection of calling thread."""
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self._path_to_file, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+            with self._lock:
+                self._connections.append(connection)
+
+        return connection
+
+    def get(self, digest: str, key: int) -> tuple[AnalysisInfo, ...]:
+        """Get lines of engine `digest` for position hashed as `key` by rank."""
+        try:
+            rows: list[tuple] = (
+                self._connection()
+                .execute(SELECT_LINES, (digest, _signed(key)))
+                .fetchall()
+            )
+        except sqlite3.Error:
+            return ()
+
+        return tuple(
+            AnalysisInfo(
+                multipv=multipv,
+                depth=depth,
+                score=_score(is_mate, score),
+                pv=tuple(Move.from_uci(uci) for uci in pv.split()),
+                bound=ScoreBound(bound),
+            )
+            for multipv, depth, is_mate, score, bound, pv in rows
+        )
+
+    def store(self, digest: str, key: int, lines: Iterable[AnalysisInfo]) -> None:
+        """Store `lines` of engine `digest` unless shallower than cached ones.
+
+        Lines belong to position hashed as `key`.
+        """
+        stored_at: float = time.time()
+        rows: list[tuple] = [
+            (
+                digest,
+                _signed(key),
+                line.multipv,
+                line.depth,
+                *_score_columns(line.score),
+                int(line.bound),
+                " ".join(move.uci() for move in line.pv),
+                stored_at,
+            )
+            for line in lines
+            if line.pv
+        ]
+
+        if not rows:
+            return
+
+        try:
+            connection: sqlite3.Connection = self._connection()
+
+            with connection:
+                connection.executemany(UPSERT_LINE, rows)
+
+            self._evict_if_full(connection, len(rows))
+        except sqlite3.Error:
+            pass
+
+    def _evict_if_full(self, connection: sqlite3.Connection, row_count: int) -> None:
+        """Evict shallowest lines once in a while if cache is above capacity."""
+        with self._lock:
+            self._stores_since_check += row_count
+
+            if self._stores_since_check < EVICTION_CHECK_INTERVAL:
+                return
+
+            self._stores_since_check = 0
+
+        line_count: int = len(self)
+
+        if line_count > self._capacity:
+            with connection:
+                connection.execute(
+                    EVICT_LINES,
+                    (line_count - int(self._capacity * (1 - EVICTION_SHARE)),),
+                )
+
+    def close_connection(self) -> None:
+        """Close database connection of calling thread if it has one.
+
+        Worker threads call this before they end, because connection of
+        finished thread would otherwise stay open until cache is closed.
+        """
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+
+        if connection is None:
+            return
+
+        self._local.connection = None
+
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+
+        connection.close()
+
+    def close(self) -> None:
+        """Close database connections of all threads."""
+        with self._lock:
+            connections: list[sqlite3.Connection] = self._connections
+            self._connections = []
+
+        for connection in connections:
+            connection.close()
+
+        self._local = threading.local()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Final
+
+from chess import Move
+from chess.engine import InfoDict
+
+from strikechess.logic.review import MATE_SCORE
+
+
+STABLE_DEPTHS: Final[int] = 5
+SCORE_TOLERANCE: Final[int] = 15
+MIN_DEPTH: Final[int] = 12
+
+
+class ConvergenceDetector:
+    """Best move and score of iterative deepening search tracked per depth.
+
+    Search has converged once best move stayed the same and score moved
+    within tolerance over last few depths, from minimum depth on. Scores
+    that only bound true score are ignored, because they come from
+    unfinished iterations.
+    """
+
+    __slots__ = ("_stable_depths", "_score_tolerance", "_min_depth", "_iterations")
+
+    def __init__(
+        self,
+        stable_depths: int = STABLE_DEPTHS,
+        score_tolerance: int = SCORE_TOLERANCE,
+        min_depth: int = MIN_DEPTH,
+    ) -> None:
+        self._stable_depths: int = max(stable_depths, 1)
+        self._score_tolerance: int = score_tolerance
+        self._min_depth: int = min_depth
+        self._iterations: dict[int, tuple[Move, int]] = {}
+
+    def update(self, info: InfoDict) -> bool:
+        """Record best line of `info` and return True if search has converged."""
+        is_best_line: bool = info.get("multipv", 1) == 1
+        is_exact: bool = not info.get("lowerbound") and not info.get("upperbound")
+
+        if is_best_line and is_exact and info.get("pv") and "score" in info:
+            self._iterations[info.get("depth", 0)] = (
+                info["pv"][0],
+                info["score"].white().score(mate_score=MATE_SCORE),
+            )
+
+        return self.is_converged()
+
+    def is_converged(self) -> bool:
+        """Return True if best move and score are stable over last depths."""
+        depths: list[int] = sorted(self._iterations)[-self._stable_depths :]
+
+        if len(depths) < self._stable_depths or depths[-1] < self._min_depth:
+            return False
+
+        best_moves: set[Move] = {self._iterations[depth][0] for depth in depths}
+        scores: list[int] = [self._iterations[depth][1] for depth in depths]
+        return len(best_moves) == 1 and max(scores) - min(scores) <= (
+            self._score_tolerance
+        )
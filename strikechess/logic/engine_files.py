@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+import platform
+import stat
+import subprocess
+
+
+def delete_quarantine_attribute(path_to_file: str) -> None:
+    """Delete quarantine attribute for file at `path_to_file`."""
+    if platform.system() == "Darwin":
+        subprocess.run(
+            ["xattr", "-d", "com.apple.quarantine", path_to_file],
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def make_executable(path_to_file: str) -> None:
+    """Make file at `path_to_file` be executable."""
+    if platform.system() == "Linux":
+        os.chmod(path_to_file, os.stat(path_to_file).st_mode | stat.S_IXUSR)
+
+
+def path_to_stockfish() -> str:
+    """Get path to executable file of default Stockfish 17.1 engine."""
+    system: str = platform.system()
+    extension: str = ".exe" if system == "Windows" else ""
+    return f"strikechess/assets/engines/stockfish-17.1/{system}/stockfish{extension}"
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from chess import Board, Move, Outcome
+
+
+class MoveFacts(NamedTuple):
+    """Facts about pushed move and position it reached."""
+
+    move: Move
+    san: str
+    is_capture: bool
+    is_castling: bool
+    is_check: bool
+    promotion: PieceType | None
+    outcome: Outcome | None
+    fen: str
+    key: int
+    check: Square | None
+
+    @property
+    def is_over(self) -> bool:
+        """Return True if game is over after move."""
+        return self.outcome is not None
+
+
+def checked_king(board: Board) -> Square | None:
+    """Get square of king in check on `board`."""
+    if board.is_check():
+        return board.king(board.turn)
+    return None
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from chess import BLACK, QUEEN, WHITE, Board, Move, SquareSet
+
+from strikechess.logic.facts import MoveFacts, checked_king
+from strikechess.logic.history import PositionHistory
+from strikechess.logic.journal import JournalEvent, JournalRecord
+from strikechess.logic.legal_moves import LegalMoveCache, LegalMoveMap
+from strikechess.logic.premoves import PremoveQueue
+from strikechess.logic.snapshot import PositionSnapshot
+from strikechess.logic.tracker import GameStateTracker
+
+
+def promote_to_queen(turn: Color) -> PieceType:
+    """Get queen as promotion piece type for either side."""
+    return QUEEN
+
+
+class GameCore:
+    """Qt-free game state and logic that can be pickled to worker processes."""
+
+    __slots__ = (
+        "board",
+        "history",
+        "tracker",
+        "_legal_move_cache",
+        "arrow",
+        "premoves",
+        "facts",
+        "_fen",
+        "_check",
+        "snapshot",
+        "ply",
+        "origin_square",
+        "target_square",
+        "player_lost_on_time",
+        "is_history",
+        "has_time_expired",
+        "promotion_piece_type",
+    )
+
+    def __init__(
+        self,
+        promotion_piece_type: Callable[[Color], PieceType | None] = promote_to_queen,
+        board: Board | None = None,
+    ) -> None:
+        self.board: Board = board or Board()
+
+        self.history: PositionHistory = PositionHistory(self.board)
+        self.tracker: GameStateTracker = GameStateTracker(self.history, self.board)
+        self._legal_move_cache: LegalMoveCache = LegalMoveCache()
+        self.arrow: list[tuple[Square, Square]] = []
+        self.premoves: PremoveQueue = PremoveQueue()
+
+        self.facts: MoveFacts | None = None
+        self._fen: str = self.board.fen()
+        self._check: Square | None = checked_king(self.board)
+        self.snapshot: PositionSnapshot = PositionSnapshot.from_board(
+            self.board, 0, self.history.key_at(0), self._fen
+        )
+
+        self.ply: int = 0
+        self.origin_square: Square | None = None
+        self.target_square: Square | None = None
+        self.player_lost_on_time: Color | None = None
+
+        self.is_history: bool = False
+        self.has_time_expired: bool = False
+
+        self.promotion_piece_type: Callable[[Color], PieceType | None] = (
+            promotion_piece_type
+        )
+
+    def __getstate__(self) -> dict[str, object]:
+        """Get picklable state, leaving out injected promotion callback."""
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "promotion_piece_type"
+        }
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore state and promote to queen until callback is injected."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self.promotion_piece_type = promote_to_queen
+
+    @property
+    def fen(self) -> str:
+        """Get current position in FEN format."""
+        return self._fen
+
+    @fen.setter
+    def fen(self, value) -> None:
+        """Set new position in FEN format based on `value`."""
+        self.board.set_fen(value)
+        self._initialize_state()
+
+    @property
+    def check(self) -> Square | None:
+        """Get square of king in check."""
+        return self._check
+
+    @property
+    def result(self) -> str:
+        """Get result of current game."""
+        result: str = "*"
+
+        if self.has_time_expired:
+            if self.player_lost_on_time == BLACK:
+                return "White wins on time"
+            elif self.player_lost_on_time == WHITE:
+                return "Black wins on time"
+        else:
+            result = self.tracker.result
+
+        result_descriptions: dict[str, str] = {
+            "1/2-1/2": "Draw",
+            "0-1": "Black wins",
+            "1-0": "White wins",
+            "*": "Undetermined game",
+        }
+        return result_descriptions[result]
+
+    @property
+    def legal_move_map(self) -> LegalMoveMap:
+        """Get legal moves of current position grouped by squares."""
+        return self._legal_move_cache.get(self.board, self.history.key_at(self.ply))
+
+    @property
+    def turn(self) -> bool:
+        """Return True if White is on turn."""
+        return self.board.turn
+
+    def _initialize_state(self) -> None:
+        """Clear game history and set squares to initial value."""
+        self.ply = 0
+
+        self.has_time_expired = False
+        self.player_lost_on_time = None
+
+        self.history.reset(self.board)
+        self.tracker.reset(self.board)
+        self._legal_move_cache.clear()
+
+        self.facts = None
+        self._cache_position()
+
+        self.clear_arrow()
+        self.premoves.clear()
+        self.reset_selected_squares()
+
+    def _cache_position(self) -> None:
+        """Cache FEN, square of king in check, and snapshot of current position."""
+        self._fen = self.board.fen()
+        self._check = checked_king(self.board)
+        self.snapshot = PositionSnapshot.from_board(
+            self.board, self.ply, self.history.key_at(self.ply), self._fen
+        )
+
+    def _seek(self, ply: int) -> None:
+        """Move board to `ply` of history and update cached state."""
+        self.board = self.history.seek(self.board, self.ply, ply)
+        self.ply = ply
+
+        self.tracker.seek(self.board, ply)
+        self._cache_position()
+
+    def reset_selected_squares(self) -> None:
+        """Reset origin and target squares."""
+        self.origin_square = None
+        self.target_square = None
+
+    def set_selected_square(self, square_index: Square) -> MoveFacts | None:
+        """Set selected square to be `square_index`."""
+        if self.origin_square is None:
+            self.origin_square = square_index
+            return None
+
+        self.target_square = square_index
+        facts: MoveFacts | None = self.find_legal_move(
+            self.origin_square, self.target_square
+        )
+        self.reset_selected_squares()
+        return facts
+
+    def prepare_new_game(self) -> None:
+        """Reset board and initialize state for new game."""
+        self.board.reset()
+        self._initialize_state()
+
+    def declare_time_loss_for(self, player_color: Color) -> None:
+        """Declare that `player_color` has lost on time."""
+        self.player_lost_on_time = player_color
+        self.has_time_expired = True
+        self.premoves.clear()
+
+    def push(self, move: Move) -> MoveFacts | None:
+        """Update game state by pushing `move` and get facts about it."""
+        if not self.is_legal(move):
+            return None
+
+        self.delete_data_after_index()
+
+        is_capture: bool = self.board.is_capture(move)
+        is_castling: bool = self.board.is_castling(move)
+
+        new_move: str = self.board.san_and_push(move)
+        self.ply += 1
+        self.history.append(move, new_move, self.board)
+        self.tracker.seek(self.board, self.ply)
+
+        self._fen = self.board.fen()
+        self._check = checked_king(self.board)
+        self.snapshot = self.snapshot.after(
+            move, self.board, self.history.key_at(self.ply), self._fen
+        )
+
+        self.facts = MoveFacts(
+            move=move,
+            san=new_move,
+            is_capture=is_capture,
+            is_castling=is_castling,
+            is_check=self._check is not None,
+            promotion=move.promotion,
+            outcome=self.tracker.outcome,
+            fen=self._fen,
+            key=self.history.key_at(self.ply),
+            check=self._check,
+        )
+        return self.facts
+
+    def pop_premove(self) -> Move | None:
+        """Get first queued premove if it is legal now, otherwise cancel all."""
+        return self.premoves.pop_legal(self.legal_move_map)
+
+    def set_arrow(self, move: Move) -> None:
+        """Set arrow based on `move`."""
+        self.arrow = [(move.from_square, move.to_square)]
+
+    def clear_arrow(self) -> None:
+        """Clear arrow from board."""
+        self.arrow.clear()
+
+    def set_root_position(self) -> None:
+        """Reset pieces on board to initial position and clear arrow."""
+        self._seek(0)
+
+        self.clear_arrow()
+
+    def legal_targets(self, square: Square | None = None) -> SquareSet:
+        """Get target squares as legal moves for piece at `square`."""
+        return self.legal_move_map.targets(square)
+
+    def find_legal_move(
+        self, origin_square: Square, target_square: Square
+    ) -> MoveFacts | None:
+        """Find and push legal move for `origin_square` and `target_square`."""
+        if origin_square is None or target_square is None:
+            return None
+
+        moves: list[Move] = self.legal_move_map.moves(origin_square, target_square)
+
+        if not moves:
+            return None
+
+        move: Move = moves[0]
+
+        if move.promotion:
+            piece_type: PieceType | None = self.promotion_piece_type(self.board.turn)
+            move = Move(origin_square, target_square, piece_type)
+
+        return self.push(move)
+
+    def piece_at(self, square: Square) -> Piece | None:
+        """Get piece at `square`."""
+        return self.board.piece_at(square)
+
+    def update_state(self, item_index: int) -> None:
+        """Update game state based on `item_index`."""
+        ply: int = self.history.item_ply(item_index)
+        self._seek(ply)
+
+        if ply > 0:
+            self.set_arrow(self.history.move_at(ply))
+        else:
+            self.clear_arrow()
+
+    def switch_variation(self, item_index: int, step: int) -> bool:
+        """Switch to variation `step` away from move at `item_index`."""
+        ply: int = self.history.item_ply(item_index)
+
+        if not 0 < ply <= len(self.history) or not self.history.variations_at(ply):
+            return False
+
+        self._seek(ply - 1)
+        self.history.switch_variation(ply, step)
+        self._seek(ply)
+
+        self.set_arrow(self.history.move_at(ply))
+        return True
+
+    def replay(self, records: Iterable[JournalRecord]) -> None:
+        """Restore game by replaying journaled FEN loads, pushes, and navigation.
+
+        Pushes carry SAN, hash, and FEN of position they reached, so that
+        replay builds history without pushing moves onto any board.
+        """
+        ply: int = self.ply
+
+        for kind, values in records:
+            if kind is JournalEvent.FEN:
+                self.board.set_fen(values[0])
+                self._initialize_state()
+                ply = 0
+            elif kind is JournalEvent.PUSH:
+                move, key, san, fen = values
+                self.history.truncate(ply)
+                self.history.append_fen(move, san, key, fen)
+                ply += 1
+            elif kind is JournalEvent.NAVIGATION:
+                ply = min(values[0], len(self.history))
+            elif kind is JournalEvent.VARIATION:
+                ply, step = values
+                self.history.switch_variation(ply, step)
+
+        self.board = self.history.board_at(ply)
+        self.ply = ply
+
+        self.tracker.reset(self.history.root())
+        self.tracker.seek(self.board, self.ply)
+
+        self.facts = None
+        self._cache_position()
+        self.reset_selected_squares()
+
+        if self.ply > 0:
+            self.set_arrow(self.history.move_at(self.ply))
+        else:
+            self.clear_arrow()
+
+    def delete_data_after_index(self) -> None:
+        """End current line at current ply, keeping later moves as variation."""
+        self.history.truncate(self.ply)
+
+    def is_in_progress(self) -> bool:
+        """Return True if game is in progress."""
+        return bool(self.history)
+
+    def is_legal(self, move: Move) -> bool:
+        """Return True if `move` would be considered as legal."""
+        return move in self.legal_move_map.moves(move.from_square, move.to_square)
+
+    def is_current(self, snapshot: PositionSnapshot) -> bool:
+        """Return True if `snapshot` still shows current position."""
+        return snapshot.is_same_position(self.snapshot)
+
+    def is_over(self) -> bool:
+        """Return True if game is over or time has expired."""
+        return self.tracker.is_over or self.has_time_expired
+
+    def is_valid(self) -> bool:
+        """Return True if board setup is valid."""
+        return self.board.is_valid()
+
+    def is_white_on_turn(self) -> bool:
+        """Return True if White is on turn."""
+        return self.board.turn == WHITE
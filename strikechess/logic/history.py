@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Final, NamedTuple
+
+from chess import Board, Move
+from chess.polyglot import zobrist_hash
+
+from strikechess.logic.tree import VariationNode
+
+
+KEYFRAME_INTERVAL: Final[int] = 32
+REPETITION_WINDOW: Final[int] = 100
+
+
+def encode_move(move: Move) -> int:
+    """Encode `move` as 16-bit integer of from, to, and promotion bits."""
+    return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
+
+def decode_move(encoded_move: int) -> Move:
+    """Decode `encoded_move` from its 16-bit integer representation."""
+    promotion: int = encoded_move >> 12
+    return Move(
+        from_square=encoded_move & 0x3F,
+        to_square=encoded_move >> 6 & 0x3F,
+        promotion=promotion or None,
+    )
+
+
+class Neighborhood(NamedTuple):
+    """Plies around one ply of line, kept as nodes until positions are needed.
+
+    Nodes never change once created, so other threads can rebuild positions
+    from neighborhood while line itself moves on.
+    """
+
+    ply: int
+    first_ply: int
+    keyframe_ply: int
+    nodes: tuple[VariationNode, ...]
+
+    @property
+    def key(self) -> int:
+        """Get Zobrist hash of position at `ply`."""
+        return self.nodes[self.ply - self.keyframe_ply].key
+
+    def keys(self) -> set[int]:
+        """Get Zobrist hashes of positions at all plies of neighborhood."""
+        return {node.key for node in self.nodes[self.first_ply - self.keyframe_ply :]}
+
+    def positions(self) -> list[tuple[int, str]]:
+        """Get hash and FEN of plies of neighborhood, nearest to `ply` first.
+
+        Of two plies equally near, the later one comes first, because
+        history is mostly stepped through forward.
+        """
+        board: Board = self.nodes[0].keyframe.copy(stack=False)
+        fens: dict[int, str] = {}
+
+        for node_ply, node in enumerate(self.nodes, self.keyframe_ply):
+            if node_ply > self.keyframe_ply:
+                board.push(decode_move(node.move))
+
+            if node_ply >= self.first_ply:
+                fens[node_ply] = board.fen()
+
+        return [
+            (self.nodes[node_ply - self.keyframe_ply].key, fens[node_ply])
+            for node_ply in sorted(
+                fens, key=lambda node_ply: (abs(node_ply - self.ply), -node_ply)
+            )
+        ]
+
+
+class PositionHistory:
+    """Current line through variation tree with periodic keyframe snapshots."""
+
+    __slots__ = ("_line",)
+
+    def __init__(self, root: Board | None = None) -> None:
+        self._line: list[VariationNode] = []
+
+        self.reset(root or Board())
+
+    def __getstate__(
+        self,
+    ) -> tuple[list[tuple[int, ...]], list[str], list[Board | None], int]:
+        """Get variation tree flattened so that deep lines pickle safely."""
+        nodes: list[VariationNode] = self._line[0].preorder()
+        indices: dict[int, int] = {id(node): index for index, node in enumerate(nodes)}
+        rows: list[tuple[int, ...]] = [
+            (
+                -1 if node.parent is None else indices[id(node.parent)],
+                node.move,
+                node.key,
+                node.halfmove_clock,
+            )
+            for node in nodes
+        ]
+        sans: list[str] = [node.san for node in nodes]
+        keyframes: list[Board | None] = [node.keyframe for node in nodes]
+        return rows, sans, keyframes, indices[id(self._line[-1])]
+
+    def __setstate__(
+        self, state: tuple[list[tuple[int, ...]], list[str], list[Board | None], int]
+    ) -> None:
+        """Rebuild variation tree and current line from flattened `state`."""
+        rows, sans, keyframes, last_index = state
+        nodes: list[VariationNode] = []
+
+        for (parent_index, move, key, halfmove_clock), san, keyframe in zip(
+            rows, sans, keyframes
+        ):
+            parent: VariationNode | None = (
+                None if parent_index < 0 else nodes[parent_index]
+            )
+            node: VariationNode = VariationNode(
+                move, parent, san, key, halfmove_clock, keyframe
+            )
+            nodes.append(node)
+
+            if parent is not None:
+                parent.children.append(node)
+
+        node = nodes[last_index]
+        self._line = [node]
+
+        while node.parent is not None:
+            node = node.parent
+            self._line.append(node)
+
+        self._line.reverse()
+
+    def __len__(self) -> int:
+        """Get number of plies played from root position."""
+        return len(self._line) - 1
+
+    @property
+    def ply_offset(self) -> int:
+        """Get 1 if Black moves first to make room for White's ellipsis."""
+        return 0 if self._line[0].keyframe.turn else 1
+
+    @property
+    def item_count(self) -> int:
+        """Get number of table items, including ellipsis if needed."""
+        return len(self) + self.ply_offset if len(self) else 0
+
+    def reset(self, root: Board) -> None:
+        """Clear variation tree and start it from `root` position."""
+        root_node: VariationNode = VariationNode(
+            move=0,
+            parent=None,
+            san="",
+            key=zobrist_hash(root),
+            halfmove_clock=root.halfmove_clock,
+            keyframe=root.copy(stack=False),
+        )
+        self._line = [root_node]
+
+    def root(self) -> Board:
+        """Get board with root position and empty move stack."""
+        return self._line[0].keyframe.copy(stack=False)
+
+    def append(self, move: Move, san: str, board: Board) -> None:
+        """Append `move` with its `san`, given `board` after it was pushed."""
+        self._append_node(
+            move,
+            san,
+            lambda: zobrist_hash(board),
+            board.halfmove_clock,
+            lambda: board.copy(stack=False),
+        )
+
+    def append_fen(self, move: Move, san: str, key: int, fen: str) -> None:
+        """Append `move` with its `san`, given `fen` and `key` of position after."""
+        self._append_node(
+            move,
+            san,
+            lambda: key,
+            int(fen.split()[4]),
+            lambda: Board(fen),
+        )
+
+    def _append_node(
+        self,
+        move: Move,
+        san: str,
+        key: Callable[[], int],
+        halfmove_clock: int,
+        keyframe: Callable[[], Board],
+    ) -> None:
+        """Follow or add child for `move`, building its `key` and `keyframe` lazily."""
+        parent: VariationNode = self._line[-1]
+        encoded_move: int = encode_move(move)
+        node: VariationNode | None = parent.child(encoded_move)
+
+        if node is None:
+            is_keyframe: bool = len(self._line) % KEYFRAME_INTERVAL == 0
+            node = VariationNode(
+                move=encoded_move,
+                parent=parent,
+                san=san,
+                key=key(),
+                halfmove_clock=halfmove_clock,
+                keyframe=keyframe() if is_keyframe else None,
+            )
+            parent.children.append(node)
+
+        self._line.append(node)
+
+    def truncate(self, ply: int) -> None:
+        """End current line at `ply`, keeping later moves as variation."""
+        del self._line[ply + 1 :]
+
+    def move_at(self, ply: int) -> Move:
+        """Get move that was played to reach `ply` from previous one."""
+        return decode_move(self._line[ply].move)
+
+    def key_at(self, ply: int) -> int:
+        """Get Zobrist hash of position at `ply`."""
+        return self._line[ply].key
+
+    def san_at(self, ply: int) -> str:
+        """Get SAN of move that was played to reach `ply`."""
+        return self._line[ply].san
+
+    def variations_at(self, ply: int) -> list[str]:
+        """Get SAN of moves played instead of move that reached `ply`."""
+        node: VariationNode = self._line[ply]
+        return [sibling.san for sibling in node.siblings if sibling is not node]
+
+    def switch_variation(self, ply: int, step: int) -> bool:
+        """Switch line at `ply` to sibling `step` away and follow its main line."""
+        siblings: list[VariationNode] = self._line[ply].siblings
+
+        if ply == 0 or len(siblings) < 2:
+            return False
+
+        sibling_index: int = siblings.index(self._line[ply]) + step
+        node: VariationNode = siblings[sibling_index % len(siblings)]
+
+        del self._line[ply:]
+        self._line.append(node)
+        self._line.extend(node.main_line())
+        return True
+
+    def item_text(self, item_index: int) -> str | None:
+        """Get SAN or ellipsis for table item at `item_index`."""
+        ply: int = item_index - self.ply_offset + 1
+
+        if 0 <= item_index < self.item_count:
+            return self._line[ply].san if ply > 0 else "..."
+
+        return None
+
+    def item_ply(self, item_index: int) -> int:
+        """Get ply reached after table item at `item_index`."""
+        return max(item_index - self.ply_offset + 1, 0)
+
+    def ply_item(self, ply: int) -> int:
+        """Get table item index showing move that reached `ply`."""
+        return ply + self.ply_offset - 1 if ply > 0 else -1
+
+    def repetition_base(self, ply: int) -> int:
+        """Get earliest ply needed to detect repetitions at `ply`.
+
+        Beyond the fifty-move window a draw can be claimed anyway, so
+        older plies never change whether the game is over.
+        """
+        halfmove_clock: int = min(self._line[ply].halfmove_clock, REPETITION_WINDOW)
+        return max(ply - halfmove_clock, 0)
+
+    def board_at(self, ply: int) -> Board:
+        """Rebuild board at `ply` from keyframe preceding repetition base."""
+        repetition_base: int = self.repetition_base(ply)
+        keyframe_ply: int = repetition_base - repetition_base % KEYFRAME_INTERVAL
+        board: Board = self._line[keyframe_ply].keyframe.copy(stack=False)
+
+        for node in self._line[keyframe_ply + 1 : ply + 1]:
+            board.push(decode_move(node.move))
+
+        return board
+
+    def neighborhood(self, ply: int, radius: int) -> Neighborhood:
+        """Get plies within `radius` of `ply` without rebuilding their boards."""
+        first_ply: int = max(ply - radius, 0)
+        last_ply: int = min(ply + radius, len(self))
+        keyframe_ply: int = first_ply - first_ply % KEYFRAME_INTERVAL
+        return Neighborhood(
+            ply,
+            first_ply,
+            keyframe_ply,
+            tuple(self._line[keyframe_ply : last_ply + 1]),
+        )
+
+    def seek(self, board: Board, board_ply: int, ply: int) -> Board:
+        """Get board at `ply` by stepping `board` at `board_ply` or rebuilding."""
+        stack_base: int = board_ply - len(board.move_stack)
+        is_reachable: bool = (
+            stack_base <= self.repetition_base(ply)
+            and abs(ply - board_ply) < KEYFRAME_INTERVAL
+        )
+
+        if not is_reachable:
+            return self.board_at(ply)
+
+        while board_ply > ply:
+            board.pop()
+            board_ply -= 1
+
+        while board_ply < ply:
+            board_ply += 1
+            board.push(decode_move(self._line[board_ply].move))
+
+        return board
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from enum import IntEnum
+from typing import Final, NamedTuple
+
+from chess import Move
+from chess.engine import Cp, Mate, Score
+
+from strikechess.logic.facts import MoveFacts
+from strikechess.logic.history import decode_move, encode_move
+
+
+FILE_MAGIC: Final[bytes] = b"SCJ\x01"
+SYNC_INTERVAL: Final[float] = 0.2
+
+RECORD_HEADER: Final[struct.Struct] = struct.Struct("<BHI")
+PUSH: Final[struct.Struct] = struct.Struct("<HQ")
+NAVIGATION: Final[struct.Struct] = struct.Struct("<I")
+VARIATION: Final[struct.Struct] = struct.Struct("<Ii")
+CLOCKS: Final[struct.Struct] = struct.Struct("<dd")
+ENGINE_MOVE: Final[struct.Struct] = struct.Struct("<QH")
+ENGINE_SCORE: Final[struct.Struct] = struct.Struct("<Q?i")
+
+
+class JournalEvent(IntEnum):
+    """Kinds of game events recorded in journal."""
+
+    FEN = 1
+    PUSH = 2
+    NAVIGATION = 3
+    VARIATION = 4
+    CLOCKS = 5
+    ENGINE_MOVE = 6
+    ENGINE_SCORE = 7
+
+
+class JournalRecord(NamedTuple):
+    """Decoded journal record with event kind and its values."""
+
+    kind: JournalEvent
+    values: tuple
+
+
+class _Operation(IntEnum):
+    """Operations that GUI thread hands over to journal writer thread."""
+
+    APPEND = 1
+    RESTART = 2
+    SYNC = 3
+    CLOSE = 4
+
+
+def _decode_fen(payload: bytes) -> tuple[str]:
+    """Get FEN from `payload`."""
+    return (payload.decode(),)
+
+
+def _decode_push(payload: bytes) -> tuple[Move, int, str, str]:
+    """Get move, its SAN, and hash and FEN of position after it from `payload`."""
+    encoded_move, key = PUSH.unpack_from(payload)
+    san, fen = payload[PUSH.size :].decode().split(" ", 1)
+    return decode_move(encoded_move), key, san, fen
+
+
+def _decode_engine_move(payload: bytes) -> tuple[int, Move]:
+    """Get position hash and engine's best move from `payload`."""
+    key, encoded_move = ENGINE_MOVE.unpack(payload)
+    return key, decode_move(encoded_move)
+
+
+def _decode_engine_score(payload: bytes) -> tuple[int, Score]:
+    """Get position hash and engine's score for White from `payload`."""
+    key, is_mate, value = ENGINE_SCORE.unpack(payload)
+    return key, Mate(value) if is_mate else Cp(value)
+
+
+EVENTS: Final[dict[int, JournalEvent]] = {int(event): event for event in JournalEvent}
+DECODERS: Final[dict[JournalEvent, Callable[[bytes], tuple]]] = {
+    JournalEvent.FEN: _decode_fen,
+    JournalEvent.PUSH: _decode_push,
+    JournalEvent.NAVIGATION: NAVIGATION.unpack,
+    JournalEvent.VARIATION: VARIATION.unpack,
+    JournalEvent.CLOCKS: CLOCKS.unpack,
+    JournalEvent.ENGINE_MOVE: _decode_engine_move,
+    JournalEvent.ENGINE_SCORE: _decode_engine_score,
+}
+
+
+def encode_record(kind: JournalEvent, payload: bytes) -> bytes:
+    """Get `payload` of `kind` framed with its length and checksum."""
+    return RECORD_HEADER.pack(kind, len(payload), zlib.crc32(payload, kind)) + payload
+
+
+def read_journal(path_to_file: str) -> tuple[list[JournalRecord], int]:
+    """Get records of journal file and length of its intact part.
+
+    Reading stops at first torn or corrupt record, which is what a crash
+    in the middle of a write leaves behind.
+    """
+    try:
+        with open(path_to_file, "rb") as journal_file:
+            data: bytes = journal_file.read()
+    except FileNotFoundError:
+        return [], 0
+
+    if not data.startswith(FILE_MAGIC):
+        return [], 0
+
+    records: list[JournalRecord] = []
+    offset: int = len(FILE_MAGIC)
+
+    while offset + RECORD_HEADER.size <= len(data):
+        kind, length, checksum = RECORD_HEADER.unpack_from(data, offset)
+        start: int = offset + RECORD_HEADER.size
+        payload: bytes = data[start : start + length]
+
+        if len(payload) < length or zlib.crc32(payload, kind) != checksum:
+            break
+
+        try:
+            records.append(JournalRecord(EVENTS[kind], DECODERS[kind](payload)))
+        except (KeyError, UnicodeDecodeError, struct.error):
+            break
+
+        offset = start + length
+
+    return records, offset
+
+
+class GameJournal:
+    """Append-only journal of game events with group-committed writes."""
+
+    def __init__(self, path_to_file: str, sync_interval: float = SYNC_INTERVAL) -> None:
+        self._sync_interval: float = sync_interval
+
+        self.records: list[JournalRecord]
+        self.records, intact_length = read_journal(path_to_file)
+
+        self._file_descriptor: int = os.open(
+            path_to_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        os.ftruncate(self._file_descriptor, intact_length)
+
+        if not intact_length:
+            os.write(self._file_descriptor, FILE_MAGIC)
+
+        self._engine_move: tuple[int, Move] | None = None
+        self._engine_score: tuple[int, Score] | None = None
+
+        self._queue: queue.SimpleQueue[tuple[_Operation, object]] = queue.SimpleQueue()
+        self._writer: threading.Thread = threading.Thread(
+            target=self._write_records,
+            name="GameJournalWriter",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _append(self, kind: JournalEvent, payload: bytes) -> None:
+        """Hand record of `kind` with `payload` over to writer thread."""
+        self._queue.put((_Operation.APPEND, encode_record(kind, payload)))
+
+    def _write(self, chunks: list[bytes]) -> bool:
+        """Write `chunks` in one system call and get whether any were written."""
+        if not chunks:
+            return False
+
+        os.write(self._file_descriptor, b"".join(chunks))
+        chunks.clear()
+        return True
+
+    def _write_records(self) -> None:
+        """Write queued records in batches and sync at bounded interval."""
+        chunks: list[bytes] = []
+        sync_deadline: float | None = None
+
+        while True:
+            timeout: float | None = (
+                None
+                if sync_deadline is None
+                else max(sync_deadline - time.monotonic(), 0.0)
+            )
+            operations: list[tuple[_Operation, object]] = []
+
+            try:
+                operations.append(self._queue.get(timeout=timeout))
+
+                while True:
+                    operations.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            for operation, payload in operations:
+                if operation is _Operation.APPEND:
+                    chunks.append(payload)
+                    continue
+
+                if operation is _Operation.RESTART:
+                    chunks.clear()
+                    os.ftruncate(self._file_descriptor, 0)
+                    chunks.append(FILE_MAGIC + payload)
+                    continue
+
+                self._write(chunks)
+                os.fsync(self._file_descriptor)
+                sync_deadline = None
+
+                if operation is _Operation.CLOSE:
+                    os.close(self._file_descriptor)
+                    payload.set()
+                    return
+
+                payload.set()
+
+            if self._write(chunks) and sync_deadline is None:
+                sync_deadline = time.monotonic() + self._sync_interval
+
+            if sync_deadline is not None and time.monotonic() >= sync_deadline:
+                os.fsync(self._file_descriptor)
+                sync_deadline = None
+
+    def _wait_for(self, operation: _Operation) -> None:
+        """Queue `operation` and wait until writer thread has done it."""
+        if not self._writer.is_alive():
+            return
+
+        done: threading.Event = threading.Event()
+        self._queue.put((operation, done))
+        done.wait()
+
+    def restart(self, fen: str) -> None:
+        """Start journal over from position given as `fen`."""
+        self._engine_move = None
+        self._engine_score = None
+        self._queue.put(
+            (_Operation.RESTART, encode_record(JournalEvent.FEN, fen.encode()))
+        )
+
+    def record_push(self, facts: MoveFacts) -> None:
+        """Record move described by `facts`."""
+        self._append(
+            JournalEvent.PUSH,
+            PUSH.pack(encode_move(facts.move), facts.key)
+            + f"{facts.san} {facts.fen}".encode(),
+        )
+
+    def record_navigation(self, ply: int) -> None:
+        """Record that position at `ply` of current line is shown."""
+        self._append(JournalEvent.NAVIGATION, NAVIGATION.pack(ply))
+
+    def record_variation(self, ply: int, step: int) -> None:
+        """Record switch to variation `step` away from move reaching `ply`."""
+        self._append(JournalEvent.VARIATION, VARIATION.pack(ply, step))
+
+    def record_clocks(self, white_time: float, black_time: float) -> None:
+        """Record remaining time of both clocks at move boundary."""
+        self._append(JournalEvent.CLOCKS, CLOCKS.pack(white_time, black_time))
+
+    def record_engine_move(self, key: int, move: Move) -> None:
+        """Record engine's best `move` in position hashed as `key`."""
+        if self._engine_move == (key, move):
+            return
+
+        self._engine_move = (key, move)
+        self._append(JournalEvent.ENGINE_MOVE, ENGINE_MOVE.pack(key, encode_move(move)))
+
+    def record_engine_score(self, key: int, score: Score) -> None:
+        """Record engine's `score` for White in position hashed as `key`."""
+        if self._engine_score == (key, score):
+            return
+
+        self._engine_score = (key, score)
+        is_mate: bool = score.is_mate()
+        value: int = score.mate() if is_mate else score.score()
+        self._append(JournalEvent.ENGINE_SCORE, ENGINE_SCORE.pack(key, is_mate, value))
+
+    def latest(self, kind: JournalEvent) -> tuple | None:
+        """Get values of last recovered record of `kind`."""
+        for record in reversed(self.records):
+            if record.kind is kind:
+                return record.values
+        return None
+
+    def flush(self) -> None:
+        """Write and sync all records queued so far."""
+        self._wait_for(_Operation.SYNC)
+
+    def close(self) -> None:
+        """Write and sync remaining records and stop writer thread."""
+        self._wait_for(_Operation.CLOSE)
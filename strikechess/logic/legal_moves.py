@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Final
+
+from chess import BB_SQUARES, Board, Move, SquareSet
+
+
+CACHE_SIZE: Final[int] = 64
+
+
+class LegalMoveMap:
+    """Legal moves of one position grouped by origin and target squares."""
+
+    __slots__ = ("key", "_moves", "_targets")
+
+    def __init__(self, board: Board, key: int) -> None:
+        self.key: int = key
+
+        self._moves: dict[tuple[Square, Square], list[Move]] = {}
+        self._targets: dict[Square, int] = {}
+
+        for move in board.generate_legal_moves():
+            squares: tuple[Square, Square] = (move.from_square, move.to_square)
+            self._moves.setdefault(squares, []).append(move)
+            self._targets[move.from_square] = (
+                self._targets.get(move.from_square, 0) | BB_SQUARES[move.to_square]
+            )
+
+    def __len__(self) -> int:
+        """Get number of legal moves, promotion variants included."""
+        return sum(len(moves) for moves in self._moves.values())
+
+    def targets(self, square: Square | None) -> SquareSet:
+        """Get legal target squares for piece at `square`."""
+        if square is None:
+            return SquareSet()
+        return SquareSet(self._targets.get(square, 0))
+
+    def moves(self, origin_square: Square, target_square: Square) -> list[Move]:
+        """Get legal moves from `origin_square` to `target_square`."""
+        return self._moves.get((origin_square, target_square), [])
+
+    def is_legal(self, origin_square: Square | None, target_square: Square) -> bool:
+        """Return True if any legal move goes from origin to target square."""
+        if origin_square is None:
+            return False
+        return bool(self._targets.get(origin_square, 0) & BB_SQUARES[target_square])
+
+
+class LegalMoveCache:
+    """Bounded cache of legal move maps keyed by position hash."""
+
+    __slots__ = ("_size", "_maps")
+
+    def __init__(self, size: int = CACHE_SIZE) -> None:
+        self._size: int = size
+        self._maps: dict[int, LegalMoveMap] = {}
+
+    def __getstate__(self) -> tuple[int]:
+        """Get cache size only, since maps are cheap to rebuild after unpickling."""
+        return (self._size,)
+
+    def __setstate__(self, state: tuple[int]) -> None:
+        """Restore empty cache of size stored in `state`."""
+        self.__init__(*state)
+
+    def get(self, board: Board, key: int) -> LegalMoveMap:
+        """Get legal move map for `board` hashed as `key`."""
+        legal_move_map: LegalMoveMap | None = self._maps.pop(key, None)
+
+        if legal_move_map is None:
+            legal_move_map = LegalMoveMap(board, key)
+
+            if len(self._maps) >= self._size:
+                del self._maps[next(iter(self._maps))]
+
+        self._maps[key] = legal_move_map
+        return legal_move_map
+
+    def clear(self) -> None:
+        """Forget all cached legal move maps."""
+        self._maps.clear()
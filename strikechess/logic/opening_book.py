@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from random import Random
+from typing import Final
+
+from chess import Board, Move
+from chess.polyglot import Entry, MemoryMappedReader, open_reader
+
+
+MAX_VARIETY: Final[int] = 100
+
+
+class OpeningBook:
+    """Polyglot opening book memory-mapped from `.bin` file.
+
+    Entries are sorted by Zobrist hash on disk, so position is looked up
+    with binary search over mapped file instead of reading it into memory.
+    """
+
+    __slots__ = ("path", "_reader", "_random")
+
+    def __init__(self, path: str, random: Random | None = None) -> None:
+        self.path: str = path
+
+        self._reader: MemoryMappedReader = open_reader(path)
+        self._random: Random = random or Random()
+
+    def __len__(self) -> int:
+        """Get number of entries in book."""
+        return len(self._reader)
+
+    def entries(self, board: Board) -> list[Entry]:
+        """Get book entries with legal moves for position of `board`."""
+        return list(self._reader.find_all(board))
+
+    def choose(self, board: Board, variety: int = MAX_VARIETY) -> Move | None:
+        """Get move for `board` chosen by weight, or None if it is out of book.
+
+        Only moves with weight within `variety` percent of weight of best
+        move are chosen from, so variety of 0 always plays best book move
+        and variety of 100 plays any book move.
+        """
+        entries: list[Entry] = self.entries(board)
+
+        if not entries:
+            return None
+
+        minimum_weight: float = max(entry.weight for entry in entries) * (
+            1 - min(max(variety, 0), MAX_VARIETY) / MAX_VARIETY
+        )
+        candidates: list[Entry] = [
+            entry for entry in entries if entry.weight >= minimum_weight
+        ]
+        chosen: Entry = self._random.choices(
+            candidates, weights=[entry.weight for entry in candidates]
+        )[0]
+        return chosen.move
+
+    def close(self) -> None:
+        """Unmap book file."""
+        self._reader.close()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+
+from chess import (
+    BB_SQUARES,
+    KING,
+    PAWN,
+    QUEEN,
+    Board,
+    Move,
+    Piece,
+    Square,
+    SquareSet,
+    square_file,
+    square_rank,
+)
+
+from strikechess.logic.legal_moves import LegalMoveMap
+
+
+def premove_targets(board: Board, square: Square) -> SquareSet:
+    """Get squares that piece at `square` could reach once opponent has moved.
+
+    Pieces are moved as if board was empty, since opponent's move can both
+    open lines and give something to capture. Kings on their initial
+    squares may also castle to either side.
+    """
+    piece: Piece | None = board.piece_at(square)
+
+    if piece is None:
+        return SquareSet()
+
+    lone_piece_board: Board = Board(None)
+    lone_piece_board.set_piece_at(square, piece)
+    targets: int = lone_piece_board.attacks_mask(square)
+    rank: int = square_rank(square)
+    step: int = 8 if piece.color else -8
+
+    if piece.piece_type == PAWN and 0 < rank < 7:
+        targets |= BB_SQUARES[square + step]
+
+        if rank == (1 if piece.color else 6):
+            targets |= BB_SQUARES[square + 2 * step]
+    elif piece.piece_type == KING and square_file(square) == 4:
+        if rank == (0 if piece.color else 7):
+            targets |= BB_SQUARES[square - 2] | BB_SQUARES[square + 2]
+
+    return SquareSet(targets)
+
+
+class PremoveQueue:
+    """Moves queued by player while engine thinks, played one per engine move."""
+
+    __slots__ = ("_moves", "_board", "_board_key")
+
+    def __init__(self) -> None:
+        self._moves: deque[Move] = deque()
+
+        self._board: Board | None = None
+        self._board_key: int | None = None
+
+    def __len__(self) -> int:
+        """Get number of queued premoves."""
+        return len(self._moves)
+
+    def __iter__(self) -> Iterator[Move]:
+        """Iterate over queued premoves in order they will be played."""
+        return iter(self._moves)
+
+    def squares(self) -> SquareSet:
+        """Get origin and target squares of all queued premoves."""
+        squares: SquareSet = SquareSet()
+
+        for move in self._moves:
+            squares.add(move.from_square)
+            squares.add(move.to_square)
+
+        return squares
+
+    def board_after(self, board: Board, key: int) -> Board:
+        """Get `board` with pieces moved by queued premoves.
+
+        Board is cached until queue changes or `key` of position differs,
+        so it is shared between calls and must not be modified.
+        """
+        if self._board is None or self._board_key != key:
+            self._board = self._play_on(board.copy(stack=False))
+            self._board_key = key
+
+        return self._board
+
+    def _play_on(self, premove_board: Board) -> Board:
+        """Move pieces of queued premoves on `premove_board` and get it.
+
+        Castling king also moves its rook and pawns reaching last rank
+        become queens, as premoves would once played.
+        """
+        for move in self._moves:
+            piece: Piece | None = premove_board.remove_piece_at(move.from_square)
+
+            if piece is None:
+                continue
+
+            if piece.piece_type == KING and abs(move.to_square - move.from_square) == 2:
+                is_kingside: bool = move.to_square > move.from_square
+                rook: Piece | None = premove_board.remove_piece_at(
+                    move.from_square + (3 if is_kingside else -4)
+                )
+
+                if rook is not None:
+                    premove_board.set_piece_at(
+                        move.from_square + (1 if is_kingside else -1), rook
+                    )
+            elif piece.piece_type == PAWN and square_rank(move.to_square) in (0, 7):
+                piece = Piece(QUEEN, piece.color)
+
+            premove_board.set_piece_at(move.to_square, piece)
+
+        return premove_board
+
+    def append(self, origin_square: Square, target_square: Square) -> None:
+        """Queue premove from `origin_square` to `target_square`."""
+        self._moves.append(Move(origin_square, target_square))
+        self._board = None
+
+    def pop_legal(self, legal_move_map: LegalMoveMap) -> Move | None:
+        """Pop first premove if legal in position of `legal_move_map`.
+
+        Premoves that became illegal clear whole queue, because later ones
+        were planned on top of it. Pawns reaching last rank promote to queen.
+        """
+        if not self._moves:
+            return None
+
+        move: Move = self._moves.popleft()
+        self._board = None
+        moves: list[Move] = legal_move_map.moves(move.from_square, move.to_square)
+
+        if not moves:
+            self._moves.clear()
+            return None
+
+        if moves[0].promotion:
+            return Move(move.from_square, move.to_square, QUEEN)
+        return moves[0]
+
+    def clear(self) -> None:
+        """Cancel all queued premoves."""
+        self._moves.clear()
+        self._board = None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Final, NamedTuple
+
+from chess import WHITE, Board, Move
+from chess.engine import Score
+
+from strikechess.logic.history import PositionHistory
+
+
+INACCURACY_LOSS: Final[int] = 50
+MISTAKE_LOSS: Final[int] = 100
+BLUNDER_LOSS: Final[int] = 300
+MATE_SCORE: Final[int] = 10_000
+
+
+class MoveJudgement(StrEnum):
+    """Annotation symbols for moves that lose evaluation."""
+
+    Inaccuracy = "?!"
+    Mistake = "?"
+    Blunder = "??"
+
+
+class PlyReview(NamedTuple):
+    """Engine evaluation of position at ply of reviewed line."""
+
+    ply: int
+    score: Score
+    best_move: Move | None
+
+
+def review_positions(history: PositionHistory) -> list[tuple[int, str]]:
+    """Get ply and FEN of every position in current line of `history`."""
+    board: Board = history.root()
+    positions: list[tuple[int, str]] = [(0, board.fen())]
+
+    for ply in range(1, len(history) + 1):
+        board.push(history.move_at(ply))
+        positions.append((ply, board.fen()))
+
+    return positions
+
+
+def judge_move(before: Score, after: Score, turn: Color) -> MoveJudgement | None:
+    """Get judgement of move by `turn` from White's `before` to `after` scores."""
+    loss: int = before.score(mate_score=MATE_SCORE) - after.score(mate_score=MATE_SCORE)
+
+    if turn != WHITE:
+        loss = -loss
+
+    if loss >= BLUNDER_LOSS:
+        return MoveJudgement.Blunder
+    if loss >= MISTAKE_LOSS:
+        return MoveJudgement.Mistake
+    if loss >= INACCURACY_LOSS:
+        return MoveJudgement.Inaccuracy
+    return None
+
+
+class GameReview:
+    """Evaluations of reviewed line collected in any order of completion."""
+
+    __slots__ = ("_root_turn", "_reviews", "judgements")
+
+    def __init__(self, root_turn: Color) -> None:
+        self._root_turn: Color = root_turn
+        self._reviews: dict[int, PlyReview] = {}
+        self.judgements: dict[int, MoveJudgement] = {}
+
+    def __len__(self) -> int:
+        """Get number of reviewed positions."""
+        return len(self._reviews)
+
+    def get(self, ply: int) -> PlyReview | None:
+        """Get review of position at `ply`."""
+        return self._reviews.get(ply)
+
+    def add(self, review: PlyReview) -> list[int]:
+        """Add `review` and get plies of moves whose judgement is now known."""
+        self._reviews[review.ply] = review
+        judged_plies: list[int] = []
+
+        for ply in (review.ply, review.ply + 1):
+            before: PlyReview | None = self._reviews.get(ply - 1)
+            after: PlyReview | None = self._reviews.get(ply)
+
+            if ply == 0 or before is None or after is None:
+                continue
+
+            turn: Color = self._root_turn if ply % 2 else not self._root_turn
+            judgement: MoveJudgement | None = judge_move(
+                before.score, after.score, turn
+            )
+
+            if judgement is not None:
+                self.judgements[ply] = judgement
+
+            judged_plies.append(ply)
+
+        return judged_plies
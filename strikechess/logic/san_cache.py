@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Final
+
+from chess import WHITE, Board, Move
+
+
+SAN_CACHE_SIZE: Final[int] = 50_000
+
+
+class SanCache:
+    """Bounded cache of SAN keyed by position hash and move played in it.
+
+    Position after a cached move is keyed by hashing its parent's key
+    with the move, so a PV prefix seen before costs dictionary lookups
+    only, without pushing moves onto a board.
+    """
+
+    __slots__ = ("_size", "_sans", "conversions")
+
+    def __init__(self, size: int = SAN_CACHE_SIZE) -> None:
+        self._size: int = size
+        self._sans: dict[tuple[int, Move], str] = {}
+        self.conversions: int = 0
+
+    def __len__(self) -> int:
+        """Get number of cached SAN moves."""
+        return len(self._sans)
+
+    def sans(self, board: Board, key: int, moves: Sequence[Move]) -> list[str]:
+        """Get SAN of `moves` played from `board` hashed as `key`."""
+        sans: list[str] = []
+        line_board: Board | None = None
+
+        for ply, move in enumerate(moves):
+            san: str | None = self._sans.get((key, move))
+
+            if san is None:
+                if line_board is None:
+                    line_board = board.copy(stack=False)
+
+                    for earlier_move in moves[:ply]:
+                        line_board.push(earlier_move)
+
+                san = line_board.san(move)
+                self.conversions += 1
+
+                if len(self._sans) >= self._size:
+                    self._sans.clear()
+
+                self._sans[(key, move)] = san
+
+            if line_board is not None:
+                line_board.push(move)
+
+            sans.append(san)
+            key = hash((key, move))
+
+        return sans
+
+    def variation_san(self, board: Board, key: int, moves: Sequence[Move]) -> str:
+        """Get `moves` played from `board` hashed as `key` in numbered SAN."""
+        fullmove_number: int = board.fullmove_number
+        turn: bool = board.turn
+        numbered_sans: list[str] = []
+
+        for san in self.sans(board, key, moves):
+            if turn == WHITE:
+                numbered_sans.append(f"{fullmove_number}. {san}")
+            elif not numbered_sans:
+                numbered_sans.append(f"{fullmove_number}...{san}")
+            else:
+                numbered_sans.append(san)
+
+            if turn != WHITE:
+                fullmove_number += 1
+
+            turn = not turn
+
+        return " ".join(numbered_sans)
+
+    def clear(self) -> None:
+        """Forget all cached SAN moves."""
+        self._sans.clear()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from chess import Board, Move
+
+
+class PositionSnapshot(NamedTuple):
+    """Immutable position at one ply that threads can share without copying."""
+
+    ply: int
+    key: int
+    fen: str
+    root_fen: str
+    moves: tuple[Move, ...]
+
+    @classmethod
+    def from_board(
+        cls, board: Board, ply: int, key: int, fen: str | None = None
+    ) -> PositionSnapshot:
+        """Get snapshot of `board` at `ply` hashed as `key`."""
+        fen = fen or board.fen()
+
+        if not board.move_stack:
+            return cls(ply, key, fen, fen, ())
+
+        return cls(ply, key, fen, board.root().fen(), tuple(board.move_stack))
+
+    def after(self, move: Move, board: Board, key: int, fen: str) -> PositionSnapshot:
+        """Get snapshot after `move` reached `board` hashed as `key`."""
+        if board.halfmove_clock == 0:
+            return PositionSnapshot(self.ply + 1, key, fen, fen, ())
+
+        return PositionSnapshot(
+            self.ply + 1, key, fen, self.root_fen, (*self.moves, move)
+        )
+
+    def board(self) -> Board:
+        """Get new board at snapshot position for caller's exclusive use."""
+        board: Board = Board(self.root_fen)
+
+        for move in self.moves:
+            board.push(move)
+
+        return board
+
+    def is_same_position(self, other: PositionSnapshot) -> bool:
+        """Return True if `other` shows same position at same ply."""
+        return self.ply == other.ply and self.key == other.key
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Final, NamedTuple
+
+from chess.engine import Limit
+
+
+INITIAL_OVERHEAD: Final[float] = 0.05
+MINIMUM_CLOCK: Final[float] = 0.01
+OVERHEAD_DECAY: Final[float] = 0.9
+
+
+class LimitMode(StrEnum):
+    """Ways of limiting how long engine searches for its move."""
+
+    Clock = "clock"
+    Time = "time"
+    Nodes = "nodes"
+    Depth = "depth"
+
+
+class ClockState(NamedTuple):
+    """Remaining time and increment of both clocks in seconds."""
+
+    white_time: float
+    black_time: float
+    white_increment: float
+    black_increment: float
+    moves_to_go: int | None = None
+
+
+class OverheadEstimator:
+    """Conservative estimate of GUI time charged on top of engine search."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float = INITIAL_OVERHEAD) -> None:
+        self.seconds: float = seconds
+
+    def update(self, sample: float) -> None:
+        """Hold peak of `sample` and let older peaks decay slowly."""
+        self.seconds = max(sample, self.seconds * OVERHEAD_DECAY, 0.0)
+
+
+def engine_limit(
+    mode: LimitMode, value: float, clocks: ClockState, overhead: float
+) -> Limit:
+    """Get search limit for `mode` and `value`, leaving `overhead` on clocks."""
+    if mode == LimitMode.Time:
+        return Limit(time=max(value - overhead, MINIMUM_CLOCK))
+    if mode == LimitMode.Nodes:
+        return Limit(nodes=int(value))
+    if mode == LimitMode.Depth:
+        return Limit(depth=int(value))
+
+    return Limit(
+        white_clock=max(clocks.white_time - overhead, MINIMUM_CLOCK),
+        black_clock=max(clocks.black_time - overhead, MINIMUM_CLOCK),
+        white_inc=clocks.white_increment,
+        black_inc=clocks.black_increment,
+        remaining_moves=clocks.moves_to_go,
+    )
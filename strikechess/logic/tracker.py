@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from chess import Board, Outcome, Termination
+from chess.polyglot import zobrist_hash
+
+
+class GameStateTracker:
+    """Incremental repetition counts and game-over status at current ply."""
+
+    __slots__ = ("_history", "_counts", "_base", "_ply", "outcome")
+
+    def __init__(self, history: PositionHistory, board: Board) -> None:
+        self._history: PositionHistory = history
+
+        self._counts: Counter[int] = Counter()
+        self._base: int = 0
+        self._ply: int = 0
+
+        self.outcome: Outcome | None = None
+
+        self.reset(board)
+
+    @property
+    def is_over(self) -> bool:
+        """Return True if game is over, claimable draws included."""
+        return self.outcome is not None
+
+    @property
+    def result(self) -> str:
+        """Get result as "1-0", "0-1", "1/2-1/2", or "*"."""
+        return "*" if self.outcome is None else self.outcome.result()
+
+    @property
+    def can_claim_draw(self) -> bool:
+        """Return True if draw can be claimed at current ply."""
+        return self.outcome is not None and self.outcome.termination in (
+            Termination.FIFTY_MOVES,
+            Termination.THREEFOLD_REPETITION,
+        )
+
+    def repetitions(self) -> int:
+        """Get occurrences of current position since last zeroing move."""
+        return self._counts[self._history.key_at(self._ply)]
+
+    def reset(self, board: Board) -> None:
+        """Start tracking from root position on `board`."""
+        self._ply = 0
+        self._base = 0
+        self._counts = Counter((self._history.key_at(0),))
+
+        self.outcome = self._outcome(board, self._history.key_at(0), self._counts)
+
+    def seek(self, board: Board, ply: int) -> None:
+        """Update counts and status after `board` moved to `ply`."""
+        base: int = self._history.repetition_base(ply)
+
+        if base == ply:
+            self._counts = Counter((self._history.key_at(ply),))
+        elif base == self._base and ply == self._ply + 1:
+            self._counts[self._history.key_at(ply)] += 1
+        elif base == self._base and ply == self._ply - 1:
+            self._counts[self._history.key_at(self._ply)] -= 1
+        elif ply != self._ply or base != self._base:
+            self._counts = Counter(
+                self._history.key_at(window_ply) for window_ply in range(base, ply + 1)
+            )
+
+        self._ply = ply
+        self._base = base
+
+        self.outcome = self._outcome(board, self._history.key_at(ply), self._counts)
+
+    def _outcome(self, board: Board, key: int, counts: Counter[int]) -> Outcome | None:
+        """Get outcome of `board` hashed as `key` using repetition `counts`."""
+        if board.is_checkmate():
+            return Outcome(Termination.CHECKMATE, not board.turn)
+        if board.is_insufficient_material():
+            return Outcome(Termination.INSUFFICIENT_MATERIAL, None)
+        if not any(board.generate_legal_moves()):
+            return Outcome(Termination.STALEMATE, None)
+        if board.is_seventyfive_moves():
+            return Outcome(Termination.SEVENTYFIVE_MOVES, None)
+
+        repetitions: int = counts[key]
+
+        if repetitions >= 5:
+            return Outcome(Termination.FIVEFOLD_REPETITION, None)
+        if board.can_claim_fifty_moves():
+            return Outcome(Termination.FIFTY_MOVES, None)
+        if repetitions >= 3 or self._can_repeat_thrice(board, counts):
+            return Outcome(Termination.THREEFOLD_REPETITION, None)
+
+        return None
+
+    def _can_repeat_thrice(self, board: Board, counts: Counter[int]) -> bool:
+        """Return True if any legal move reaches third repetition."""
+        if max(counts.values(), default=0) < 2:
+            return False
+
+        for move in board.generate_legal_moves():
+            if board.is_zeroing(move):
+                continue
+
+            board.push(move)
+            key: int = zobrist_hash(board)
+            board.pop()
+
+            if counts[key] >= 2:
+                return True
+
+        return False
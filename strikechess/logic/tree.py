@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from chess import Board
+
+
+class VariationNode:
+    """Move in variation tree with cached data about position it reaches."""
+
+    __slots__ = (
+        "move",
+        "parent",
+        "children",
+        "san",
+        "key",
+        "halfmove_clock",
+        "keyframe",
+    )
+
+    def __init__(
+        self,
+        move: int,
+        parent: VariationNode | None,
+        san: str,
+        key: int,
+        halfmove_clock: int,
+        keyframe: Board | None = None,
+    ) -> None:
+        self.move: int = move
+        self.parent: VariationNode | None = parent
+        self.children: list[VariationNode] = []
+
+        self.san: str = san
+        self.key: int = key
+        self.halfmove_clock: int = halfmove_clock
+        self.keyframe: Board | None = keyframe
+
+    @property
+    def siblings(self) -> list[VariationNode]:
+        """Get all moves played from same position, this one included."""
+        return [self] if self.parent is None else self.parent.children
+
+    def child(self, move: int) -> VariationNode | None:
+        """Get child reached by encoded `move` if it was played before."""
+        for child in self.children:
+            if child.move == move:
+                return child
+        return None
+
+    def main_line(self) -> list[VariationNode]:
+        """Get nodes following first child of each node after this one."""
+        nodes: list[VariationNode] = []
+        node: VariationNode = self
+
+        while node.children:
+            node = node.children[0]
+            nodes.append(node)
+
+        return nodes
+
+    def preorder(self) -> list[VariationNode]:
+        """Get this node and its descendants, each parent before its children."""
+        nodes: list[VariationNode] = []
+        pending: list[VariationNode] = [self]
+
+        while pending:
+            node: VariationNode = pending.pop()
+            nodes.append(node)
+            pending.extend(reversed(node.children))
+
+        return nodes
@@ -3,9 +3,9 @@ from PySide6.QtCore import qRegisterResourceData
 from .main_window import MainWindow
 
 
-IconStructure: bytes = b"\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x12\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x002\x00\x00\x00\x00\x00\x01\x00\x00\x02\x0d\x00\x00\x01\x91@\xd63f\x00\x00\x02.\x00\x00\x00\x00\x00\x01\x00\x00D\xa3\x00\x00\x01\x91@\xd5\xc8\xcc\x00\x00\x01\xc6\x00\x00\x00\x00\x00\x01\x00\x00-\xba\x00\x00\x01\x91@\xd6#\x1e\x00\x00\x01B\x00\x00\x00\x00\x00\x01\x00\x00!x\x00\x00\x01\x91@\xd5\x94\x03\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x00&\xea\x00\x00\x01\x91@\xd5\xb1\xfc\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x11\x0d\x00\x00\x01\x91@\xd5\x83\xf3\x00\x00\x00Z\x00\x00\x00\x00\x00\x01\x00\x00\x067\x00\x00\x01\x91@\xd5\xd7\xb7\x00\x00\x01\xf0\x00\x00\x00\x00\x00\x01\x00\x000\xd2\x00\x00\x01\x91@\xd3\xa5e\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xe7\x00\x00\x01\x91@\xd6U\x11\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xad\x00\x00\x01\x91@\xd6E\xc2\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x09\xda\x00\x00\x01\x91@\xd5\xe6\xff\x00\x00\x01d\x00\x00\x00\x00\x00\x01\x00\x00#\xe7\x00\x00\x01\x91@\xd6e\x87\x00\x00\x00\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x15\x05\x00\x00\x01\x91@\xd6\x146\x00\x00\x02R\x00\x00\x00\x00\x00\x01\x00\x00G\xb5\x00\x00\x01\x91@\xd6\x01~\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x91@\xd6t\x9b\x00\x00\x01\x9e\x00\x01\x00\x00\x00\x01\x00\x00)N\x00\x00\x01\x91@\xd5\xf4\x86\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00\x07$\x00\x00\x01\x91@\xd5dg\x00\x00\x02\x08\x00\x00\x00\x00\x00\x01\x00\x00?\xc1\x00\x00\x01\x91@\xd5v"
-IconNames: bytes = b"\x00\x05\x00o\xa6S\x00i\x00c\x00o\x00n\x00s\x00\x0e\x0cKL\x87\x00w\x00h\x00i\x00t\x00e\x00-\x00r\x00o\x00o\x00k\x00.\x00s\x00v\x00g\x00\x11\x01h:'\x00s\x00t\x00o\x00p\x00-\x00a\x00n\x00a\x00l\x00y\x00s\x00i\x00s\x00.\x00s\x00v\x00g\x00\x08\x05\xe2T\xa7\x00l\x00o\x00g\x00o\x00.\x00s\x00v\x00g\x00\x10\x0c\xbe2\x07\x00b\x00l\x00a\x00c\x00k\x00-\x00b\x00i\x00s\x00h\x00o\x00p\x00.\x00s\x00v\x00g\x00\x0c\x0a\xb1\x1dg\x00n\x00e\x00w\x00-\x00g\x00a\x00m\x00e\x00.\x00s\x00v\x00g\x00\x0f\x04\xbco'\x00b\x00l\x00a\x00c\x00k\x00-\x00q\x00u\x00e\x00e\x00n\x00.\x00s\x00v\x00g\x00\x0c\x0b\xdf,\xc7\x00s\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00s\x00v\x00g\x00\x10\x08\xe8\xef\x07\x00w\x00h\x00i\x00t\x00e\x00-\x00k\x00n\x00i\x00g\x00h\x00t\x00.\x00s\x00v\x00g\x00\x10\x0a{\x07\xc7\x00w\x00h\x00i\x00t\x00e\x00-\x00b\x00i\x00s\x00h\x00o\x00p\x00.\x00s\x00v\x00g\x00\x0e\x02\xb1\x89\xa7\x00b\x00l\x00a\x00c\x00k\x00-\x00r\x00o\x00o\x00k\x00.\x00s\x00v\x00g\x00\x0f\x0b\x10<g\x00w\x00h\x00i\x00t\x00e\x00-\x00q\x00u\x00e\x00e\x00n\x00.\x00s\x00v\x00g\x00\x08\x03\x03Wg\x00f\x00l\x00i\x00p\x00.\x00s\x00v\x00g\x00\x11\x0c\xbbiG\x00p\x00l\x00a\x00y\x00-\x00m\x00o\x00v\x00e\x00-\x00n\x00o\x00w\x00.\x00s\x00v\x00g\x00\x12\x02\xa9\x7f'\x00s\x00t\x00a\x00r\x00t\x00-\x00a\x00n\x00a\x00l\x00y\x00s\x00i\x00s\x00.\x00s\x00v\x00g\x00\x09\x06\xc7\x95\xe7\x00a\x00b\x00o\x00u\x00t\x00.\x00s\x00v\x00g\x00\x10\x0e\x15\xda\xc7\x00b\x00l\x00a\x00c\x00k\x00-\x00k\x00n\x00i\x00g\x00h\x00t\x00.\x00s\x00v\x00g\x00\x0f\x02\xa2\x9e'\x00l\x00o\x00a\x00d\x00-\x00e\x00n\x00g\x00i\x00n\x00e\x00.\x00s\x00v\x00g\x00\x08\x0c\x07U\xc7\x00q\x00u\x00i\x00t\x00.\x00s\x00v\x00g"
-IconData: bytes = b"\x00\x00\x02\x09<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#fff\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M9 39h27v-3H9v3zM12 36v-4h21v4H12zM11 14V9h4v2h5V9h5v2h5V9h4v5\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M34 14l-3 3H14l-3-3\x22/>\x0a        <path d=\x22M31 17v12.5H14V17\x22 stroke-linecap=\x22butt\x22 stroke-linejoin=\x22miter\x22/>\x0a        <path d=\x22M31 29.5l1.5 2.5h-20l1.5-2.5\x22/>\x0a        <path d=\x22M11 14h23\x22 fill=\x22none\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x04&<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M204.09271 10.01507c-49.74747 0-99.50435 18.87853-137.32236 56.69584-75.63603 75.63274-75.72264 199.08407-.08661 274.71493 66.30673 66.30362 169.28485 74.47861 244.65164 24.53249l114.69669 114.6908c15.13511 15.13446 39.48242 15.13446 54.6164 0 15.1353-15.13445 15.1353-39.4798 0-54.61538l-114.61009-114.6908c49.88868-75.3541 41.66082-178.35854-24.62143-244.6471C303.59893 28.88042 253.84017 10 204.09459 10l-.00188.01507zm-.08661 51.14732c36.47181.01694 72.93608 13.98427 100.9108 41.95752 55.94942 55.9465 56.03603 145.95419.08661 201.90823-55.94943 55.9465-145.96067 55.9465-201.91198 0-55.94942-55.9465-55.94942-145.95231 0-201.90823 27.97472-27.97419 64.43899-41.97635 100.9108-41.95752h.00377zM101.09953 247.97833\x22/>\x0a    <path d=\x22M101.999997 149.76247l47.762465-47.762464 50.737322 50.736905 50.737313-50.736905 47.762909 47.762464-50.737332 50.737312 50.737332 50.737322-47.762909 47.762908-50.737313-50.737331-50.737322 50.737331-47.762465-47.762908 50.736906-50.737322-50.736906-50.737312z\x22/>\x0a</svg>\x0a\x00\x00\x00\xe9<svg xmlns=\x22http://www.w3.org/2000/svg\x22 viewBox=\x220 0 16 16\x22>\x0a    <path d=\x22M5.52.359A.5.5 0 0 1 6 0h4a.5.5 0 0 1 .474.658L8.694 6H12.5a.5.5 0 0 1 .395.807l-7 9a.5.5 0 0 1-.873-.454L6.823 9.5H3.5a.5.5 0 0 1-.48-.641l2.5-8.5z\x22/>\x0a</svg>\x0a\x00\x00\x02\xb2<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a      <path d=\x22M9 36c3.39-.97 10.11.43 13.5-2 3.39 2.43 10.11 1.03 13.5 2 0 0 1.65.54 3 2-.68.97-1.65.99-3 .5-3.39-.97-10.11.46-13.5-1-3.39 1.46-10.11.03-13.5 1-1.354.49-2.323.47-3-.5 1.354-1.94 3-2 3-2zm6-4c2.5 2.5 12.5 2.5 15 0 .5-1.5 0-2 0-2 0-2.5-2.5-4-2.5-4 5.5-1.5 6-11.5-5-15.5-11 4-10.5 14-5 15.5 0 0-2.5 1.5-2.5 4 0 0-.5.5 0 2zM25 8a2.5 2.5 0 1 1-5 0 2.5 2.5 0 1 1 5 0z\x22 fill=\x22#000\x22 stroke-linecap=\x22butt\x22/>\x0a      <path d=\x22M17.5 26h10M15 30h15m-7.5-14.5v5M20 18h5\x22 stroke=\x22#fff\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x07/<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M79.40819148 363.54991612c-5.33144216 9.80499032-9.5749486 24.55770704-9.5749486 33.85333663 0 2.15805954 0 4.90290265.52208181 8.71047598L3.72145 288.76272123c-2.1328952-3.80757333-3.72142462-9.2703653-3.72142462-14.19201242 0-4.92816694 1.58852941-10.91906411 3.72142462-14.73315726l31.98944884-57.31571435L.00002537 181.7969678l116.20777116-2.2028833 56.49307218 104.2469896-36.23295527-21.28475872-57.05972196 100.99360074zm51.183914-330.76581884c10.1193144-18.03136987 26.65800668-27.85591964 46.89663546-27.85591964 21.87013445 0 38.9317044 10.38443909 51.18311815 31.64393352l18.1272217 31.1093085-62.91324594 111.37803982-101.80117823-60.59518247 48.50744886-85.68017973zm7.4420534 425.18825867c-30.3794313 0-55.42742044-25.65303635-55.42742044-56.76152987 0-8.73574027 3.74291274-23.487642 9.0743549-32.7580073l17.03928598-31.1093085H235.068953v120.62966065h-97.03479413zM239.33553926 29.48588467c-7.98721504-14.17326794-18.65009937-24.023082-31.4458789-29.48587397h131.11416192c11.72933193 0 20.78219872 4.92816694 26.13592487 14.21727671l32.5123265 56.76152987 35.1696911-21.30431818-56.51853959 103.73110906-115.64191724-1.66825827 35.71087346-20.7248694-57.03664212-101.52659582zm202.0384986 308.95213994c15.97283836 0 29.31298369-4.36746264 40.49874569-13.08445844l-66.1117929 117.88481754c-5.33144216 9.2703653-14.90639076 14.73315726-26.09533618 14.73315726h-62.39116412v42.02837261l-59.692415-102.06285079 59.692415-102.08893005v42.5890769h114.0995475zm51.1401419-98.25527745c4.80936034 8.73574028 7.48582549 18.00610557 7.48582549 27.83636019 0 19.65480438-12.27369773 40.39841827-29.3129837 50.20422356-8.0079073 4.39354192-19.21595328 7.13105023-30.3794313 7.13105023h-35.21027978l-62.87265725-111.37803983 101.80436165-59.49985315 48.48516488 85.706259z\x22/>\x0a</svg>\x0a\x00\x00\x03\xf4<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#000\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <g fill=\x22#000\x22 stroke=\x22none\x22>\x0a            <circle cx=\x226\x22 cy=\x2212\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2214\x22 cy=\x229\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2222.5\x22 cy=\x228\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2231\x22 cy=\x229\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2239\x22 cy=\x2212\x22 r=\x222.75\x22/>\x0a        </g>\x0a        <path d=\x22M9 26c8.5-1.5 21-1.5 27 0l2.5-12.5L31 25l-.3-14.1-5.2 13.6-3-14.5-3 14.5-5.2-13.6L14 25 6.5 13.5 9 26zM9 26c0 2 1.5 2 2.5 4 1 1.5 1 1 .5 3.5-1.5 1-1.5 2.5-1.5 2.5-1.5 1.5.5 2.5.5 2.5 6.5 1 16.5 1 23 0 0 0 1.5-1 0-2.5 0 0 .5-1.5-1-2.5-.5-2.5-.5-2 .5-3.5 1-2 2.5-2 2.5-4-8.5-1.5-18.5-1.5-27 0z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M11 38.5a35 35 1 0 0 23 0\x22 fill=\x22none\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M11 29a35 35 1 0 1 23 0M12.5 31.5h20M11.5 34.5a35 35 1 0 0 22 0M10.5 37.5a35 35 1 0 0 24 0\x22 fill=\x22none\x22 stroke=\x22#fff\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x05\xde<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M328.75535002 228.45614965c10.38497196-7.15829289 22.63774463-10.2068381 34.6290252-8.81762763l136.61094413-141.1592204L423.49020216-.55133902l-136.62962213 141.1592204c1.38217253 12.5414835-1.68102064 25.35309126-8.89073139 36.21594543l50.78550138 51.63232283zM90.44265724 400.37096065l-4.9496694-5.11309137-25.90639744 21.62924098-43.63182512 71.02338106 11.16944807 11.53815658 68.80978077-45.07213397 20.91936584-26.68444358-4.96835496-5.19022734 86.89009713-89.7777249-21.5917788-21.99582082z\x22/>\x0a    <path d=\x22M209.27213843 151.47073557c10.03008983-37.0456128.93390036-78.45180293-27.21385638-107.58663382-28.0543667-28.86470664-67.67041982-38.33835033-103.32673542-28.3437527l60.38599704 62.36011486-15.83895004 61.08667193-59.2092826 16.36181232-60.36731902-62.3215257c-9.63785168 36.81407772-.48562819 77.7379031 27.5127045 106.6797881 29.34314919 30.33109547 71.63015732 39.22590146 108.61261143 26.8001855l.33620413.34730262 248.39881676 256.59875236c9.82463175 10.12965975 22.71245667 15.2620207 35.58160358 15.2620207 12.88782492 0 25.73829382-5.13236095 35.60028158-15.2620207 19.6305855-20.2400249 19.6305855-53.13730085 0-73.53168247l-250.47207556-258.451033zm219.20509163 323.2615608c-10.57175203 0-19.1449573-8.894806-19.1449573-19.85413311 0-10.9979163 8.57320527-19.8541331 19.1449573-19.8541331 10.64646406 0 19.25702535 8.8562168 19.25702535 19.8541331.018678 10.95932712-8.59188328 19.8541331-19.25702535 19.8541331z\x22/>\x0a</svg>\x0a\x00\x00\x03\xc2<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M 22,10 C 32.5,11 38.5,18 38,39 L 15,39 C 15,30 25,32.5 23,18\x22 style=\x22fill: #ffffff; stroke: #000000;\x22/>\x0a        <path d=\x22M 24,18 C 24.38,20.91 18.45,25.37 16,27 C 13,29 13.18,31.34 11,31 C 9.958,30.06 12.41,27.96 11,28 C 10,28 11.19,29.23 10,30 C 9,30 5.997,31 6,26 C 6,24 12,14 12,14 C 12,14 13.89,12.1 14,10.5 C 13.27,9.506 13.5,8.5 13.5,7.5 C 14.5,6.5 16.5,10 16.5,10 L 18.5,10 C 18.5,10 19.28,8.008 21,7 C 22,7 22,10 22,10\x22 style=\x22fill: #ffffff; stroke: #000000;\x22/>\x0a        <path d=\x22M 9.5 25.5 A 0.5 0.5 0 1 1 8.5,25.5 A 0.5 0.5 0 1 1 9.5 25.5 z\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a        <path d=\x22M 15 15.5 A 0.5 1.5 0 1 1 14,15.5 A 0.5 1.5 0 1 1 15 15.5 z\x22 transform=\x22matrix(0.866,0.5,-0.5,0.866,9.693,-5.173)\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02\xc7<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <g fill=\x22#fff\x22 stroke-linecap=\x22butt\x22>\x0a            <path d=\x22M9 36c3.39-.97 10.11.43 13.5-2 3.39 2.43 10.11 1.03 13.5 2 0 0 1.65.54 3 2-.68.97-1.65.99-3 .5-3.39-.97-10.11.46-13.5-1-3.39 1.46-10.11.03-13.5 1-1.354.49-2.323.47-3-.5 1.354-1.94 3-2 3-2zM15 32c2.5 2.5 12.5 2.5 15 0 .5-1.5 0-2 0-2 0-2.5-2.5-4-2.5-4 5.5-1.5 6-11.5-5-15.5-11 4-10.5 14-5 15.5 0 0-2.5 1.5-2.5 4 0 0-.5.5 0 2zM25 8a2.5 2.5 0 1 1-5 0 2.5 2.5 0 1 1 5 0z\x22/>\x0a        </g>\x0a        <path d=\x22M17.5 26h10M15 30h15m-7.5-14.5v5M20 18h5\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02k<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#000\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M9 39h27v-3H9v3zM12.5 32l1.5-2.5h17l1.5 2.5h-20zM12 36v-4h21v4H12z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M14 29.5v-13h17v13H14z\x22 stroke-linecap=\x22butt\x22 stroke-linejoin=\x22miter\x22/>\x0a        <path d=\x22M14 16.5L11 14h23l-3 2.5H14zM11 14V9h4v2h5V9h5v2h5V9h4v5H11z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M12 35.5h21M13 31.5h19M14 29.5h17M14 16.5h17M11 14h23\x22 fill=\x22none\x22 stroke=\x22#fff\x22 stroke-width=\x221\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02\xff<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#fff\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M8 12a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM24.5 7.5a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM41 12a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM16 8.5a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM33 9a2 2 0 1 1-4 0 2 2 0 1 1 4 0z\x22/>\x0a        <path d=\x22M9 26c8.5-1.5 21-1.5 27 0l2-12-7 11V11l-5.5 13.5-3-15-3 15-5.5-14V25L7 14l2 12zM9 26c0 2 1.5 2 2.5 4 1 1.5 1 1 .5 3.5-1.5 1-1.5 2.5-1.5 2.5-1.5 1.5.5 2.5.5 2.5 6.5 1 16.5 1 23 0 0 0 1.5-1 0-2.5 0 0 .5-1.5-1-2.5-.5-2.5-.5-2 .5-3.5 1-2 2.5-2 2.5-4-8.5-1.5-18.5-1.5-27 0z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M11.5 30c3.5-1 18.5-1 22 0M12 33.5c6-1 15-1 21 0\x22 fill=\x22none\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02`<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M257.998 144.04906L167.997 16.046924c-5.654-8.062934-18.34-8.062934-23.994 0L54.002 144.04906c-7.399 10.500267-.355 25.593601 11.997 25.593601H111v304.003207c0 8.843734 6.709 16 15 16h60c8.291 0 14.8-7.156267 14.8-16V169.642661H246c12.363 0 19.389-15.104 11.998-25.593601zM436.003 351.871336h-45.201V85.867607c0-7.738267-6.509-14-14.8-14h-60.001c-8.291 0-15 6.261733-15 14v266.002796H256c-12.353 0-19.396 13.206666-11.997 22.3944l90.002 112.001865c5.989 7.472267 18.014 7.461067 23.994 0L448 374.265736c7.391-9.1784.365-22.3944-11.997-22.3944z\x22/>\x0a</svg>\x0a\x00\x00\x04h\x00\x00\x17Xx\xda\xe5\x98\xcdr[7\x0c\x85\xf7y\x0a\x8e\xf7\x97&\xf1G\xa0\x93d\x9dM\xb6\xdew\xd4N\xb4\xa8\xd3L\x9d\x91;z\xfa\x1eJ\x95E\xb9\xd7\xb1|+\xa7\x9d\xd6+\x0fE\x82\x1fp@\x90\xb8o\xef6\x9f\xd2\xef\xb7\xbf|\xbe{w\xb5\xfe\xfa\xf5\xcb\x0f\xd7\xd7\xf7\xf7\xf7\xf9\x9e\xf3\xaf\xbf}\xba\xa6R\xca5f\x5c\xbd\x7f\x93\xf0\xf7\xf6\xcb\x8f_\xd7\xe9\xa7wW\x1f+\xd7\xdc\xd8#\xcc<qk\xd9\x0b{\x0d\xd35\xb1ec\xc1\x0f+\xcf\xa6\xca\xe6&\xa9\xa4\xaa\xb9I8\x87\xca\xd4\xb2V\x98\x8eF'\xc3\xd5\xb2zX\x90\xd2Me\xcfXH\xc1\xba*S\xe4j\xc4\x95\x9bbm\x09\x91Vb\x98\xce\xd3\xbc\x19^O\x03\xce\xd4yDj\x13Je\x5c\x91Z\x16j\xf0\x22\xf4dx0\xb4!\xa2\xcc\xfd\x076Z\x95\x14\xb9\xb4fN\x9e:\x8f\x0aQ\xa5a\xfe\x89_\xe3\xf8\xf6\xea\xfaq(\x95\xb3h\x94\xeaN)@\xd2\xdd\xacU7\x5c4SUkQ\x1bv\xc4\xfe\x00tQN\x15\xf1Cd\xcc\x9b&\xa9\x99\xb5p\xb1\x9a\x18Q\xc2~\x95\x99\x86\xe15W\xc9Q\x01\xa0\xc5WT\xb3\x06\xc0\xd4!I_ ELz\xd0<k\xc3\xff\xc5O\x86\x1f\xec\x04\xdf\x0cp\x90\x04<n$V\xb5M\x03P_!LA\xc4mzd\xe90\xfe!\x08\x14\xaeLUV\xd3\x0e\xa9\x0b\x03C\x9e\xe9\xe7i\xbf\xee\xe0\xc9\x9f`\x1aq:>\xd8\xdb\xde\x8a\xe5`c\xf7\x93\x1f\x0c\x98XNB\x05\xe9\xd6\x12\x02QX\x9a\xaa\xc4\xc4\x0c\xdd\x0c\x12\xb6H\xc8e\x16\xee\x11\x92q|Lex\xc8\x05\xe6\xa5h\x0f\xdcqA7\xea\x0a\xa3\x86d\x1e\xc7\x1f\x0c\xf9\x98;\x10\xb2\x13q\xe0\xe4\xa8M\x03\xd1\xb0`\x9a\xb7s\x9a\xcc'D\xe3\x8aiGd\xadU\xa9\xd3\xack\xbe\x99\x06\xa4\xed\xc70\x1c\xdf\xa8\xe2p\x01pA\x00j\xbc\xc1\xda\x1a\x0e\x81\xc3\xd6Hg\x0d\x1c\xbf\x9b\xe3\xef\x08\xaed#\xa4\x80\x16l\x94\x15&L\x10ZLQV\x94\x03\xc6am\xfb\xac8\x8e\xdd=\x0c&\x863\xb54\xaet\x1c;N\x84\xaa\xc8\x0ch_\xaaX*/\xc7q\xaaLvi\x9cP\xb2X\x82\xb3\x8b\x8e?\x83\x83E\xe4n\x86\x22\x05U\x17D\xaa\xbd\x1a\xda\x02\xe1\x0a.\x87\xd7\x12n\x17\xa9\x86{`I\xa4\x16\x8b\xf8:9\xf5?\x15\x8e_ \xdc\xc7Z)K!\x8f^\xa5pOa;A\x9d7\x94\xc5\x03[\x07&\xaf\xc4\xa8\xfd(\xb4\x92\x95[/\x90\x96\x8e\xb1\x1al\xa6\x99}\xee\x1e\x809\xb7\xda/\x1e\xdc\x1b3Nl\xa6a\xaf\xd3J5\xfcp2\xeb\x5c\xce]\x10\xdb\x858\xb7\xb7\xa49\xf0\x8e*\xbb\x84\x7fb7{f\xb7\xb4\x97\xac\x16<lJZ\x12\xa2y\xe7\xb7\xb7\xdar\xd5\xd2t\x9f\xffK\xc2uQY\x1f\x9f\x80\xc5@qND\x0fu>}W1\xef\xfe\xd3\xfa\xe1\x91\xd3\x0c\xcf=\xb5\xd1\xe6jI\xb8\x97\xba\xa3\xcf\x9e\xde\xed-\x9e\x5c(\xa3\xd5\x1c\xefb\xcad\xeaR\x0d\x0f<LFe\xe5\xea\xb1\xe9]Ci\xa5\x19\xb5\xf5\xc3x\xac\x9e>\x8a\xe8\xb4\x82c\xce\x93\xd4+\xf5\x01\xf3\xfc\x8bc{\x0b\xf78G\xa0W#W\xe0\x05\x0e\x07\xde\xf3\xb5\x0et\xb6>\x0e\x1f\xe9x\x96\xce\xd3\xec\xfd\xf4@\xd4^D$O\x10\xb5\xf3\x88v\xca\xfb7\xe2\x85nk?\xf7\xaft2C'\x07:\xb4\xc5\xee;9_%^O\xa8\xf9]c\xd7\xe9d\x06N\x16\x8by\x89\xf4\x8a\x0b\xa5\xd7^\xc0\xbfEtx\xcc<'\xa0^F\xc0\xde\xff\xb2E\xd3\xfeq\x82\xd1\x19\x16t\xf2\xe8$\xd1jJE\x87\x99\x0cM\xb1\xe3\x81\x82&\xbb\x7fG\x90h\xa4\x09\xebQT\x1a\xb6Ys\xc9h\x9aC\x1d=\xeaS%\xe6\x0c\x9f\x1e\x1f\x19\x7f\xf6\xc8L\xe2\x8c\x87\x9d\x91\xc2\x9f}\xeb^\xa5\xc7\xb8ei\xc5\x01\xdan\x1c+\x01jU\xf4\x83g\x0ed\x0b\x08W\xd8\x91\xcdZ\xe9\x97\xe1\xf8\x90<\x14\xf5\xb9\x87d\xdaW\xec\x1d'\x9ak\xecWP\x85\xeb\xb3\x05\xfb4\xf4#\xdc\xeeS\x98)\x9b\xf0yp\xfbT\x9d\x83\xbb[\xc6\xa3#\xcff\x1a\x0e\xf3\xf9@2\xc3#i\xb8\xde\xf4\xc5\xc1:\x9c\xa21XT#7i\xac\xca\x97TR\xd3?\x17\xb9\xf3\xa5\x94\x19 \xf9Fj\x8d@\xf6\x02 \xbfHn\xcd\xc8\xb7\x00h\x7f\xc9>\xa9\xdf\xa1}\xfc\xb7\xe9'\x03\xdd\xf9l\xfd\xe3\xee\xdb\xfe\xbd\xfc\xfd\x9b?\x00\xe4\xca\xdfP\x00\x00\x03\x14<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M204.092706 10.01507c-49.74747 0-99.50435 18.87853-137.32236 56.69584-75.63603 75.63274-75.72264 199.08407-.08661 274.71493 66.30673 66.30362 169.28485 74.47861 244.65164 24.53249l114.69669 114.6908c15.13511 15.13446 39.48242 15.13446 54.6164 0 15.1353-15.13445 15.1353-39.4798 0-54.61538l-114.61009-114.6908c49.88868-75.3541 41.66082-178.35854-24.62143-244.6471C303.598926 28.88042 253.840166 10 204.094586 10l-.00188.01507zm-.08661 51.14732c36.47181.01694 72.93608 13.98427 100.9108 41.95752 55.94942 55.9465 56.03603 145.95419.08661 201.90823-55.94943 55.9465-145.96067 55.9465-201.91198 0-55.94942-55.9465-55.94942-145.95231 0-201.90823 27.97472-27.97419 64.43899-41.97635 100.9108-41.95752h.00377zm-102.90657 186.81594\x22/>\x0a</svg>\x0a\x00\x00\x0e\xeb<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M309.9798241 436.2890708v14.60905273c0 11.62551378-8.89794174 21.29629516-20.4759864 22.9423856l-3.75214412 13.27160424c-2.03687823 7.2016457-8.79073761 12.2427977-16.61663819 12.2427977h-37.19982872c-7.82590056 0-14.57975996-5.041152-16.6166382-12.2427977l-3.64493998-13.27160422c-11.6852488-1.74897112-20.58319054-11.31687183-20.58319054-23.04526625v-14.60905273c0-7.81892962 6.53945116-14.09464947 14.68696408-14.09464947h89.515438c8.14751291.10288065 14.68696408 6.37860049 14.68696408 14.1975301z m68.93224747-196.91356973c0 33.2304509-13.72212702 63.37448221-36.02058343 85.4938226-16.93825055 16.87242708-27.87307052 38.37448354-31.51801051 61.31686916-1.60806176 9.87654268-10.5060035 17.18106904-21.012007 17.18106904h-79.65265918c-10.3987994 0-19.40394527-7.20164572-20.9048029-17.07818837-3.75214412-22.94238563-14.7941682-44.75308405-31.73241874-61.52263048-21.86963994-21.81069842-35.48456284-51.44032648-35.8061752-84.05349346-.75042882-68.51851486 56.06775337-123.9711868 127.46569554-124.48559006 71.29073805-.51440326 129.18096142 54.83538801 129.18096142 123.14814158z m-113.85077263-74.58847339c0-7.61316831-6.43224705-13.88888814-14.47255585-13.88888814-51.02915986 0-92.6243574 39.81481268-92.6243574 88.88888415 0 7.61316832 6.43224705 13.88888815 14.47255584 13.88888815 7.93310469 0 14.47255585-6.17283918 14.47255585-13.88888815 0-33.74485417 28.62349932-61.11110787 63.6792457-61.11110787 8.0403088 0 14.47255586-6.17283917 14.47255586-13.88888814z m-14.47255585-88.9917648c7.93310468 0 14.47255585-6.17283917 14.47255585-13.88888814V13.2438259c0-7.61316831-6.43224705-13.88888814-14.47255585-13.88888814s-14.47255583 6.17283917-14.47255583 13.88888814v48.66254885c0 7.71604897 6.53945114 13.88888815 14.47255583 13.88888815z M80.2414006 239.27262044c0-7.61316833-6.43224704-13.88888816-14.47255585-13.88888816h-50.7075475c-7.9331047 0-14.47255585 6.17283917-14.47255585 13.88888816 0 7.61316831 6.43224705 13.88888813 14.47255585 13.88888813h50.7075475c8.0403088 0 14.47255585-6.17283917 14.47255585-13.88888813z m405.87478832-13.88888816H435.4086414c-7.93310468 0-14.47255585 6.17283917-14.47255585 13.88888816 0 7.61316831 6.43224705 13.88888813 14.47255585 13.88888813h50.70754752c7.93310468 0 14.47255585-6.17283917 14.47255585-13.88888813 0-7.61316833-6.43224706-13.88888816-14.47255585-13.88888816z M109.72253289 354.91047432l-35.91337932 34.46501873c-5.68181823 5.45267461-5.68181823 14.19753012 0 19.65020471 2.78730704 2.674897 6.53945116 4.01234547 10.18439115 4.01234547s7.3970841-1.33744848 10.18439115-4.01234546l35.91337931-34.46501872c5.68181822-5.4526746 5.68181822-14.19753012 0-19.65020473-5.57461411-5.4526746-14.7941682-5.4526746-20.36878229 0z m271.54802926-227.1604817c3.64493999 0 7.3970841-1.33744849 10.18439115-4.01234546l35.91337931-34.46501873c5.68181822-5.4526746 5.68181822-14.19753012 0-19.65020472-5.68181822-5.4526746-14.7941682-5.4526746-20.47598642 0l-35.9133793 34.46501873c-5.68181823 5.4526746-5.68181823 14.1975301 0 19.65020471 2.89451116 2.67489698 6.53945115 4.01234546 10.29159525 4.01234546z M109.7225329 123.6347665c2.78730705 2.67489698 6.53945114 4.01234547 10.18439114 4.01234547s7.3970841-1.3374485 10.18439114-4.01234547c5.68181823-5.4526746 5.68181823-14.1975301 0-19.65020471l-35.9133793-34.46501875c-5.68181823-5.4526746-14.79416821-5.4526746-20.47598643 0s-5.68181821 14.1975301 0 19.65020471l36.02058344 34.46501873z m281.7324204 231.27570781c-5.68181822-5.4526746-14.7941682-5.4526746-20.4759864 0-5.68181823 5.45267462-5.68181823 14.19753012 0 19.65020471l35.9133793 34.46501874c2.78730705 2.674897 6.53945116 4.01234547 10.18439115 4.01234547s7.39708409-1.33744848 10.18439116-4.01234546c5.68181821-5.45267459 5.68181821-14.1975301 0-19.6502047l-35.8061752-34.46501875z\x22/>\x0a</svg>\x0a\x00\x00\x04\xde<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M 22,10 C 32.5,11 38.5,18 38,39 L 15,39 C 15,30 25,32.5 23,18\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a        <path d=\x22M 24,18 C 24.38,20.91 18.45,25.37 16,27 C 13,29 13.18,31.34 11,31 C 9.958,30.06 12.41,27.96 11,28 C 10,28 11.19,29.23 10,30 C 9,30 5.997,31 6,26 C 6,24 12,14 12,14 C 12,14 13.89,12.1 14,10.5 C 13.27,9.506 13.5,8.5 13.5,7.5 C 14.5,6.5 16.5,10 16.5,10 L 18.5,10 C 18.5,10 19.28,8.008 21,7 C 22,7 22,10 22,10\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a        <path d=\x22M 9.5 25.5 A 0.5 0.5 0 1 1 8.5,25.5 A 0.5 0.5 0 1 1 9.5 25.5 z\x22 style=\x22fill: #ececec; stroke: #ececec;\x22/>\x0a        <path d=\x22M 15 15.5 A 0.5 1.5 0 1 1 14,15.5 A 0.5 1.5 0 1 1 15 15.5 z\x22 transform=\x22matrix(0.866,0.5,-0.5,0.866,9.693,-5.173)\x22 style=\x22fill: #ececec; stroke: #ececec;\x22/>\x0a        <path d=\x22M 24.55,10.4 L 24.1,11.85 L 24.6,12 C 27.75,13 30.25,14.49 32.5,18.75 C 34.75,23.01 35.75,29.06 35.25,39 L 35.2,39.5 L 37.45,39.5 L 37.5,39 C 38,28.94 36.62,22.15 34.25,17.66 C 31.88,13.17 28.46,11.02 25.06,10.5 L 24.55,10.4 z\x22 style=\x22fill: #ececec; stroke: none;\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x03\x0e<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M451.655,414.239H33.048C14.798,414.239,0,428.659,0,446.91c0,18.25,14.798,32.67,33.048,32.67h418.607c18.249,0,33.047-14.42,33.047-32.67C484.702,428.659,469.904,414.239,451.655,414.239z\x22/>\x0a    <path d=\x22M217.351,370.521c13.862,19.657,37.98,17.842,50.002,0c30.482-45.242,126.299-177.947,126.299-177.947c7.233-10.19,6.901-23.929-0.812-33.762c-7.716-9.834-20.983-13.421-32.602-8.819l-73.499,29.111l9.703-143.854c0.531-7.827-2.223-15.52-7.6-21.238c-5.376-5.712-12.887-8.935-20.729-8.889h-51.525c-7.844-0.046-15.354,3.176-20.73,8.889c-5.376,5.718-8.13,13.412-7.6,21.238l9.704,143.854l-73.499-29.111c-11.617-4.602-24.886-1.015-32.602,8.819c-7.713,9.833-8.045,23.571-0.811,33.762C91.052,192.573,185.911,325.939,217.351,370.521z\x22/>\x0a</svg>\x0a\x00\x00\x02\x85<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M500.01043569 407.4694648l-92.62322766 92.53053808s-146.55976715-157.34220996-157.4403982-157.34220996c-10.77458201 0-157.35555897 157.34220996-157.35555897 157.34220996L.01044281 407.4694648s157.33434917-144.4053252 157.33434917-157.32100195C157.34479198 237.10553805.0104428 92.6153808.0104428 92.6153808L92.59125086.0000107s147.81114577 157.38462597 157.35555897 157.38462597c9.58683282 0 157.4403982-157.38462597 157.4403982-157.38462597l92.62322766 92.61537011s-157.4191884 146.63216602-157.4191884 157.53308204c0 10.6252119 157.4191884 157.32100195 157.4191884 157.32100195z\x22/>\x0a</svg>\x0a"
+IconStructure: bytes = b"\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x16\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x10\x00\x00\x00\x00\x00\x01\x00\x00-d\x00\x00\x01\xa1N\x15\xca\x9c\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x04\x8e\x00\x00\x01\x91@\xd63f\x00\x00\x01D\x00\x00\x00\x00\x00\x01\x00\x00\x1dh\x00\x00\x01\xa1N\x15l0\x00\x00\x02\xd4\x00\x00\x00\x00\x00\x01\x00\x00Ko\x00\x00\x01\x91@\xd5\xc8\xcc\x00\x00\x02l\x00\x00\x00\x00\x00\x01\x00\x004\x86\x00\x00\x01\x91@\xd6#\x1e\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00%\x8e\x00\x00\x01\x91@\xd5\x94\x03\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00+\x00\x00\x00\x01\x91@\xd5\xb1\xfc\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x00\x13\x8e\x00\x00\x01\x91@\xd5\x83\xf3\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\xa1N\x15\xc7\x01\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x08\xb8\x00\x00\x01\x91@\xd5\xd7\xb7\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x007\x9e\x00\x00\x01\x91@\xd3\xa5e\x00\x00\x01h\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xfd\x00\x00\x01\x91@\xd6U\x11\x00\x00\x01\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x22\xc3\x00\x00\x01\x91@\xd6E\xc2\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x0c[\x00\x00\x01\x91@\xd5\xe6\xff\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x00'\xfd\x00\x00\x01\x91@\xd6e\x87\x00\x00\x01&\x00\x00\x00\x00\x00\x01\x00\x00\x17\x86\x00\x00\x01\x91@\xd6\x146\x00\x00\x02\xf8\x00\x00\x00\x00\x00\x01\x00\x00N\x81\x00\x00\x01\x91@\xd6\x01~\x00\x00\x000\x00\x00\x00\x00\x00\x01\x00\x00\x01\x05\x00\x00\x01\x91@\xd6t\x9b\x00\x00\x02D\x00\x01\x00\x00\x00\x01\x00\x000\x12\x00\x00\x01\x91@\xd5\xf4\x86\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x09\xa5\x00\x00\x01\x91@\xd5dg\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x03\x12\x00\x00\x01\xa1N\x15\xc34\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x00F\x8d\x00\x00\x01\x91@\xd5v\x00"
+IconNames: bytes = b"\x00\x05\x00o\xa6S\x00i\x00c\x00o\x00n\x00s\x00\x0d\x04\xf4\xbc'\x00l\x00o\x00a\x00d\x00-\x00b\x00o\x00o\x00k\x00.\x00s\x00v\x00g\x00\x0e\x0cKL\x87\x00w\x00h\x00i\x00t\x00e\x00-\x00r\x00o\x00o\x00k\x00.\x00s\x00v\x00g\x00\x14\x0d\x01\x05\x87\x00c\x00a\x00l\x00i\x00b\x00r\x00a\x00t\x00e\x00-\x00e\x00n\x00g\x00i\x00n\x00e\x00.\x00s\x00v\x00g\x00\x11\x01h:'\x00s\x00t\x00o\x00p\x00-\x00a\x00n\x00a\x00l\x00y\x00s\x00i\x00s\x00.\x00s\x00v\x00g\x00\x08\x05\xe2T\xa7\x00l\x00o\x00g\x00o\x00.\x00s\x00v\x00g\x00\x10\x0c\xbe2\x07\x00b\x00l\x00a\x00c\x00k\x00-\x00b\x00i\x00s\x00h\x00o\x00p\x00.\x00s\x00v\x00g\x00\x0c\x0a\xb1\x1dg\x00n\x00e\x00w\x00-\x00g\x00a\x00m\x00e\x00.\x00s\x00v\x00g\x00\x0f\x04\xbco'\x00b\x00l\x00a\x00c\x00k\x00-\x00q\x00u\x00e\x00e\x00n\x00.\x00s\x00v\x00g\x00\x0c\x0b\xdf,\xc7\x00s\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00s\x00v\x00g\x00\x0f\x01\xd1~g\x00r\x00e\x00v\x00i\x00e\x00w\x00-\x00g\x00a\x00m\x00e\x00.\x00s\x00v\x00g\x00\x10\x08\xe8\xef\x07\x00w\x00h\x00i\x00t\x00e\x00-\x00k\x00n\x00i\x00g\x00h\x00t\x00.\x00s\x00v\x00g\x00\x10\x0a{\x07\xc7\x00w\x00h\x00i\x00t\x00e\x00-\x00b\x00i\x00s\x00h\x00o\x00p\x00.\x00s\x00v\x00g\x00\x0e\x02\xb1\x89\xa7\x00b\x00l\x00a\x00c\x00k\x00-\x00r\x00o\x00o\x00k\x00.\x00s\x00v\x00g\x00\x0f\x0b\x10<g\x00w\x00h\x00i\x00t\x00e\x00-\x00q\x00u\x00e\x00e\x00n\x00.\x00s\x00v\x00g\x00\x08\x03\x03Wg\x00f\x00l\x00i\x00p\x00.\x00s\x00v\x00g\x00\x17\x00\xe0\x16G\x00c\x00o\x00n\x00n\x00e\x00c\x00t\x00-\x00e\x00n\x00g\x00i\x00n\x00e\x00-\x00h\x00o\x00s\x00t\x00.\x00s\x00v\x00g\x00\x11\x0c\xbbiG\x00p\x00l\x00a\x00y\x00-\x00m\x00o\x00v\x00e\x00-\x00n\x00o\x00w\x00.\x00s\x00v\x00g\x00\x12\x02\xa9\x7f'\x00s\x00t\x00a\x00r\x00t\x00-\x00a\x00n\x00a\x00l\x00y\x00s\x00i\x00s\x00.\x00s\x00v\x00g\x00\x09\x06\xc7\x95\xe7\x00a\x00b\x00o\x00u\x00t\x00.\x00s\x00v\x00g\x00\x10\x0e\x15\xda\xc7\x00b\x00l\x00a\x00c\x00k\x00-\x00k\x00n\x00i\x00g\x00h\x00t\x00.\x00s\x00v\x00g\x00\x0f\x02\xa2\x9e'\x00l\x00o\x00a\x00d\x00-\x00e\x00n\x00g\x00i\x00n\x00e\x00.\x00s\x00v\x00g\x00\x08\x0c\x07U\xc7\x00q\x00u\x00i\x00t\x00.\x00s\x00v\x00g"
+IconData: bytes = b"\x00\x00\x01\x01<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M215,0H285V70H330L250,150L170,70H215Z\x22/>\x0a    <path d=\x22M240,190C190,150,100,140,20,160V450C100,430,190,440,240,480Z\x22/>\x0a    <path d=\x22M260,190C310,150,400,140,480,160V450C400,430,310,440,260,480Z\x22/>\x0a</svg>\x0a\x00\x00\x02\x09<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#fff\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M9 39h27v-3H9v3zM12 36v-4h21v4H12zM11 14V9h4v2h5V9h5v2h5V9h4v5\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M34 14l-3 3H14l-3-3\x22/>\x0a        <path d=\x22M31 17v12.5H14V17\x22 stroke-linecap=\x22butt\x22 stroke-linejoin=\x22miter\x22/>\x0a        <path d=\x22M31 29.5l1.5 2.5h-20l1.5-2.5\x22/>\x0a        <path d=\x22M11 14h23\x22 fill=\x22none\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x01x<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M30,330A220,220,0,0,1,470,330H420A170,170,0,0,0,80,330Z\x22/>\x0a    <path d=\x22M232.322,312.322L358.579,157.071L266.569,327.678Z\x22/>\x0a    <path d=\x22M250,290C272.091,290,290,307.909,290,330C290,352.091,272.091,370,250,370C227.909,370,210,352.091,210,330C210,307.909,227.909,290,250,290Z\x22/>\x0a    <path d=\x22M30,420H470V470H30Z\x22/>\x0a</svg>\x0a\x00\x00\x04&<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M204.09271 10.01507c-49.74747 0-99.50435 18.87853-137.32236 56.69584-75.63603 75.63274-75.72264 199.08407-.08661 274.71493 66.30673 66.30362 169.28485 74.47861 244.65164 24.53249l114.69669 114.6908c15.13511 15.13446 39.48242 15.13446 54.6164 0 15.1353-15.13445 15.1353-39.4798 0-54.61538l-114.61009-114.6908c49.88868-75.3541 41.66082-178.35854-24.62143-244.6471C303.59893 28.88042 253.84017 10 204.09459 10l-.00188.01507zm-.08661 51.14732c36.47181.01694 72.93608 13.98427 100.9108 41.95752 55.94942 55.9465 56.03603 145.95419.08661 201.90823-55.94943 55.9465-145.96067 55.9465-201.91198 0-55.94942-55.9465-55.94942-145.95231 0-201.90823 27.97472-27.97419 64.43899-41.97635 100.9108-41.95752h.00377zM101.09953 247.97833\x22/>\x0a    <path d=\x22M101.999997 149.76247l47.762465-47.762464 50.737322 50.736905 50.737313-50.736905 47.762909 47.762464-50.737332 50.737312 50.737332 50.737322-47.762909 47.762908-50.737313-50.737331-50.737322 50.737331-47.762465-47.762908 50.736906-50.737322-50.736906-50.737312z\x22/>\x0a</svg>\x0a\x00\x00\x00\xe9<svg xmlns=\x22http://www.w3.org/2000/svg\x22 viewBox=\x220 0 16 16\x22>\x0a    <path d=\x22M5.52.359A.5.5 0 0 1 6 0h4a.5.5 0 0 1 .474.658L8.694 6H12.5a.5.5 0 0 1 .395.807l-7 9a.5.5 0 0 1-.873-.454L6.823 9.5H3.5a.5.5 0 0 1-.48-.641l2.5-8.5z\x22/>\x0a</svg>\x0a\x00\x00\x02\xb2<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a      <path d=\x22M9 36c3.39-.97 10.11.43 13.5-2 3.39 2.43 10.11 1.03 13.5 2 0 0 1.65.54 3 2-.68.97-1.65.99-3 .5-3.39-.97-10.11.46-13.5-1-3.39 1.46-10.11.03-13.5 1-1.354.49-2.323.47-3-.5 1.354-1.94 3-2 3-2zm6-4c2.5 2.5 12.5 2.5 15 0 .5-1.5 0-2 0-2 0-2.5-2.5-4-2.5-4 5.5-1.5 6-11.5-5-15.5-11 4-10.5 14-5 15.5 0 0-2.5 1.5-2.5 4 0 0-.5.5 0 2zM25 8a2.5 2.5 0 1 1-5 0 2.5 2.5 0 1 1 5 0z\x22 fill=\x22#000\x22 stroke-linecap=\x22butt\x22/>\x0a      <path d=\x22M17.5 26h10M15 30h15m-7.5-14.5v5M20 18h5\x22 stroke=\x22#fff\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x07/<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M79.40819148 363.54991612c-5.33144216 9.80499032-9.5749486 24.55770704-9.5749486 33.85333663 0 2.15805954 0 4.90290265.52208181 8.71047598L3.72145 288.76272123c-2.1328952-3.80757333-3.72142462-9.2703653-3.72142462-14.19201242 0-4.92816694 1.58852941-10.91906411 3.72142462-14.73315726l31.98944884-57.31571435L.00002537 181.7969678l116.20777116-2.2028833 56.49307218 104.2469896-36.23295527-21.28475872-57.05972196 100.99360074zm51.183914-330.76581884c10.1193144-18.03136987 26.65800668-27.85591964 46.89663546-27.85591964 21.87013445 0 38.9317044 10.38443909 51.18311815 31.64393352l18.1272217 31.1093085-62.91324594 111.37803982-101.80117823-60.59518247 48.50744886-85.68017973zm7.4420534 425.18825867c-30.3794313 0-55.42742044-25.65303635-55.42742044-56.76152987 0-8.73574027 3.74291274-23.487642 9.0743549-32.7580073l17.03928598-31.1093085H235.068953v120.62966065h-97.03479413zM239.33553926 29.48588467c-7.98721504-14.17326794-18.65009937-24.023082-31.4458789-29.48587397h131.11416192c11.72933193 0 20.78219872 4.92816694 26.13592487 14.21727671l32.5123265 56.76152987 35.1696911-21.30431818-56.51853959 103.73110906-115.64191724-1.66825827 35.71087346-20.7248694-57.03664212-101.52659582zm202.0384986 308.95213994c15.97283836 0 29.31298369-4.36746264 40.49874569-13.08445844l-66.1117929 117.88481754c-5.33144216 9.2703653-14.90639076 14.73315726-26.09533618 14.73315726h-62.39116412v42.02837261l-59.692415-102.06285079 59.692415-102.08893005v42.5890769h114.0995475zm51.1401419-98.25527745c4.80936034 8.73574028 7.48582549 18.00610557 7.48582549 27.83636019 0 19.65480438-12.27369773 40.39841827-29.3129837 50.20422356-8.0079073 4.39354192-19.21595328 7.13105023-30.3794313 7.13105023h-35.21027978l-62.87265725-111.37803983 101.80436165-59.49985315 48.48516488 85.706259z\x22/>\x0a</svg>\x0a\x00\x00\x03\xf4<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#000\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <g fill=\x22#000\x22 stroke=\x22none\x22>\x0a            <circle cx=\x226\x22 cy=\x2212\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2214\x22 cy=\x229\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2222.5\x22 cy=\x228\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2231\x22 cy=\x229\x22 r=\x222.75\x22/>\x0a            <circle cx=\x2239\x22 cy=\x2212\x22 r=\x222.75\x22/>\x0a        </g>\x0a        <path d=\x22M9 26c8.5-1.5 21-1.5 27 0l2.5-12.5L31 25l-.3-14.1-5.2 13.6-3-14.5-3 14.5-5.2-13.6L14 25 6.5 13.5 9 26zM9 26c0 2 1.5 2 2.5 4 1 1.5 1 1 .5 3.5-1.5 1-1.5 2.5-1.5 2.5-1.5 1.5.5 2.5.5 2.5 6.5 1 16.5 1 23 0 0 0 1.5-1 0-2.5 0 0 .5-1.5-1-2.5-.5-2.5-.5-2 .5-3.5 1-2 2.5-2 2.5-4-8.5-1.5-18.5-1.5-27 0z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M11 38.5a35 35 1 0 0 23 0\x22 fill=\x22none\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M11 29a35 35 1 0 1 23 0M12.5 31.5h20M11.5 34.5a35 35 1 0 0 22 0M10.5 37.5a35 35 1 0 0 24 0\x22 fill=\x22none\x22 stroke=\x22#fff\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x05\xde<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M328.75535002 228.45614965c10.38497196-7.15829289 22.63774463-10.2068381 34.6290252-8.81762763l136.61094413-141.1592204L423.49020216-.55133902l-136.62962213 141.1592204c1.38217253 12.5414835-1.68102064 25.35309126-8.89073139 36.21594543l50.78550138 51.63232283zM90.44265724 400.37096065l-4.9496694-5.11309137-25.90639744 21.62924098-43.63182512 71.02338106 11.16944807 11.53815658 68.80978077-45.07213397 20.91936584-26.68444358-4.96835496-5.19022734 86.89009713-89.7777249-21.5917788-21.99582082z\x22/>\x0a    <path d=\x22M209.27213843 151.47073557c10.03008983-37.0456128.93390036-78.45180293-27.21385638-107.58663382-28.0543667-28.86470664-67.67041982-38.33835033-103.32673542-28.3437527l60.38599704 62.36011486-15.83895004 61.08667193-59.2092826 16.36181232-60.36731902-62.3215257c-9.63785168 36.81407772-.48562819 77.7379031 27.5127045 106.6797881 29.34314919 30.33109547 71.63015732 39.22590146 108.61261143 26.8001855l.33620413.34730262 248.39881676 256.59875236c9.82463175 10.12965975 22.71245667 15.2620207 35.58160358 15.2620207 12.88782492 0 25.73829382-5.13236095 35.60028158-15.2620207 19.6305855-20.2400249 19.6305855-53.13730085 0-73.53168247l-250.47207556-258.451033zm219.20509163 323.2615608c-10.57175203 0-19.1449573-8.894806-19.1449573-19.85413311 0-10.9979163 8.57320527-19.8541331 19.1449573-19.8541331 10.64646406 0 19.25702535 8.8562168 19.25702535 19.8541331.018678 10.95932712-8.59188328 19.8541331-19.25702535 19.8541331z\x22/>\x0a</svg>\x0a\x00\x00\x01\x91<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path fill-rule=\x22evenodd\x22 d=\x22M170,20H330V80H170Z M90,50H140V110H360V50H410C426.569,50,440,63.431,440,80V470C440,486.569,426.569,500,410,500H90C73.431,500,60,486.569,60,470V80C60,63.431,73.431,50,90,50Z M110,220L135,195L160,220L210,170L235,195L160,270Z M260,200H390V240H260Z M110,360L135,335L160,360L210,310L235,335L160,410Z M260,340H390V380H260Z\x22/>\x0a</svg>\x0a\x00\x00\x03\xc2<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M 22,10 C 32.5,11 38.5,18 38,39 L 15,39 C 15,30 25,32.5 23,18\x22 style=\x22fill: #ffffff; stroke: #000000;\x22/>\x0a        <path d=\x22M 24,18 C 24.38,20.91 18.45,25.37 16,27 C 13,29 13.18,31.34 11,31 C 9.958,30.06 12.41,27.96 11,28 C 10,28 11.19,29.23 10,30 C 9,30 5.997,31 6,26 C 6,24 12,14 12,14 C 12,14 13.89,12.1 14,10.5 C 13.27,9.506 13.5,8.5 13.5,7.5 C 14.5,6.5 16.5,10 16.5,10 L 18.5,10 C 18.5,10 19.28,8.008 21,7 C 22,7 22,10 22,10\x22 style=\x22fill: #ffffff; stroke: #000000;\x22/>\x0a        <path d=\x22M 9.5 25.5 A 0.5 0.5 0 1 1 8.5,25.5 A 0.5 0.5 0 1 1 9.5 25.5 z\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a        <path d=\x22M 15 15.5 A 0.5 1.5 0 1 1 14,15.5 A 0.5 1.5 0 1 1 15 15.5 z\x22 transform=\x22matrix(0.866,0.5,-0.5,0.866,9.693,-5.173)\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02\xc7<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <g fill=\x22#fff\x22 stroke-linecap=\x22butt\x22>\x0a            <path d=\x22M9 36c3.39-.97 10.11.43 13.5-2 3.39 2.43 10.11 1.03 13.5 2 0 0 1.65.54 3 2-.68.97-1.65.99-3 .5-3.39-.97-10.11.46-13.5-1-3.39 1.46-10.11.03-13.5 1-1.354.49-2.323.47-3-.5 1.354-1.94 3-2 3-2zM15 32c2.5 2.5 12.5 2.5 15 0 .5-1.5 0-2 0-2 0-2.5-2.5-4-2.5-4 5.5-1.5 6-11.5-5-15.5-11 4-10.5 14-5 15.5 0 0-2.5 1.5-2.5 4 0 0-.5.5 0 2zM25 8a2.5 2.5 0 1 1-5 0 2.5 2.5 0 1 1 5 0z\x22/>\x0a        </g>\x0a        <path d=\x22M17.5 26h10M15 30h15m-7.5-14.5v5M20 18h5\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02k<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#000\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M9 39h27v-3H9v3zM12.5 32l1.5-2.5h17l1.5 2.5h-20zM12 36v-4h21v4H12z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M14 29.5v-13h17v13H14z\x22 stroke-linecap=\x22butt\x22 stroke-linejoin=\x22miter\x22/>\x0a        <path d=\x22M14 16.5L11 14h23l-3 2.5H14zM11 14V9h4v2h5V9h5v2h5V9h4v5H11z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M12 35.5h21M13 31.5h19M14 29.5h17M14 16.5h17M11 14h23\x22 fill=\x22none\x22 stroke=\x22#fff\x22 stroke-width=\x221\x22 stroke-linejoin=\x22miter\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02\xff<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22#fff\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M8 12a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM24.5 7.5a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM41 12a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM16 8.5a2 2 0 1 1-4 0 2 2 0 1 1 4 0zM33 9a2 2 0 1 1-4 0 2 2 0 1 1 4 0z\x22/>\x0a        <path d=\x22M9 26c8.5-1.5 21-1.5 27 0l2-12-7 11V11l-5.5 13.5-3-15-3 15-5.5-14V25L7 14l2 12zM9 26c0 2 1.5 2 2.5 4 1 1.5 1 1 .5 3.5-1.5 1-1.5 2.5-1.5 2.5-1.5 1.5.5 2.5.5 2.5 6.5 1 16.5 1 23 0 0 0 1.5-1 0-2.5 0 0 .5-1.5-1-2.5-.5-2.5-.5-2 .5-3.5 1-2 2.5-2 2.5-4-8.5-1.5-18.5-1.5-27 0z\x22 stroke-linecap=\x22butt\x22/>\x0a        <path d=\x22M11.5 30c3.5-1 18.5-1 22 0M12 33.5c6-1 15-1 21 0\x22 fill=\x22none\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x02`<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M257.998 144.04906L167.997 16.046924c-5.654-8.062934-18.34-8.062934-23.994 0L54.002 144.04906c-7.399 10.500267-.355 25.593601 11.997 25.593601H111v304.003207c0 8.843734 6.709 16 15 16h60c8.291 0 14.8-7.156267 14.8-16V169.642661H246c12.363 0 19.389-15.104 11.998-25.593601zM436.003 351.871336h-45.201V85.867607c0-7.738267-6.509-14-14.8-14h-60.001c-8.291 0-15 6.261733-15 14v266.002796H256c-12.353 0-19.396 13.206666-11.997 22.3944l90.002 112.001865c5.989 7.472267 18.014 7.461067 23.994 0L448 374.265736c7.391-9.1784.365-22.3944-11.997-22.3944z\x22/>\x0a</svg>\x0a\x00\x00\x02\xaa<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M250,20C294.183,20,330,55.817,330,100C330,144.183,294.183,180,250,180C205.817,180,170,144.183,170,100C170,55.817,205.817,20,250,20Z\x22/>\x0a    <path d=\x22M90,320C134.183,320,170,355.817,170,400C170,444.183,134.183,480,90,480C45.817,480,10,444.183,10,400C10,355.817,45.817,320,90,320Z\x22/>\x0a    <path d=\x22M410,320C454.183,320,490,355.817,490,400C490,444.183,454.183,480,410,480C365.817,480,330,444.183,330,400C330,355.817,365.817,320,410,320Z\x22/>\x0a    <path d=\x22M215.359,160L250.000,180L142.679,365.885L108.038,345.885Z\x22/>\x0a    <path d=\x22M249.999,180L284.641,160L391.962,345.885L357.321,365.885Z\x22/>\x0a    <path d=\x22M160,380H340V420H160Z\x22/>\x0a</svg>\x0a\x00\x00\x04p\x00\x00\x17Xx\x9c\xe5\x98\xcdn[7\x10\x85\xf7}\x0a\xc2\xfbK\x93\x9c\xff\x22\xc9:\x9bl\xbd/\xd4\x22Z\xd4mP\x07r\xa1\xa7\xef\xa1\x14Y\x94{]K\xb7r\xd1\xa2^\x19\x149\xfcf\xcep\xc8\xb9\xef\x1e6\x9f\xd3\xef\xf7?\xff\xf2\xf0\xfef\xfd\xf5\xeb\x97\xefoo\x1f\x1f\x1f\xf3#\xe5_\x7f\xfb|\xdbJ)\xb7\x98q\xf3\xe1\xbb\x84\xbfw_~\xf8\xbaN?\xbe\xbf\xf9T\xa9f#\x8fP\xf5Df\xd9\x0by\x0d\x95u#\xcdJ\x8c\x1fV\x9eU\x84\xd4\x95SIU\xb2q8\x85\xf0dY*L\x87\xb5\x93\xe1\xaaY<4\x9a\xb4\xbbJ\x9e\xb1\xb0\x05\xc9\xaaL\x91\xab6\xaad\x82\xb5%\x98\xad\xc40\x9d\xa6y3\xb4\x9e\x06\x9c\xa9\xf30W\xe3\x96\xca\xb8\x22Y\xe6f\xf0\x22\xe4dx0\xb4i\xade\xea?\x90\xb6UI\x91\x8b\x99z\xf3\xd4y\x84[\xabm\x98\x7f\xe2\xd78\xbe\xbd\xb9}\x1eJ\xa1\xcc\x12\xa5\xba\xb7\x14 \xe9n\xd6*\x1b*\x92[\x15\xb5\xa8\x86\x1d\xb1?\x00\x9d\x85RE\xfc\x10\x19u\x93\xc45\x93\x14*Z\x13!J\xd8\xaf\x12\xb5axM\x95sT\x00H\xf1U\xabY\x02`\xe2\x90\xa4/\xe0\xc2\xca=h\x9e\xc5\xf0\x7f\xf1\x93\xe1';Aw\x03\x1c$\x01\x8fkc\xadb\xd3\x00\xd4W0\xb5h\x8dlzf\xe90\xfe1\x1a(\x5c\xa8U^M;\xa4.\x0c\x0cyn?M\xfbu\x07O\xbe\x81I\xc4\xe9\xf8`o{\xcf\x9a\x83\x94\xdcO~P`by\xe3V\x90n\x96\x10\x88Bl\x22\x1c\x13\x11tSHh\x91\x90\xcb\xc4\xd4#\xc4\xe3\xf8\x98\xca\xf0\x90\x0a\xccs\x91\x1e\xb8\xe3\x82n\xd4\x05F\x15\xc9<\x8e?\x19\xf21w d'\xa2\xc0\xc9\x11\x9d\x06\xa2a\xc14o\xe74\x99O\x88\xc6\x15\xd3\x8eH\xcd*\xd7i\xd65\xdfL\x03\xd2\xf6S(\x8eoTv\xb8\x00\xb8h\x002\xda`m\x0d\x87\xc0\xa1k\xa4\xb3\x04\x8e\xdf\xdd\xf1w\x04\x97\xb36\xa4\x80\x14l\x94\x05&\x94\x11ZL\x11\x12\x94\x03\xc2a\xb5}V\x1c\xc7\x1e\x9e\x06\x13\xc1\x99Z\x8cj;\x8e\x1d'BUd\x06\xb4/\x955\x95\xcbq\xbcUjzm\x9c\x90\xa6\xb1\x04g\x17\x1d\x7f\x05\x07\x8b\x9a\xbb*\x8a\x14T]\x10){3\xb4\x05\xc2\x15\x5c\x0eo%\xdc.R\x86{`I\xa4\x16\x8b\xf869\xf5?\x15\x8e.\x10\xeeS\xad-si\x1e\xbdJ\xe1\x9e\xc2v\x8c:\xaf(\x8b\x07\xb6\x0e\xdc\xbc6B\xedG\xa1\xe5,d\xbd@j:\xc6j\xb0\x99f\xf6yx\x02\xa6l\xb5_<\xb87f\x9c\xd8L\xc3^\xa7\x95j\xf8\xe1d\xd6\xb9\x9c\xbb \xda\x958\xb7\xf7Mr\xe0\x1dUv\x09\xff\xc2n\xfa\xcani/Y-x\xd8\x94\xb4$D\xf3\xceo\xef\xc5r\x95b\xb2\xcf\xff%\xe1\xba\xaa\xac\xcfO\xc0b\xa08'\xa2\x87:\x7fnD\xaf#\xe6\xa2\x14\xff\xcf\xe8\x87G\x8e)\x9e{\xa2\xa3\xcd\xd5\x92p/uG^=\xbd\xdb{<\xb9PF\xab:\xde\xc5-7\x15\xe7\xaax\xe0a2*+U\x8fM\xef\x1a\x8a\x15\xd3f\xeb\xa7\xf1X\xbd|\x14\xd1i\x05\xc5\x9c'\xa9W\xea\x03\xe6\xf9\x17\xc7\xf6\x1e\xeeQ\x8e@\xaf\xd6\x5c\x80\x178\x1cx\xcf\xd7:\xd0\xe9\xfa8|\xa4\xa3Y:\x9f\xa3{8\x12\xd9ED\xfc\x02\x91\x9dG\xb4S~\x96\xe8[\xbc\xd0m\xed\xe7\xfe\x99\x8eg\xe8\xf8@\x87\xb6\xd8}'\xe7\x9b\xc4\xeb\x055\xff\xd1\xd8u:\x9e\x81\xe3\xc5b^#\xbdf\x93\x7f\x01\xd1^\xc0\xbfEtx\xcc\xbc&\xe0|z],`\xef\x7fI\xc3\xa4\x7f\x9c t\x86\x05\x9d<:I\xb4\x9a\x5c\xd1a&ES\xecx\xa0\xa0\xc9\xee\xdf\x118\xacI\xc2z\x14\x15\xc36k*\x19Ms\x88\xa3G}\xa9\xc4\x9c\xe1\xd3\xf3#\xe3\xaf\x1e\x99\x89\x9d\xf0\xb0\xd3&\xf0g\xdf\xbaW\xee1\xb6\xccV\x1c\xa0v\xe7X\x09P\xad,\x1f=S [@\xb8\xc2\x8e\xa4j\xa5_\x86\xe3C\xf2P\xd4\xe7\x1e\x92i_\xb1w\x9ch\xae\xb1_A\x15\xae\xaf\x16\xec\xd3\xd0\x8fp\xbbOa*\xa4L\xe7\xc1\xedSu\x0e\xeea\x19\x8f\x8c<\x9bi8\xcc\xe7\x03\xf1\x0c\x0f\xa7\xe1z\x93\x8b\x83u8Ec\xb0Z\x8dll$rf\xb0\xceS\xf2r\xb8\xebE\xee|)y\x06\x88\xff\x22\xb5F \xbd\x00\xc8\xaf\x92[3\xf2-\x00\xda_\xb2/\xeawh\x1f\xffm\xfa\xf1@w>[\xff\xb8\xfb\xae\x7f/\xff\xf0\xdd\x1f\xe4\xca\xdfP\x00\x00\x03\x14<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M204.092706 10.01507c-49.74747 0-99.50435 18.87853-137.32236 56.69584-75.63603 75.63274-75.72264 199.08407-.08661 274.71493 66.30673 66.30362 169.28485 74.47861 244.65164 24.53249l114.69669 114.6908c15.13511 15.13446 39.48242 15.13446 54.6164 0 15.1353-15.13445 15.1353-39.4798 0-54.61538l-114.61009-114.6908c49.88868-75.3541 41.66082-178.35854-24.62143-244.6471C303.598926 28.88042 253.840166 10 204.094586 10l-.00188.01507zm-.08661 51.14732c36.47181.01694 72.93608 13.98427 100.9108 41.95752 55.94942 55.9465 56.03603 145.95419.08661 201.90823-55.94943 55.9465-145.96067 55.9465-201.91198 0-55.94942-55.9465-55.94942-145.95231 0-201.90823 27.97472-27.97419 64.43899-41.97635 100.9108-41.95752h.00377zm-102.90657 186.81594\x22/>\x0a</svg>\x0a\x00\x00\x0e\xeb<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M309.9798241 436.2890708v14.60905273c0 11.62551378-8.89794174 21.29629516-20.4759864 22.9423856l-3.75214412 13.27160424c-2.03687823 7.2016457-8.79073761 12.2427977-16.61663819 12.2427977h-37.19982872c-7.82590056 0-14.57975996-5.041152-16.6166382-12.2427977l-3.64493998-13.27160422c-11.6852488-1.74897112-20.58319054-11.31687183-20.58319054-23.04526625v-14.60905273c0-7.81892962 6.53945116-14.09464947 14.68696408-14.09464947h89.515438c8.14751291.10288065 14.68696408 6.37860049 14.68696408 14.1975301z m68.93224747-196.91356973c0 33.2304509-13.72212702 63.37448221-36.02058343 85.4938226-16.93825055 16.87242708-27.87307052 38.37448354-31.51801051 61.31686916-1.60806176 9.87654268-10.5060035 17.18106904-21.012007 17.18106904h-79.65265918c-10.3987994 0-19.40394527-7.20164572-20.9048029-17.07818837-3.75214412-22.94238563-14.7941682-44.75308405-31.73241874-61.52263048-21.86963994-21.81069842-35.48456284-51.44032648-35.8061752-84.05349346-.75042882-68.51851486 56.06775337-123.9711868 127.46569554-124.48559006 71.29073805-.51440326 129.18096142 54.83538801 129.18096142 123.14814158z m-113.85077263-74.58847339c0-7.61316831-6.43224705-13.88888814-14.47255585-13.88888814-51.02915986 0-92.6243574 39.81481268-92.6243574 88.88888415 0 7.61316832 6.43224705 13.88888815 14.47255584 13.88888815 7.93310469 0 14.47255585-6.17283918 14.47255585-13.88888815 0-33.74485417 28.62349932-61.11110787 63.6792457-61.11110787 8.0403088 0 14.47255586-6.17283917 14.47255586-13.88888814z m-14.47255585-88.9917648c7.93310468 0 14.47255585-6.17283917 14.47255585-13.88888814V13.2438259c0-7.61316831-6.43224705-13.88888814-14.47255585-13.88888814s-14.47255583 6.17283917-14.47255583 13.88888814v48.66254885c0 7.71604897 6.53945114 13.88888815 14.47255583 13.88888815z M80.2414006 239.27262044c0-7.61316833-6.43224704-13.88888816-14.47255585-13.88888816h-50.7075475c-7.9331047 0-14.47255585 6.17283917-14.47255585 13.88888816 0 7.61316831 6.43224705 13.88888813 14.47255585 13.88888813h50.7075475c8.0403088 0 14.47255585-6.17283917 14.47255585-13.88888813z m405.87478832-13.88888816H435.4086414c-7.93310468 0-14.47255585 6.17283917-14.47255585 13.88888816 0 7.61316831 6.43224705 13.88888813 14.47255585 13.88888813h50.70754752c7.93310468 0 14.47255585-6.17283917 14.47255585-13.88888813 0-7.61316833-6.43224706-13.88888816-14.47255585-13.88888816z M109.72253289 354.91047432l-35.91337932 34.46501873c-5.68181823 5.45267461-5.68181823 14.19753012 0 19.65020471 2.78730704 2.674897 6.53945116 4.01234547 10.18439115 4.01234547s7.3970841-1.33744848 10.18439115-4.01234546l35.91337931-34.46501872c5.68181822-5.4526746 5.68181822-14.19753012 0-19.65020473-5.57461411-5.4526746-14.7941682-5.4526746-20.36878229 0z m271.54802926-227.1604817c3.64493999 0 7.3970841-1.33744849 10.18439115-4.01234546l35.91337931-34.46501873c5.68181822-5.4526746 5.68181822-14.19753012 0-19.65020472-5.68181822-5.4526746-14.7941682-5.4526746-20.47598642 0l-35.9133793 34.46501873c-5.68181823 5.4526746-5.68181823 14.1975301 0 19.65020471 2.89451116 2.67489698 6.53945115 4.01234546 10.29159525 4.01234546z M109.7225329 123.6347665c2.78730705 2.67489698 6.53945114 4.01234547 10.18439114 4.01234547s7.3970841-1.3374485 10.18439114-4.01234547c5.68181823-5.4526746 5.68181823-14.1975301 0-19.65020471l-35.9133793-34.46501875c-5.68181823-5.4526746-14.79416821-5.4526746-20.47598643 0s-5.68181821 14.1975301 0 19.65020471l36.02058344 34.46501873z m281.7324204 231.27570781c-5.68181822-5.4526746-14.7941682-5.4526746-20.4759864 0-5.68181823 5.45267462-5.68181823 14.19753012 0 19.65020471l35.9133793 34.46501874c2.78730705 2.674897 6.53945116 4.01234547 10.18439115 4.01234547s7.39708409-1.33744848 10.18439116-4.01234546c5.68181821-5.45267459 5.68181821-14.1975301 0-19.6502047l-35.8061752-34.46501875z\x22/>\x0a</svg>\x0a\x00\x00\x04\xde<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <g fill=\x22none\x22 fill-rule=\x22evenodd\x22 stroke=\x22#000\x22 stroke-width=\x221.5\x22 stroke-linecap=\x22round\x22 stroke-linejoin=\x22round\x22>\x0a        <path d=\x22M 22,10 C 32.5,11 38.5,18 38,39 L 15,39 C 15,30 25,32.5 23,18\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a        <path d=\x22M 24,18 C 24.38,20.91 18.45,25.37 16,27 C 13,29 13.18,31.34 11,31 C 9.958,30.06 12.41,27.96 11,28 C 10,28 11.19,29.23 10,30 C 9,30 5.997,31 6,26 C 6,24 12,14 12,14 C 12,14 13.89,12.1 14,10.5 C 13.27,9.506 13.5,8.5 13.5,7.5 C 14.5,6.5 16.5,10 16.5,10 L 18.5,10 C 18.5,10 19.28,8.008 21,7 C 22,7 22,10 22,10\x22 style=\x22fill: #000000; stroke: #000000;\x22/>\x0a        <path d=\x22M 9.5 25.5 A 0.5 0.5 0 1 1 8.5,25.5 A 0.5 0.5 0 1 1 9.5 25.5 z\x22 style=\x22fill: #ececec; stroke: #ececec;\x22/>\x0a        <path d=\x22M 15 15.5 A 0.5 1.5 0 1 1 14,15.5 A 0.5 1.5 0 1 1 15 15.5 z\x22 transform=\x22matrix(0.866,0.5,-0.5,0.866,9.693,-5.173)\x22 style=\x22fill: #ececec; stroke: #ececec;\x22/>\x0a        <path d=\x22M 24.55,10.4 L 24.1,11.85 L 24.6,12 C 27.75,13 30.25,14.49 32.5,18.75 C 34.75,23.01 35.75,29.06 35.25,39 L 35.2,39.5 L 37.45,39.5 L 37.5,39 C 38,28.94 36.62,22.15 34.25,17.66 C 31.88,13.17 28.46,11.02 25.06,10.5 L 24.55,10.4 z\x22 style=\x22fill: #ececec; stroke: none;\x22/>\x0a    </g>\x0a</svg>\x0a\x00\x00\x03\x0e<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M451.655,414.239H33.048C14.798,414.239,0,428.659,0,446.91c0,18.25,14.798,32.67,33.048,32.67h418.607c18.249,0,33.047-14.42,33.047-32.67C484.702,428.659,469.904,414.239,451.655,414.239z\x22/>\x0a    <path d=\x22M217.351,370.521c13.862,19.657,37.98,17.842,50.002,0c30.482-45.242,126.299-177.947,126.299-177.947c7.233-10.19,6.901-23.929-0.812-33.762c-7.716-9.834-20.983-13.421-32.602-8.819l-73.499,29.111l9.703-143.854c0.531-7.827-2.223-15.52-7.6-21.238c-5.376-5.712-12.887-8.935-20.729-8.889h-51.525c-7.844-0.046-15.354,3.176-20.73,8.889c-5.376,5.718-8.13,13.412-7.6,21.238l9.704,143.854l-73.499-29.111c-11.617-4.602-24.886-1.015-32.602,8.819c-7.713,9.833-8.045,23.571-0.811,33.762C91.052,192.573,185.911,325.939,217.351,370.521z\x22/>\x0a</svg>\x0a\x00\x00\x02\x85<svg xmlns=\x22http://www.w3.org/2000/svg\x22>\x0a    <path d=\x22M500.01043569 407.4694648l-92.62322766 92.53053808s-146.55976715-157.34220996-157.4403982-157.34220996c-10.77458201 0-157.35555897 157.34220996-157.35555897 157.34220996L.01044281 407.4694648s157.33434917-144.4053252 157.33434917-157.32100195C157.34479198 237.10553805.0104428 92.6153808.0104428 92.6153808L92.59125086.0000107s147.81114577 157.38462597 157.35555897 157.38462597c9.58683282 0 157.4403982-157.38462597 157.4403982-157.38462597l92.62322766 92.61537011s-157.4191884 146.63216602-157.4191884 157.53308204c0 10.6252119 157.4191884 157.32100195 157.4191884 157.32100195z\x22/>\x0a</svg>\x0a"
 qRegisterResourceData(0x03, IconStructure, IconNames, IconData)
 
 
@@ -7,9 +7,7 @@ from PySide6.QtMultimedia import QSoundEffect
 class SoundEffect:
     """Playback of sound effects appropriate for type of move."""
 
-    def __init__(self, game: Game) -> None:
-        self._game: Game = game
-
+    def __init__(self) -> None:
         self._sound_effects: dict[str, QSoundEffect] = {}
         self._preload_sound_effects()
 
@@ -30,23 +28,23 @@ class SoundEffect:
             sound_effect.setSource(file_url)
             self._sound_effects[file_name] = sound_effect
 
-    def _sound_effect_name(self, move: Move) -> str:
-        """Get name of sound effect based on `move`."""
-        if self._game.is_over_after(move):
+    def _sound_effect_name(self, facts: MoveFacts) -> str:
+        """Get name of sound effect based on move `facts`."""
+        if facts.is_over:
             return "game-over"
-        if self._game.gives_check(move):
+        if facts.is_check:
             return "check"
-        if move.promotion is not None:
+        if facts.promotion is not None:
             return "promotion"
-        if self._game.board.is_capture(move):
+        if facts.is_capture:
             return "capture"
-        if self._game.board.is_castling(move):
+        if facts.is_castling:
             return "castling"
         return "move"
 
-    def play(self, move: Move) -> None:
-        """Play sound effect for `move`."""
-        sound_effect_name: str = self._sound_effect_name(move)
+    def play(self, facts: MoveFacts) -> None:
+        """Play sound effect for move described by `facts`."""
+        sound_effect_name: str = self._sound_effect_name(facts)
         self._sound_effects[sound_effect_name].play()
 
     def play_time_expired(self) -> None:
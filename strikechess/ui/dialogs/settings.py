@@ -26,13 +26,22 @@ class SettingsDialog(QDialog):
     def __init__(self) -> None:
         super().__init__()
 
-        self._initial_settings: dict[str, bool | float | str] = {
+        self._initial_settings: dict[str, bool | float | str | tuple[str, float]] = {
             "board_size": setting_value("board", "size"),
+            "book_depth": setting_value("book", "depth"),
+            "book_variety": setting_value("book", "variety"),
             "clock_increment": setting_value("clock", "increment"),
             "clock_time": setting_value("clock", "time"),
             "human_name": setting_value("human", "name"),
+            "is_engine_early_stop_on": setting_value("engine", "is_early_stop_on"),
             "is_engine_ponder_on": setting_value("engine", "is_ponder_on"),
+            "is_engine_standby_on": setting_value("engine", "is_standby_on"),
             "is_engine_white": setting_value("engine", "is_white"),
+            "engine_analysis_lines": setting_value("engine", "analysis_lines"),
+            "engine_limit": (
+                setting_value("engine", "limit_mode"),
+                setting_value("engine", "limit_value"),
+            ),
         }
 
         self._button_box: QDialogButtonBox = QDialogButtonBox(Save | Cancel)
@@ -49,6 +58,7 @@ class SettingsDialog(QDialog):
         """Create groups for related settings to be put together."""
         self._human_name_group: QGroupBox = QGroupBox("Human name")
         self._engine_group: QGroupBox = QGroupBox("Engine")
+        self._book_group: QGroupBox = QGroupBox("Opening book")
         self._time_control_group: QGroupBox = QGroupBox("Time control")
         self._board_size_group: QGroupBox = QGroupBox("Board size")
 
@@ -71,6 +81,66 @@ class SettingsDialog(QDialog):
         self._engine_ponder_option.setText("Ponder")
         self._engine_ponder_option.setChecked(setting_value("engine", "is_ponder_on"))
 
+        self._engine_standby_option: QCheckBox = QCheckBox()
+        self._engine_standby_option.setText("Hot standby")
+        self._engine_standby_option.setChecked(setting_value("engine", "is_standby_on"))
+
+        self._engine_early_stop_option: QCheckBox = QCheckBox()
+        self._engine_early_stop_option.setText("Stop converged analysis")
+        self._engine_early_stop_option.setChecked(
+            setting_value("engine", "is_early_stop_on")
+        )
+
+        self._engine_limit_option: QComboBox = QComboBox()
+        self._engine_limit_option.addItem("Clock", ("clock", 0.0))
+        self._engine_limit_option.addItem("1 second per move", ("time", 1.0))
+        self._engine_limit_option.addItem("5 seconds per move", ("time", 5.0))
+        self._engine_limit_option.addItem("15 seconds per move", ("time", 15.0))
+        self._engine_limit_option.addItem("100,000 nodes", ("nodes", 100_000.0))
+        self._engine_limit_option.addItem("1,000,000 nodes", ("nodes", 1_000_000.0))
+        self._engine_limit_option.addItem("Depth 10", ("depth", 10.0))
+        self._engine_limit_option.addItem("Depth 20", ("depth", 20.0))
+        self._engine_limit_option.setCurrentIndex(
+            next(
+                (
+                    index
+                    for index in range(self._engine_limit_option.count())
+                    if self._engine_limit_option.itemData(index)
+                    == self._initial_settings["engine_limit"]
+                ),
+                0,
+            )
+        )
+
+        self._engine_lines_option: QComboBox = QComboBox()
+        self._engine_lines_option.addItem("1 analysis line", 1)
+        self._engine_lines_option.addItem("2 analysis lines", 2)
+        self._engine_lines_option.addItem("3 analysis lines", 3)
+        self._engine_lines_option.addItem("4 analysis lines", 4)
+        self._engine_lines_option.addItem("5 analysis lines", 5)
+        self._engine_lines_option.setCurrentIndex(
+            self._engine_lines_option.findData(
+                setting_value("engine", "analysis_lines")
+            )
+        )
+
+        self._book_depth_option: QComboBox = QComboBox()
+        self._book_depth_option.addItem("No book moves", 0)
+        self._book_depth_option.addItem("Book up to 8 plies", 8)
+        self._book_depth_option.addItem("Book up to 16 plies", 16)
+        self._book_depth_option.addItem("Book up to 32 plies", 32)
+        self._book_depth_option.setCurrentIndex(
+            self._book_depth_option.findData(setting_value("book", "depth"))
+        )
+
+        self._book_variety_option: QComboBox = QComboBox()
+        self._book_variety_option.addItem("Best book moves", 0)
+        self._book_variety_option.addItem("Varied book moves", 50)
+        self._book_variety_option.addItem("Any book moves", 100)
+        self._book_variety_option.setCurrentIndex(
+            self._book_variety_option.findData(setting_value("book", "variety"))
+        )
+
         self._clock_time_option: QComboBox = QComboBox()
         self._clock_time_option.addItem("1 minute", 60.0)
         self._clock_time_option.addItem("3 minutes", 180.0)
@@ -111,8 +181,17 @@ class SettingsDialog(QDialog):
         engine_layout.addWidget(self._engine_black_option)
         engine_layout.addWidget(self._engine_white_option)
         engine_layout.addWidget(self._engine_ponder_option)
+        engine_layout.addWidget(self._engine_standby_option)
+        engine_layout.addWidget(self._engine_early_stop_option)
+        engine_layout.addWidget(self._engine_limit_option)
+        engine_layout.addWidget(self._engine_lines_option)
         self._engine_group.setLayout(engine_layout)
 
+        book_layout: QHBoxLayout = QHBoxLayout()
+        book_layout.addWidget(self._book_depth_option)
+        book_layout.addWidget(self._book_variety_option)
+        self._book_group.setLayout(book_layout)
+
         time_control_layout: QHBoxLayout = QHBoxLayout()
         time_control_layout.addWidget(self._clock_time_option)
         time_control_layout.addWidget(self._clock_increment_option)
@@ -125,6 +204,7 @@ class SettingsDialog(QDialog):
         vertical_layout: QVBoxLayout = QVBoxLayout()
         vertical_layout.addWidget(self._human_name_group)
         vertical_layout.addWidget(self._engine_group)
+        vertical_layout.addWidget(self._book_group)
         vertical_layout.addWidget(self._time_control_group)
         vertical_layout.addWidget(self._board_size_group)
         vertical_layout.addWidget(self._button_box)
@@ -137,10 +217,16 @@ class SettingsDialog(QDialog):
         self._button_box.rejected.connect(self.reject)
 
         self._board_size_option.currentIndexChanged.connect(self.on_edited)
+        self._book_depth_option.currentIndexChanged.connect(self.on_edited)
+        self._book_variety_option.currentIndexChanged.connect(self.on_edited)
         self._clock_increment_option.currentIndexChanged.connect(self.on_edited)
         self._clock_time_option.currentIndexChanged.connect(self.on_edited)
         self._engine_black_option.toggled.connect(self.on_edited)
+        self._engine_early_stop_option.toggled.connect(self.on_edited)
+        self._engine_limit_option.currentIndexChanged.connect(self.on_edited)
+        self._engine_lines_option.currentIndexChanged.connect(self.on_edited)
         self._engine_ponder_option.toggled.connect(self.on_edited)
+        self._engine_standby_option.toggled.connect(self.on_edited)
         self._engine_white_option.toggled.connect(self.on_edited)
         self._human_name_option.textChanged.connect(self.on_edited)
 
@@ -151,13 +237,19 @@ class SettingsDialog(QDialog):
 
     def is_edited(self) -> bool:
         """Return True if any setting is edited."""
-        current_settings: dict[str, bool | float | str] = {
+        current_settings: dict[str, bool | float | str | tuple[str, float]] = {
             "board_size": self._board_size_option.currentData(),
+            "book_depth": self._book_depth_option.currentData(),
+            "book_variety": self._book_variety_option.currentData(),
             "clock_increment": self._clock_increment_option.currentData(),
             "clock_time": self._clock_time_option.currentData(),
             "human_name": self._human_name_option.text().strip() or "Human",
+            "is_engine_early_stop_on": self._engine_early_stop_option.isChecked(),
             "is_engine_ponder_on": self._engine_ponder_option.isChecked(),
+            "is_engine_standby_on": self._engine_standby_option.isChecked(),
             "is_engine_white": self._engine_white_option.isChecked(),
+            "engine_analysis_lines": self._engine_lines_option.currentData(),
+            "engine_limit": self._engine_limit_option.currentData(),
         }
         return current_settings != self._initial_settings
 
@@ -184,6 +276,42 @@ class SettingsDialog(QDialog):
             key="is_ponder_on",
             value=self._engine_ponder_option.isChecked(),
         )
+        set_setting_value(
+            section="engine",
+            key="is_standby_on",
+            value=self._engine_standby_option.isChecked(),
+        )
+        set_setting_value(
+            section="engine",
+            key="is_early_stop_on",
+            value=self._engine_early_stop_option.isChecked(),
+        )
+        limit_mode, limit_value = self._engine_limit_option.currentData()
+        set_setting_value(
+            section="engine",
+            key="limit_mode",
+            value=limit_mode,
+        )
+        set_setting_value(
+            section="engine",
+            key="limit_value",
+            value=limit_value,
+        )
+        set_setting_value(
+            section="engine",
+            key="analysis_lines",
+            value=self._engine_lines_option.currentData(),
+        )
+        set_setting_value(
+            section="book",
+            key="depth",
+            value=self._book_depth_option.currentData(),
+        )
+        set_setting_value(
+            section="book",
+            key="variety",
+            value=self._book_variety_option.currentData(),
+        )
         set_setting_value(
             section="clock",
             key="time",
@@ -2,25 +2,52 @@ from enum import StrEnum
 from functools import partial
 from pathlib import Path
 from re import sub
+from time import perf_counter
 from typing import Final, Literal
 
-from chess import BLACK, WHITE, Move
-from chess.engine import Score
-from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
+from chess import BLACK, WHITE, Board, Color, Move, PieceType
+from chess.engine import Limit, Score
+from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtGui import QCloseEvent, QWheelEvent
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
     QGridLayout,
+    QInputDialog,
     QLabel,
     QMainWindow,
     QMessageBox,
     QWidget,
 )
 
-from strikechess.core import Engine, Game
+from strikechess.core import (
+    Engine,
+    EnginePool,
+    EngineProfile,
+    Game,
+    PonderStatistics,
+    Speculator,
+    is_host_address,
+    saved_engine_path,
+)
+from strikechess.logic import (
+    AnalysisCache,
+    AnalysisInfo,
+    ClockState,
+    GameJournal,
+    GameReview,
+    JournalEvent,
+    LimitMode,
+    MoveFacts,
+    OverheadEstimator,
+    PlyReview,
+    PositionSnapshot,
+    SanCache,
+    engine_limit,
+    review_positions,
+)
 from strikechess.ui.audio import SoundEffect
-from strikechess.ui.dialogs import SettingsDialog
+from strikechess.ui.dialogs import PromotionDialog, SettingsDialog
 from strikechess.ui.table import TableModel, TableView
 from strikechess.ui.widgets import DigitalClock, EvaluationBar, FenEditor, SvgBoard
 from strikechess.utils import (
@@ -28,6 +55,8 @@ from strikechess.utils import (
     create_action,
     engine_file_filter,
     find_opening,
+    flush_settings,
+    score_text,
     set_setting_value,
     setting_value,
     show_info,
@@ -49,10 +78,26 @@ class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
 
-        self._game: Game = Game()
-        self._engine: Engine = Engine(self._game)
+        self._journal: GameJournal = GameJournal("strikechess/game.journal")
+        self._game: Game = Game(self.promotion_piece_type, self._journal)
+        self._analysis_cache: AnalysisCache = AnalysisCache(
+            "strikechess/analysis_cache.sqlite3"
+        )
+        self._engine: Engine = Engine(self._analysis_cache)
+        self._engine_overhead: OverheadEstimator = OverheadEstimator()
+        self._engine_invoked_at: float = 0.0
+        self._san_cache: SanCache = SanCache()
 
-        self._table_model: TableModel = TableModel(self._game.moves)
+        self._engine_pool: EnginePool = EnginePool(
+            saved_engine_path(), analysis_cache=self._analysis_cache
+        )
+        self._speculator: Speculator = Speculator(
+            self._analysis_cache, saved_engine_path()
+        )
+        self._review: GameReview | None = None
+        self._reviewed_positions: list[tuple[int, str]] = []
+
+        self._table_model: TableModel = TableModel(self._game.history)
         self._table_view: TableView = TableView(self._table_model)
 
         self._black_clock: DigitalClock = DigitalClock(ClockColor.Black)
@@ -60,11 +105,12 @@ class MainWindow(QMainWindow):
 
         self._board: SvgBoard = SvgBoard(self._game)
         self._fen_editor: FenEditor = FenEditor(self._game)
-        self._sound_effect: SoundEffect = SoundEffect(self._game)
+        self._sound_effect: SoundEffect = SoundEffect()
         self._evaluation_bar: EvaluationBar = EvaluationBar()
 
         self._engine_analysis_label: QLabel = QLabel()
         self._engine_analysis_label.setObjectName("engineAnalysis")
+        self._engine_analysis_label.setWordWrap(True)
         self._engine_analysis_label.hide()
 
         self._engine_name_label: QLabel = QLabel()
@@ -99,7 +145,14 @@ class MainWindow(QMainWindow):
         self.apply_style(setting_value("ui", "style"))
 
         self.align_orientation_to_engine()
-        self.invoke_engine()
+
+        if not self.restore_journaled_game():
+            self.invoke_engine()
+
+    @property
+    def engine(self) -> Engine:
+        """Get engine that plays and analyzes in main window."""
+        return self._engine
 
     def create_layout(self) -> None:
         """Create grid layout with fixed widget positions."""
@@ -136,6 +189,20 @@ class MainWindow(QMainWindow):
             shortcut="F1",
             status_tip="Shows the About dialog.",
         )
+        self.calibrate_engine_action = create_action(
+            handler=self.calibrate_engine,
+            icon=svg_icon("calibrate-engine"),
+            name="Calibrate engine",
+            shortcut="Ctrl+B",
+            status_tip="Finds the fastest threads and hash settings of the engine.",
+        )
+        self.connect_engine_host_action = create_action(
+            handler=self.connect_engine_host,
+            icon=svg_icon("connect-engine-host"),
+            name="Connect to engine host...",
+            shortcut="Ctrl+H",
+            status_tip="Asks for the address of an engine host to use its engine.",
+        )
         self.dark_forest_style_action = create_action(
             handler=partial(self.apply_style, "dark-forest"),
             icon=colorize_icon("#2d382d"),
@@ -199,6 +266,13 @@ class MainWindow(QMainWindow):
             shortcut="Alt+8",
             status_tip="Applies the light ocean style.",
         )
+        self.load_book_action = create_action(
+            handler=self.load_book,
+            icon=svg_icon("load-book"),
+            name="Load opening book...",
+            shortcut="Ctrl+O",
+            status_tip="Shows the file manager to load a Polyglot opening book.",
+        )
         self.load_engine_action = create_action(
             handler=self.load_engine,
             icon=svg_icon("load-engine"),
@@ -227,6 +301,13 @@ class MainWindow(QMainWindow):
             shortcut="Ctrl+Q",
             status_tip="Offers to quit the app.",
         )
+        self.review_game_action = create_action(
+            handler=self.review_game,
+            icon=svg_icon("review-game"),
+            name="Review game",
+            shortcut="Ctrl+R",
+            status_tip="Reviews every move of the game with several engines.",
+        )
         self.settings_action = create_action(
             handler=self.show_settings_dialog,
             icon=svg_icon("settings"),
@@ -270,6 +351,18 @@ class MainWindow(QMainWindow):
         # General menu > Load engine...
         general_menu.addAction(self.load_engine_action)
 
+        # General menu > Load opening book...
+        general_menu.addAction(self.load_book_action)
+
+        # General menu > Connect to engine host...
+        general_menu.addAction(self.connect_engine_host_action)
+
+        # General menu > Calibrate engine
+        general_menu.addAction(self.calibrate_engine_action)
+
+        # General menu > Review game
+        general_menu.addAction(self.review_game_action)
+
         # General menu separator
         general_menu.addSeparator()
 
@@ -336,6 +429,9 @@ class MainWindow(QMainWindow):
         # Edit area > Stop analysis
         edit_area.addAction(self.stop_analysis_action)
 
+        # Edit area > Review game
+        edit_area.addAction(self.review_game_action)
+
         # Edit area > Settings
         edit_area.addAction(self.settings_action)
 
@@ -410,15 +506,20 @@ class MainWindow(QMainWindow):
     def connect_signals_to_slots(self) -> None:
         """Connect component signals to corresponding slot methods."""
         self._black_clock.time_expired.connect(self.on_black_time_expired)
-        self._engine.best_move_analyzed.connect(self.on_best_move_analyzed)
+        self._engine.analysis_converged.connect(self.on_analysis_converged)
+        self._engine.analysis_updated.connect(self.on_analysis_updated)
+        self._engine.calibration_finished.connect(self.on_calibration_finished)
+        self._engine.engine_loaded.connect(self.on_engine_loaded)
         self._engine.load_failed.connect(self.on_load_failed)
-        self._engine.move_played.connect(self.on_move_played)
-        self._engine.score_analyzed.connect(self.on_score_analyzed)
-        self._engine.variation_analyzed.connect(self.on_variation_analyzed)
+        self._engine.move_played.connect(self.on_engine_move_played)
+        self._engine_pool.position_reviewed.connect(self.on_position_reviewed)
+        self._engine_pool.review_finished.connect(self.on_review_finished)
+        self._speculator.position_analyzed.connect(self.on_position_analyzed)
         self._fen_editor.fen_validated.connect(self.on_fen_validated)
         self._game.move_played.connect(self.on_move_played)
         self._game.sound_effect_played.connect(self.on_sound_effect_played)
         self._table_view.item_selected.connect(self.on_item_selected)
+        self._table_view.variation_selected.connect(self.on_variation_selected)
         self._white_clock.time_expired.connect(self.on_white_time_expired)
 
     def apply_style(self, file_name: str) -> None:
@@ -437,12 +538,28 @@ class MainWindow(QMainWindow):
     def invoke_engine(self, by_force: bool = False) -> None:
         """Invoke engine when on turn or when `by_force` is True."""
         if self.should_invoke_engine() or by_force:
-            QThreadPool.globalInstance().start(self._engine.play_move)
+            limit: Limit = engine_limit(
+                mode=LimitMode(setting_value("engine", "limit_mode")),
+                value=setting_value("engine", "limit_value"),
+                clocks=self.clock_state(),
+                overhead=self._engine_overhead.seconds,
+            )
+            self._engine_invoked_at = perf_counter()
+            self._engine.play_move(self._game.snapshot, limit)
             self._game_notifications_label.setText("Thinking...")
 
+    def clock_state(self) -> ClockState:
+        """Get remaining time and increment of both clocks."""
+        return ClockState(
+            white_time=self._white_clock.time,
+            black_time=self._black_clock.time,
+            white_increment=self._white_clock.increment,
+            black_increment=self._black_clock.increment,
+        )
+
     def invoke_analysis(self) -> None:
         """Invoke engine to start analysis."""
-        QThreadPool.globalInstance().start(self._engine.start_analysis)
+        self._engine.start_analysis(self._game.snapshot)
         self._game_notifications_label.setText("Analyzing...")
 
     def quit(self) -> None:
@@ -488,6 +605,15 @@ class MainWindow(QMainWindow):
         if settings_dialog.exec() == QDialog.DialogCode.Accepted:
             self.apply_saved_settings()
 
+    def promotion_piece_type(self, turn: Color) -> PieceType | None:
+        """Get promotion piece type for `turn` from promotion dialog."""
+        promotion_dialog: PromotionDialog = PromotionDialog(turn)
+
+        if promotion_dialog.exec() == QDialog.DialogCode.Accepted:
+            return promotion_dialog.piece_type
+
+        return None
+
     def apply_saved_settings(self) -> None:
         """Act on edited settings being saved."""
         if not self._game.is_in_progress():
@@ -511,14 +637,41 @@ class MainWindow(QMainWindow):
         if path_to_file:
             self.start_new_engine(path_to_file)
 
+    def load_book(self) -> None:
+        """Show file manager to load Polyglot opening book."""
+        path_to_file, _ = QFileDialog.getOpenFileName(
+            self,
+            "File Manager",
+            Path.home().as_posix(),
+            "Polyglot book (*.bin)",
+        )
+
+        if not path_to_file:
+            return
+
+        if self._engine.load_book(path_to_file):
+            set_setting_value("book", "path", path_to_file)
+        else:
+            show_info(self, "Opening book failed to load.")
+
+    def connect_engine_host(self) -> None:
+        """Ask for address of engine host to load its engine."""
+        address, is_accepted = QInputDialog.getText(
+            self,
+            "Engine host",
+            "Address (tcp://host:port or unix:///path/to/socket):",
+            text=setting_value("engine", "host_address"),
+        )
+
+        if is_accepted and is_host_address(address.strip()):
+            set_setting_value("engine", "host_address", address.strip())
+            self.start_new_engine(address.strip())
+
     def start_new_engine(self, path_to_file: str) -> None:
         """Start new engine from file at `path_to_file`."""
         self.stop_analysis()
 
         self._engine.load_from_file_at(path_to_file)
-        self._engine_name_label.setText(self._engine.name)
-        self._engine_name_label.setToolTip(self._engine.name)
-
         self.invoke_engine()
 
     def show_about(self) -> None:
@@ -569,6 +722,7 @@ class MainWindow(QMainWindow):
 
     def start_analysis(self) -> None:
         """Start analyzing current position."""
+        self._speculator.cancel()
         self.invoke_analysis()
         self.show_analysis_ui()
 
@@ -588,6 +742,59 @@ class MainWindow(QMainWindow):
         self.switch_clock_timers()
         self.hide_analysis_ui()
 
+    def speculate(self) -> None:
+        """Show cached evaluation of shown ply and analyze plies around it."""
+        self._speculator.follow(
+            self._game.history.neighborhood(
+                self._game.ply, setting_value("engine", "speculation_radius")
+            )
+        )
+
+    def play_premove(self) -> None:
+        """Play first queued premove if it is legal after engine's move.
+
+        Premove is pushed before board is repainted, so player's clock is
+        stopped before its countdown timer has had chance to charge time.
+        """
+        premove: Move | None = self._game.pop_premove()
+
+        if premove is not None:
+            self._game.push(premove)
+
+    def show_evaluation(self, score: Score) -> None:
+        """Show evaluation bar animated to `score` without analysis label."""
+        self._evaluation_bar.show()
+        self._evaluation_bar.animate(score)
+
+    def calibrate_engine(self) -> None:
+        """Calibrate engine in background without interrupting game."""
+        self.calibrate_engine_action.setDisabled(True)
+        self._engine.calibrate()
+        self._game_notifications_label.setText("Calibrating...")
+
+    def review_game(self) -> None:
+        """Review every move of current line with engine pool."""
+        if not len(self._game.history):
+            return
+
+        self.stop_analysis()
+        self._table_model.clear_review()
+
+        self._reviewed_positions = review_positions(self._game.history)
+        self._review = GameReview(self._game.history.root().turn)
+        self._engine_pool.review(self._reviewed_positions)
+
+        self._game_notifications_label.setText("Reviewing...")
+
+    def cancel_review(self) -> None:
+        """Cancel game review and remove its results from move table."""
+        if self._review is None:
+            return
+
+        self._engine_pool.cancel()
+        self._review = None
+        self._table_model.clear_review()
+
     def show_fen(self) -> None:
         """Show FEN in editor."""
         self._fen_editor.clearFocus()
@@ -612,12 +819,26 @@ class MainWindow(QMainWindow):
         self.show_fen()
         self.show_opening()
         self.stop_analysis()
+        self._speculator.cancel()
         self.invoke_engine()
 
         if self._game.is_over():
             self._black_clock.stop_timer()
             self._white_clock.stop_timer()
-            self._game_notifications_label.setText(self._game.result)
+            self.announce_result()
+
+    def announce_result(self) -> None:
+        """Stop engine pondering and show game result with ponder statistics."""
+        self._engine.stop_pondering()
+        statistics: PonderStatistics = self._engine.ponder_statistics
+
+        self._game_notifications_label.setText(self._game.result)
+        self._game_notifications_label.setToolTip(
+            f"Ponder hits: {statistics.hits}/{statistics.predictions} "
+            f"({statistics.hit_rate:.0%}), saved {statistics.saved_time:.1f} s"
+            if statistics.predictions
+            else ""
+        )
 
     def offer_new_game(self) -> None:
         """Show dialog offering to start new game."""
@@ -637,19 +858,72 @@ class MainWindow(QMainWindow):
         self._black_clock.reset()
         self._white_clock.reset()
 
-        self._table_model.reset()
         self._openings_label.clear()
         self._game.prepare_new_game()
+        self._table_model.reset()
         self._board.enable_interaction()
 
         self.show_fen()
         self.stop_analysis()
+        self.cancel_review()
+        self._speculator.cancel()
+        self._engine.cancel_all()
+        self._engine.reset_ponder_statistics()
+        self._game_notifications_label.setToolTip("")
         self.align_orientation_to_engine()
         self.invoke_engine()
 
+    def restore_journaled_game(self) -> bool:
+        """Restore game from journal and return True if there was one."""
+        self._game.replay(self._journal.records)
+
+        if not self._game.is_in_progress():
+            return False
+
+        self._table_model.reset()
+        ply: int = self._game.ply
+
+        if ply == len(self._game.history):
+            self.refresh_ui()
+        elif ply > 0:
+            item_index: int = self._game.history.ply_item(ply)
+            self._table_view.select_model_index(
+                self._table_model.index(item_index // 2, item_index % 2)
+            )
+        else:
+            self.on_item_selected(-1)
+
+        clocks: tuple[float, float] | None = self._journal.latest(JournalEvent.CLOCKS)
+
+        if clocks is not None:
+            self._white_clock.time, self._black_clock.time = clocks
+            self._white_clock.display_time()
+            self._black_clock.display_time()
+
+        engine_move: tuple[int, Move] | None = self._journal.latest(
+            JournalEvent.ENGINE_MOVE
+        )
+
+        if engine_move is not None and engine_move[0] == self._game.snapshot.key:
+            self._game.set_arrow(engine_move[1])
+
+        engine_score: tuple[int, Score] | None = self._journal.latest(
+            JournalEvent.ENGINE_SCORE
+        )
+
+        if engine_score is not None and engine_score[0] == self._game.snapshot.key:
+            self._evaluation_bar.animate(engine_score[1])
+
+        self._board.update()
+        return True
+
     def destruct(self) -> None:
         """Terminate engine process and destroy main window."""
+        self._engine_pool.cancel()
+        self._speculator.quit()
         self._engine.quit()
+        self._journal.close()
+        self._analysis_cache.close()
         self.destroy()
 
     def closeEvent(self, event: QCloseEvent) -> None:
@@ -661,7 +935,12 @@ class MainWindow(QMainWindow):
         )
 
         if answer == QMessageBox.StandardButton.Yes:
+            self._engine_pool.cancel()
+            self._speculator.quit()
             self._engine.quit()
+            self._journal.close()
+            self._analysis_cache.close()
+            flush_settings()
             event.accept()
         else:
             event.ignore()
@@ -678,11 +957,98 @@ class MainWindow(QMainWindow):
 
             self._scroll_timer.start()
 
-    @Slot(Move)
-    def on_best_move_analyzed(self, best_move: Move) -> None:
-        """Show `best_move` as arrow on board."""
+    @Slot(tuple, PositionSnapshot)
+    def on_analysis_updated(
+        self, lines: tuple[AnalysisInfo, ...], snapshot: PositionSnapshot
+    ) -> None:
+        """Show engine analysis `lines` unless `snapshot` is stale."""
+        if not self._game.is_current(snapshot):
+            return
+
+        best_line: AnalysisInfo = lines[0]
+        best_move: Move = best_line.pv[0]
+        self._journal.record_engine_move(snapshot.key, best_move)
         self._game.set_arrow(best_move)
 
+        if best_line.score is not None:
+            self._journal.record_engine_score(snapshot.key, best_line.score)
+            self._evaluation_bar.animate(best_line.score)
+
+        variations: list[str] = [
+            self._san_cache.variation_san(self._game.board, snapshot.key, line.pv)
+            for line in lines
+        ]
+
+        if len(lines) == 1:
+            formatted_analysis: str = sub(
+                r"(?=(\b\d+\.+))", "\n", variations[0]
+            ).strip()
+        else:
+            formatted_analysis = "\n\n".join(
+                (
+                    f"{score_text(line.score)}  {variation}"
+                    if line.score is not None
+                    else variation
+                )
+                for line, variation in zip(lines, variations)
+            )
+
+        self._engine_analysis_label.setText(formatted_analysis)
+
+    @Slot(PositionSnapshot)
+    def on_analysis_converged(self, snapshot: PositionSnapshot) -> None:
+        """Announce that analysis has stopped early unless `snapshot` is stale."""
+        if self._game.is_current(snapshot) and self.stop_analysis_action.isEnabled():
+            self._game_notifications_label.setText("Analysis converged")
+
+    @Slot(int, PlyReview)
+    def on_position_reviewed(self, generation: int, review: PlyReview) -> None:
+        """Mark moves around position of `review` unless `generation` is stale."""
+        if self._review is None or generation != self._engine_pool.generation:
+            return
+
+        for ply in self._review.add(review):
+            if ply > len(self._game.history):
+                continue
+
+            before: PlyReview = self._review.get(ply - 1)
+            after: PlyReview = self._review.get(ply)
+            note: str = f"Evaluation: {score_text(after.score)}"
+
+            if before.best_move not in (None, self._game.history.move_at(ply)):
+                board: Board = Board(self._reviewed_positions[ply - 1][1])
+                note += f"\nBest move: {board.san(before.best_move)}"
+
+            self._table_model.set_review(ply, note, self._review.judgements.get(ply))
+
+    @Slot(int)
+    def on_review_finished(self, generation: int) -> None:
+        """Announce that review `generation` has finished."""
+        if self._review is not None and generation == self._engine_pool.generation:
+            self._game_notifications_label.setText("Review finished")
+
+    @Slot(object, AnalysisInfo)
+    def on_position_analyzed(self, key: int, line: AnalysisInfo) -> None:
+        """Show evaluation of speculative `line` if its position is shown."""
+        if (
+            self._game.is_history
+            and key == self._game.snapshot.key
+            and not self.stop_analysis_action.isEnabled()
+        ):
+            self.show_evaluation(line.score)
+
+    @Slot(object)
+    def on_calibration_finished(self, profile: EngineProfile | None) -> None:
+        """Show calibrated engine `profile` or that calibration failed."""
+        self.calibrate_engine_action.setEnabled(True)
+
+        if profile is None:
+            self._game_notifications_label.setText("Calibration failed")
+        else:
+            self._game_notifications_label.setText(
+                f"Calibrated: {profile.threads} threads, {profile.hash} MB"
+            )
+
     @Slot()
     def on_black_time_expired(self) -> None:
         """Handle game termination when Black's time expires."""
@@ -692,7 +1058,7 @@ class MainWindow(QMainWindow):
         self._sound_effect.play_time_expired()
 
         self._game.declare_time_loss_for(BLACK)
-        self._game_notifications_label.setText(self._game.result)
+        self.announce_result()
 
         self._board.disable_interaction()
         self._board.update()
@@ -708,7 +1074,7 @@ class MainWindow(QMainWindow):
         self._sound_effect.play_time_expired()
 
         self._game.declare_time_loss_for(WHITE)
-        self._game_notifications_label.setText(self._game.result)
+        self.announce_result()
 
         self._board.disable_interaction()
         self._board.update()
@@ -718,6 +1084,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def on_fen_validated(self) -> None:
         """Refresh UI after FEN has been validated."""
+        self.cancel_review()
         self.refresh_ui()
 
     @Slot(int)
@@ -731,6 +1098,9 @@ class MainWindow(QMainWindow):
         else:
             self._game.update_state(item_index)
 
+        if self._game.ply < len(self._game.history):
+            self._game.clear_premoves()
+
         self._black_clock.stop_timer()
         self._white_clock.stop_timer()
         self._game.reset_selected_squares()
@@ -738,33 +1108,61 @@ class MainWindow(QMainWindow):
         self.show_fen()
         self.show_opening()
         self.stop_analysis()
+        self.speculate()
 
         if self._game.is_over():
             self._game_notifications_label.setText(self._game.result)
 
+    @Slot(int, int)
+    def on_variation_selected(self, item_index: int, step: int) -> None:
+        """Switch to variation `step` away from move at `item_index`."""
+        if self._game.switch_variation(item_index, step):
+            self.cancel_review()
+            self._table_model.refresh_view()
+            self._table_view.scrollTo(self._table_view.currentIndex())
+            self.on_item_selected(item_index)
+
+    @Slot(str)
+    def on_engine_loaded(self, engine_name: str) -> None:
+        """Show `engine_name` of loaded engine and remember engine for next start."""
+        self._engine_name_label.setText(engine_name)
+        self._engine_name_label.setToolTip(engine_name)
+
+        path_to_file: str = self._engine.path_to_file
+        digest: str = self._engine.digest
+        set_setting_value("engine", "path", path_to_file)
+        self._engine_pool.use_engine(path_to_file, digest)
+        self._speculator.use_engine(path_to_file, digest)
+
     @Slot(str)
     def on_load_failed(self, engine_message: str) -> None:
         """Show `engine_message` after engine load attempt failed."""
         show_info(self, engine_message)
 
-    @Slot(Move)
-    def on_move_played(self, move: Move) -> None:
-        """Play `move` and refresh UI."""
+    @Slot(Move, PositionSnapshot, float)
+    def on_engine_move_played(
+        self, move: Move, snapshot: PositionSnapshot, search_time: float
+    ) -> None:
+        """Play `move` found in `search_time` unless `snapshot` is stale."""
+        if not self._game.is_current(snapshot):
+            return
+
+        self._journal.record_engine_move(snapshot.key, move)
         self._game.push(move)
-        self.refresh_ui()
 
-    @Slot(Move)
-    def on_sound_effect_played(self, move: Move) -> None:
-        """Play sound effect for received `move`."""
-        self._sound_effect.play(move)
+        charged_time: float = perf_counter() - self._engine_invoked_at
+        self._engine_overhead.update(charged_time - search_time)
 
-    @Slot(str)
-    def on_variation_analyzed(self, variation: str) -> None:
-        """Show formatted `variation` based on engine analysis."""
-        formatted_variation: str = sub(r"(?=(\b\d+\.+))", "\n", variation).strip()
-        self._engine_analysis_label.setText(formatted_variation)
-
-    @Slot(Score)
-    def on_score_analyzed(self, score: Score) -> None:
-        """Show position evaluation based on `score`."""
-        self._evaluation_bar.animate(score)
+        self.play_premove()
+
+    @Slot(MoveFacts)
+    def on_move_played(self, facts: MoveFacts) -> None:
+        """Refresh UI after move described by `facts` was played."""
+        self.cancel_review()
+        self.refresh_ui()
+        self._journal.record_clocks(self._white_clock.time, self._black_clock.time)
+
+    @Slot(MoveFacts)
+    def on_sound_effect_played(self, facts: MoveFacts) -> None:
+        """Play sound effect for move described by `facts`."""
+        self._sound_effect.play(facts)
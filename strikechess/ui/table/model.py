@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Any
 
 from PySide6.QtCore import (
@@ -6,27 +8,67 @@ from PySide6.QtCore import (
     QPersistentModelIndex,
     Qt,
 )
+from PySide6.QtGui import QFont
 
 
 class TableModel(QAbstractTableModel):
     """Model for move history in SAN format."""
 
-    def __init__(self, moves: list[str]) -> None:
+    def __init__(self, history: PositionHistory) -> None:
         super().__init__()
 
-        self._moves: list[str] = moves
+        self._history: PositionHistory = history
+        self._judgements: dict[int, MoveJudgement] = {}
+        self._review_notes: dict[int, str] = {}
 
     def data(
         self,
         index: QModelIndex | QPersistentModelIndex,
         role: int = Qt.ItemDataRole.DisplayRole,
     ) -> Any:
-        """Get SAN representation for move at `index`."""
+        """Get SAN representation, review, or variations for move at `index`."""
+        move_index: int = 2 * index.row() + index.column()
+
         if role == Qt.ItemDataRole.DisplayRole:
-            move_index: int = 2 * index.row() + index.column()
+            item_text: str | None = self._history.item_text(move_index)
+            judgement: MoveJudgement | None = self._judgements.get(
+                self._history.item_ply(move_index)
+            )
+
+            if item_text is None or judgement is None:
+                return item_text
+            return f"{item_text}{judgement}"
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            tips: list[str] = []
+            review_note: str | None = self._review_notes.get(
+                self._history.item_ply(move_index)
+            )
+
+            if review_note is not None:
+                tips.append(review_note)
+
+            if variations := self.variations(move_index):
+                tips.append(f"Variations: {', '.join(variations)}")
+
+            return "\n".join(tips) or None
+
+        if role == Qt.ItemDataRole.FontRole:
+            if not self.variations(move_index):
+                return None
+
+            font: QFont = QFont()
+            font.setItalic(True)
+            return font
 
-            if 0 <= move_index < len(self._moves):
-                return self._moves[move_index]
+    def variations(self, move_index: int) -> list[str]:
+        """Get SAN of alternative moves for move at `move_index`."""
+        ply: int = self._history.item_ply(move_index)
+
+        if 0 < ply <= len(self._history) and move_index < self._history.item_count:
+            return self._history.variations_at(ply)
+
+        return []
 
     def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
         """Get interaction state based on data existence at `index`."""
@@ -40,7 +82,7 @@ class TableModel(QAbstractTableModel):
         index: QModelIndex | QPersistentModelIndex = QModelIndex(),
     ) -> int:
         """Get calculated row count needed for White/Black moves."""
-        all_moves: int = len(self._moves) + 1
+        all_moves: int = self._history.item_count + 1
         return all_moves // 2
 
     def columnCount(
@@ -64,10 +106,35 @@ class TableModel(QAbstractTableModel):
             if orientation == Qt.Orientation.Vertical:
                 return section + 1
 
+    def set_review(
+        self, ply: int, note: str, judgement: MoveJudgement | None = None
+    ) -> None:
+        """Show review `note` and `judgement` for move that reached `ply`."""
+        self._review_notes[ply] = note
+
+        if judgement is None:
+            self._judgements.pop(ply, None)
+        else:
+            self._judgements[ply] = judgement
+
+        item_index: int = self._history.ply_item(ply)
+
+        if item_index >= 0:
+            index: QModelIndex = self.index(item_index // 2, item_index % 2)
+            self.dataChanged.emit(index, index)
+
+    def clear_review(self) -> None:
+        """Remove review notes and judgements of all moves."""
+        if self._review_notes or self._judgements:
+            self._review_notes.clear()
+            self._judgements.clear()
+            self.refresh_view()
+
     def reset(self) -> None:
-        """Clear stored move history data from model."""
+        """Reset model after move history has been cleared."""
+        self._review_notes.clear()
+        self._judgements.clear()
         self.beginResetModel()
-        self._moves.clear()
         self.endResetModel()
 
     def refresh_view(self) -> None:
@@ -17,6 +17,7 @@ class TableView(QTableView):
     """View for move history in SAN format."""
 
     item_selected: ClassVar[Signal] = Signal(int)
+    variation_selected: ClassVar[Signal] = Signal(int, int)
 
     def __init__(self, table_model: QAbstractTableModel) -> None:
         super().__init__()
@@ -93,11 +94,15 @@ class TableView(QTableView):
         event.ignore()
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
-        """Select move using left/right arrow keys."""
+        """Select move using left/right and variation using up/down keys."""
         if event.key() == Qt.Key.Key_Left:
             self.select_previous_item()
         elif event.key() == Qt.Key.Key_Right:
             self.select_next_item()
+        elif event.key() == Qt.Key.Key_Up:
+            self.variation_selected.emit(self.item_index, -1)
+        elif event.key() == Qt.Key.Key_Down:
+            self.variation_selected.emit(self.item_index, 1)
 
     @Slot()
     def on_current_changed(self) -> None:
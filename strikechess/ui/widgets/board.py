@@ -4,7 +4,7 @@ from enum import IntEnum
 from functools import lru_cache
 from typing import Final, Literal, NamedTuple
 
-from chess import Move, Piece, square, svg
+from chess import Board, Move, Piece, SquareSet, square, svg
 from PySide6.QtCore import (
     Property,
     QEasingCurve,
@@ -18,6 +18,7 @@ from PySide6.QtGui import QColor, QPainter
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtSvgWidgets import QSvgWidget
 
+from strikechess.logic import premove_targets
 from strikechess.utils import setting_value
 
 
@@ -39,6 +40,7 @@ class BoardCache(NamedTuple):
     check: Square | None
     square: Square | None
     arrow: tuple[tuple[Square, Square]]
+    premoves: tuple[Move, ...]
 
 
 class SvgBoard(QSvgWidget):
@@ -84,6 +86,11 @@ class SvgBoard(QSvgWidget):
         lambda self: self._square_light_lastmove,
         lambda self, color: self.update_color("_square_light_lastmove", color),
     )
+    square_premove: Property = Property(
+        QColor,
+        lambda self: self._square_premove,
+        lambda self, color: self.update_color("_square_premove", color),
+    )
 
     point: Property = Property(
         QPointF,
@@ -114,6 +121,7 @@ class SvgBoard(QSvgWidget):
         self._square_dark_lastmove: QColor = QColor()
         self._square_light: QColor = QColor()
         self._square_light_lastmove: QColor = QColor()
+        self._square_premove: QColor = QColor()
 
         self._animation: QPropertyAnimation = QPropertyAnimation(self, b"point")
         self._animation.setDuration(350)
@@ -209,6 +217,7 @@ class SvgBoard(QSvgWidget):
             square=self.origin_square,
             orientation=self.orientation,
             arrow=tuple(self._game.arrow),
+            premoves=tuple(self._game.premoves),
         )
 
     def set_animation_point(self, value: QPointF) -> None:
@@ -249,6 +258,12 @@ class SvgBoard(QSvgWidget):
         self.cursor_point = event.position()
         return self.cursor_point
 
+    def displayed_board(self) -> Board:
+        """Get board with queued premoves played on top of current position."""
+        if self._game.premoves:
+            return self._game.premove_board
+        return self._game.board
+
     def can_drag(self, piece: Piece | None) -> bool:
         """Return True if `piece` does not belong to engine."""
         return (
@@ -258,14 +273,19 @@ class SvgBoard(QSvgWidget):
         )
 
     def is_legal(self, target_square: Square) -> bool:
-        """Return True if `target_square` is legal for dragged piece."""
-        legal_targets: list[Square] = self._game.legal_targets(self.origin_square)
-        return target_square in legal_targets
+        """Return True if `target_square` is legal or premove for dragged piece."""
+        if self.origin_square is not None and self._game.is_premove_allowed():
+            premove_squares: SquareSet = premove_targets(
+                self.displayed_board(), self.origin_square
+            )
+            return target_square in premove_squares
+
+        return self._game.legal_move_map.is_legal(self.origin_square, target_square)
 
     def update_cursor_shape_at(self, cursor_point: QPointF) -> None:
         """Update cursor shape at `cursor_point`."""
         square_index: Square = self.square_index(cursor_point)
-        piece: Piece | None = self._game.piece_at(square_index)
+        piece: Piece | None = self.displayed_board().piece_at(square_index)
 
         if self.is_dragging:
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
@@ -301,9 +321,12 @@ class SvgBoard(QSvgWidget):
         self.update()
 
     def drop_piece(self, target_square: Square) -> None:
-        """Drop dragged piece onto `target_square`."""
-        self._game.target_square = target_square
-        self._game.find_legal_move(self.origin_square, target_square)
+        """Drop dragged piece onto `target_square` as move or premove."""
+        if self._game.is_premove_allowed():
+            self._game.queue_premove(self.origin_square, target_square)
+        else:
+            self._game.target_square = target_square
+            self._game.find_legal_move(self.origin_square, target_square)
 
         self.stop_dragging()
 
@@ -339,7 +362,7 @@ class SvgBoard(QSvgWidget):
     @lru_cache(maxsize=128)
     def svg_data(self, cache: BoardCache) -> bytes:
         """Transform current board state into SVG data as bytes."""
-        board_to_render: Board = self._game.board
+        board_to_render: Board = self.displayed_board()
 
         if cache.square is not None and cache.dragging or self.is_animating:
             square: Square | None = (
@@ -349,13 +372,21 @@ class SvgBoard(QSvgWidget):
             board_to_render.set_piece_at(square=square, piece=None)
 
         cached_square: Square | None = cache.square if cache.dragging else None
-        legal_targets: list[Square] = self._game.legal_targets(cached_square)
 
+        if cached_square is not None and self._game.is_premove_allowed():
+            legal_targets: SquareSet = premove_targets(
+                self.displayed_board(), cached_square
+            )
+        else:
+            legal_targets = self._game.legal_targets(cached_square)
+
+        premove_color: str = self._square_premove.name()
         svg_board: str = svg.board(
             check=cache.check,
             arrows=cache.arrow,
             board=board_to_render,
             squares=legal_targets,
+            fill=dict.fromkeys(self._game.premoves.squares(), premove_color),
             colors=self.color_names(),
             orientation=cache.orientation,
         )
@@ -404,9 +435,11 @@ class SvgBoard(QSvgWidget):
         super().paintEvent(event)
 
         if self.is_dragging and self.dragged_piece is not None:
-            current_piece: Piece = self._game.piece_at(self.origin_square)
+            current_piece: Piece | None = self.displayed_board().piece_at(
+                self.origin_square
+            )
 
-            if current_piece.color != self.dragged_piece.color:
+            if current_piece is None or current_piece.color != self.dragged_piece.color:
                 self.stop_dragging()
             else:
                 self.render_piece(self.cursor_point)
@@ -420,13 +453,18 @@ class SvgBoard(QSvgWidget):
         self._game.set_selected_square(square_index)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
-        """Handle mouse press for piece selection or targeting."""
+        """Handle mouse press for piece selection, targeting, or premove cancel."""
         if self._game.is_over() or not self.is_interactive:
             return
 
+        if event.button() == Qt.MouseButton.RightButton:
+            self._game.clear_premoves()
+            self.stop_dragging()
+            return
+
         cursor_point: QPointF = self.cursor_point_from(event)
         square_index: Square = self.square_index(cursor_point)
-        piece: Piece | None = self._game.piece_at(square_index)
+        piece: Piece | None = self.displayed_board().piece_at(square_index)
 
         if piece is not None and self.can_drag(piece):
             self.start_dragging(square_index, piece)
@@ -2,7 +2,7 @@ from chess.engine import Score
 from PySide6.QtCore import QEasingCurve, QPropertyAnimation, Qt
 from PySide6.QtWidgets import QProgressBar
 
-from strikechess.utils import setting_value
+from strikechess.utils import score_text, setting_value
 
 
 class EvaluationBar(QProgressBar):
@@ -29,12 +29,13 @@ class EvaluationBar(QProgressBar):
         if evaluation.is_mate():
             moves_to_mate: int = evaluation.mate() or 0
             animation_value: int = 0 if moves_to_mate > 0 else 1000
-            evaluation_text: str = f"M{moves_to_mate}"
         else:
-            evaluation_score: int = evaluation.score() or 0
-            animation_value = 500 - evaluation_score
-            evaluation_text = f"{evaluation_score / 100 :.2f}"
+            animation_value = 500 - (evaluation.score() or 0)
+
+        self.setFormat(score_text(evaluation))
+
+        if animation_value == self._animation.endValue():
+            return
 
-        self.setFormat(evaluation_text)
         self._animation.setEndValue(animation_value)
         self._animation.start()
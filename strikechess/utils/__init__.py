@@ -4,12 +4,11 @@ from .helper_functions import (
     create_app,
     create_button,
     create_splash_screen,
-    delete_quarantine_attribute,
-    engine_configuration,
     engine_file_filter,
     find_opening,
-    make_executable,
-    path_to_stockfish,
+    flush_settings,
+    resource_governor,
+    score_text,
     set_setting_value,
     setting_value,
     show_info,
@@ -17,20 +16,25 @@ from .helper_functions import (
     style_name,
     svg_icon,
 )
+from .resource_governor import EngineAllocation, EngineRole, ResourceGovernor
+from .settings_store import SettingsStore
 
 
 __all__: list[str] = [
+    "EngineAllocation",
+    "EngineRole",
+    "ResourceGovernor",
+    "SettingsStore",
     "colorize_icon",
     "create_action",
     "create_app",
     "create_button",
     "create_splash_screen",
-    "delete_quarantine_attribute",
-    "engine_configuration",
     "engine_file_filter",
     "find_opening",
-    "make_executable",
-    "path_to_stockfish",
+    "flush_settings",
+    "resource_governor",
+    "score_text",
     "set_setting_value",
     "setting_value",
     "show_info",
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
+import atexit
 import json
-import os
 import platform
-import stat
-import subprocess
 import sys
 from functools import lru_cache
-from typing import Any, Callable, Final
+from typing import Any, Callable
 
-from psutil import cpu_count, virtual_memory
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QAction, QColor, QIcon, QPixmap
 from PySide6.QtWidgets import QApplication, QMessageBox, QPushButton, QSplashScreen
 
+from strikechess.utils.resource_governor import ResourceGovernor
+from strikechess.utils.settings_store import SettingsStore
+
 
 def colorize_icon(color: str) -> QIcon:
     """Get icon in 16 by 16 pixels filled with `color`."""
@@ -92,26 +92,31 @@ def svg_icon(file_name: str) -> QIcon:
     return QIcon(f":/icons/{file_name}.svg")
 
 
-def _settings() -> dict[str, dict[str, Any]]:
-    """Get all settings from settings.json file."""
-    with open("strikechess/settings.json") as settings_file:
-        return json.load(settings_file)
+_settings_store: SettingsStore = SettingsStore("strikechess/settings.json")
+atexit.register(_settings_store.close)
 
 
 def setting_value(section: str, key: str) -> Any:
     """Get value of `key` from `section`."""
-    settings_dict: dict[str, dict[str, Any]] = _settings()
-    return settings_dict[section][key]
+    return _settings_store.settings[section][key]
 
 
 def set_setting_value(section: str, key: str, value: Any) -> None:
     """Set `value` to `key` for `section`."""
-    settings_dict: dict[str, dict[str, Any]] = _settings()
-    settings_dict[section][key] = value
+    _settings_store.set_value(section, key, value)
+
+
+def flush_settings() -> None:
+    """Write pending setting changes to disk immediately."""
+    _settings_store.flush()
+
 
-    with open("strikechess/settings.json", mode="w", newline="\n") as settings_file:
-        json.dump(settings_dict, settings_file, indent=2)
-        settings_file.write("\n")
+_resource_governor: ResourceGovernor = ResourceGovernor()
+
+
+def resource_governor() -> ResourceGovernor:
+    """Get governor of hash and threads shared by all engine processes."""
+    return _resource_governor
 
 
 def style_name(file_name: str) -> str:
@@ -129,24 +134,11 @@ def style_name(file_name: str) -> str:
     return styles[file_name]
 
 
-def delete_quarantine_attribute(path_to_file: str) -> None:
-    """Delete quarantine attribute for file at `path_to_file`."""
-    if platform.system() == "Darwin":
-        subprocess.run(
-            ["xattr", "-d", "com.apple.quarantine", path_to_file],
-            stderr=subprocess.DEVNULL,
-        )
-
-
-def engine_configuration() -> dict[str, int]:
-    """Get engine configuration with 70% of RAM and all CPU threads."""
-    MEGABYTES_FACTOR: Final[int] = 1024**2
-    SEVENTY_PERCENT: Final[float] = 70 / 100
-
-    hash: int = int(virtual_memory().available // MEGABYTES_FACTOR * SEVENTY_PERCENT)
-    threads: int = cpu_count() or 1
-
-    return {"Hash": hash, "Threads": threads}
+def score_text(score: Score) -> str:
+    """Get `score` formatted as pawns or as moves to mate."""
+    if score.is_mate():
+        return f"M{score.mate() or 0}"
+    return f"{(score.score() or 0) / 100 :.2f}"
 
 
 def engine_file_filter() -> str:
@@ -154,19 +146,6 @@ def engine_file_filter() -> str:
     return "UCI engine (*.exe)" if platform.system() == "Windows" else ""
 
 
-def make_executable(path_to_file: str) -> None:
-    """Make file at `path_to_file` be executable."""
-    if platform.system() == "Linux":
-        os.chmod(path_to_file, os.stat(path_to_file).st_mode | stat.S_IXUSR)
-
-
-def path_to_stockfish() -> str:
-    """Get path to executable file of default Stockfish 17.1 engine."""
-    system: str = platform.system()
-    extension: str = ".exe" if system == "Windows" else ""
-    return f"strikechess/assets/engines/stockfish-17.1/{system}/stockfish{extension}"
-
-
 @lru_cache(maxsize=1)
 def _load_openings() -> dict[str, list[str]]:
     """Load openings from JSON file."""
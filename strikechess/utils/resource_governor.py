@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+from enum import StrEnum
+from itertools import count
+from typing import Final, NamedTuple
+
+import psutil
+
+
+MEGABYTES_FACTOR: Final[int] = 1024**2
+HASH_SHARE: Final[float] = 70 / 100
+HASH_LIMIT: Final[int] = 4096
+MINIMUM_HASH: Final[int] = 16
+FOREGROUND_HASH_SHARE: Final[float] = 3 / 4
+BACKGROUND_NICENESS: Final[int] = 10
+
+
+class EngineRole(StrEnum):
+    """Kinds of engine jobs competing for CPU and memory."""
+
+    Foreground = "foreground"
+    Background = "background"
+
+
+class EngineAllocation(NamedTuple):
+    """Hash in megabytes, search threads, and CPUs granted to one engine."""
+
+    hash: int
+    threads: int
+    cpus: tuple[int, ...] = ()
+
+    def configuration(self) -> dict[str, int]:
+        """Get UCI options that apply this allocation."""
+        return {"Hash": self.hash, "Threads": self.threads}
+
+    def limited_to(self, profile: EngineProfile | None) -> EngineAllocation:
+        """Get allocation granting no more hash and threads than `profile`."""
+        if profile is None:
+            return self
+
+        return self._replace(
+            hash=min(self.hash, profile.hash),
+            threads=min(self.threads, profile.threads),
+        )
+
+
+class _EngineProcess(NamedTuple):
+    """Engine process registered with governor."""
+
+    pid: int | None
+    role: EngineRole
+
+
+class ResourceGovernor:
+    """Allocator of hash and threads across all running engine processes.
+
+    Foreground engines, which play and analyze interactively, keep most
+    of the machine. Background engines share the rest, run at lower OS
+    priority, and are pinned to their own CPUs so they cannot slow the
+    foreground engine down. Allocations are rebalanced whenever an engine
+    is registered or unregistered.
+    """
+
+    def __init__(
+        self, cpu_count: int | None = None, hash_budget: int | None = None
+    ) -> None:
+        self._cpu_count: int = cpu_count or psutil.cpu_count() or 1
+        self._hash_budget: int = hash_budget or min(
+            int(psutil.virtual_memory().available // MEGABYTES_FACTOR * HASH_SHARE),
+            HASH_LIMIT,
+        )
+
+        self._lock: threading.Lock = threading.Lock()
+        self._keys: count = count(1)
+        self._processes: dict[int, _EngineProcess] = {}
+        self._allocations: dict[int, EngineAllocation] = {}
+        self._startup_times: dict[tuple[int, int], list[float]] = {}
+
+    @property
+    def cpu_count(self) -> int:
+        """Get number of logical CPUs shared by engines."""
+        return self._cpu_count
+
+    @property
+    def hash_budget(self) -> int:
+        """Get megabytes of hash shared by engines."""
+        return self._hash_budget
+
+    @property
+    def startup_times(self) -> dict[tuple[int, int], list[float]]:
+        """Get measured engine startup seconds keyed by hash and threads."""
+        with self._lock:
+            return {
+                configuration: list(seconds)
+                for configuration, seconds in self._startup_times.items()
+            }
+
+    def register(self, pid: int | None, role: EngineRole) -> int:
+        """Register engine process `pid` in `role` and get its key."""
+        with self._lock:
+            key: int = next(self._keys)
+            self._processes[key] = _EngineProcess(pid, role)
+            self._rebalance()
+            return key
+
+    def unregister(self, key: int) -> None:
+        """Forget engine registered as `key` and rebalance the others."""
+        with self._lock:
+            if self._processes.pop(key, None) is not None:
+                self._rebalance()
+
+    def allocation(self, key: int) -> EngineAllocation:
+        """Get current allocation of engine registered as `key`."""
+        with self._lock:
+            return self._allocations.get(key, EngineAllocation(MINIMUM_HASH, 1))
+
+    def record_startup(self, allocation: EngineAllocation, seconds: float) -> None:
+        """Record `seconds` that engine took to start with `allocation`."""
+        with self._lock:
+            self._startup_times.setdefault(
+                (allocation.hash, allocation.threads), []
+            ).append(seconds)
+
+    def _split(
+        self, keys: list[int], cpus: list[int], hash_budget: int, is_pinned: bool
+    ) -> None:
+        """Split `cpus` and `hash_budget` evenly among engines of `keys`."""
+        if not keys:
+            return
+
+        hash_size: int = max(hash_budget // len(keys), MINIMUM_HASH)
+        threads: int = max(len(cpus) // len(keys), 1)
+
+        for index, key in enumerate(keys):
+            engine_cpus: tuple[int, ...] = ()
+
+            if is_pinned:
+                start: int = index * threads % len(cpus)
+                engine_cpus = tuple(cpus[start : start + threads])
+
+            self._allocations[key] = EngineAllocation(hash_size, threads, engine_cpus)
+
+    def _rebalance(self) -> None:
+        """Recompute allocations and apply OS priority and CPU affinity."""
+        foreground: list[int] = [
+            key
+            for key, process in self._processes.items()
+            if process.role is EngineRole.Foreground
+        ]
+        background: list[int] = [
+            key
+            for key, process in self._processes.items()
+            if process.role is EngineRole.Background
+        ]
+        cpus: list[int] = list(range(self._cpu_count))
+        self._allocations = {}
+
+        if not background:
+            self._split(foreground, cpus, self._hash_budget, is_pinned=False)
+        elif not foreground:
+            self._split(background, cpus, self._hash_budget, is_pinned=True)
+        else:
+            foreground_cpu_count: int = max(len(cpus) // 2, 1)
+            foreground_hash: int = int(self._hash_budget * FOREGROUND_HASH_SHARE)
+            self._split(
+                foreground,
+                cpus[:foreground_cpu_count],
+                foreground_hash,
+                is_pinned=True,
+            )
+            self._split(
+                background,
+                cpus[foreground_cpu_count:] or cpus,
+                self._hash_budget - foreground_hash,
+                is_pinned=True,
+            )
+
+        for key, process in self._processes.items():
+            self._apply_priority(process, self._allocations[key])
+
+    def _apply_priority(
+        self, process: _EngineProcess, allocation: EngineAllocation
+    ) -> None:
+        """Set OS priority and CPU affinity of `process` from `allocation`."""
+        if process.pid is None:
+            return
+
+        try:
+            os_process: psutil.Process = psutil.Process(process.pid)
+
+            if process.role is EngineRole.Background:
+                os_process.nice(
+                    psutil.BELOW_NORMAL_PRIORITY_CLASS
+                    if psutil.WINDOWS
+                    else BACKGROUND_NICENESS
+                )
+
+            if hasattr(os_process, "cpu_affinity"):
+                os_process.cpu_affinity(list(allocation.cpus))
+        except (psutil.Error, OSError, ValueError):
+            pass
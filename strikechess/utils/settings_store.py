@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import tempfile
+import threading
+from typing import Any, Final
+
+
+FILE_MODE: Final[int] = 0o644
+
+
+class SettingsStore:
+    """In-memory settings with debounced, atomic write-behind persistence."""
+
+    def __init__(
+        self,
+        path_to_file: str,
+        write_delay: float = 0.5,
+        reload_interval: float = 1.0,
+    ) -> None:
+        self._path_to_file: str = path_to_file
+        self._write_delay: float = write_delay
+        self._reload_interval: float = reload_interval
+
+        self._lock: threading.RLock = threading.RLock()
+        self._pending: dict[tuple[str, str], Any] = {}
+        self._write_timer: threading.Timer | None = None
+        self._stop_event: threading.Event = threading.Event()
+
+        self.settings: dict[str, dict[str, Any]] = self._read()
+        self._modified_time: float = self._file_modified_time()
+
+        self._watcher: threading.Thread = threading.Thread(
+            target=self._watch_file,
+            name="SettingsWatcher",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Get all settings from settings file."""
+        with open(self._path_to_file) as settings_file:
+            return json.load(settings_file)
+
+    def _file_modified_time(self) -> float:
+        """Get modification time of settings file or 0.0 if it is missing."""
+        try:
+            return os.stat(self._path_to_file).st_mtime
+        except OSError:
+            return 0.0
+
+    def _file_mode(self) -> int:
+        """Get permission bits of settings file or default ones if it is missing."""
+        try:
+            return stat.S_IMODE(os.stat(self._path_to_file).st_mode)
+        except OSError:
+            return FILE_MODE
+
+    def _watch_file(self) -> None:
+        """Reload settings whenever settings file changes on disk."""
+        while not self._stop_event.wait(self._reload_interval):
+            if self._file_modified_time() != self._modified_time:
+                self.reload()
+
+    def value(self, section: str, key: str) -> Any:
+        """Get value of `key` from `section`."""
+        return self.settings[section][key]
+
+    def set_value(self, section: str, key: str, value: Any) -> None:
+        """Set `value` to `key` for `section` and schedule write to disk."""
+        with self._lock:
+            self.settings[section][key] = value
+            self._pending[(section, key)] = value
+            self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        """Restart write timer so that rapid changes get written once."""
+        if self._write_timer is not None:
+            self._write_timer.cancel()
+
+        self._write_timer = threading.Timer(self._write_delay, self.flush)
+        self._write_timer.daemon = True
+        self._write_timer.start()
+
+    def reload(self) -> None:
+        """Reload settings from disk, keeping changes not yet written."""
+        with self._lock:
+            try:
+                settings: dict[str, dict[str, Any]] = self._read()
+            except (OSError, ValueError):
+                return
+
+            for (section, key), value in self._pending.items():
+                settings.setdefault(section, {})[key] = value
+
+            self.settings = settings
+            self._modified_time = self._file_modified_time()
+
+    def flush(self) -> None:
+        """Write pending changes to disk atomically via temp file and rename."""
+        with self._lock:
+            if self._write_timer is not None:
+                self._write_timer.cancel()
+                self._write_timer = None
+
+            if not self._pending:
+                return
+
+            directory: str = os.path.dirname(self._path_to_file) or "."
+            file_descriptor, temp_path = tempfile.mkstemp(
+                prefix=".settings-",
+                suffix=".tmp",
+                dir=directory,
+            )
+
+            try:
+                with os.fdopen(file_descriptor, "w", newline="\n") as temp_file:
+                    json.dump(self.settings, temp_file, indent=2)
+                    temp_file.write("\n")
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+                os.chmod(temp_path, self._file_mode())
+                os.replace(temp_path, self._path_to_file)
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            self._pending.clear()
+            self._modified_time = self._file_modified_time()
+
+    def close(self) -> None:
+        """Write pending changes and stop watching settings file."""
+        self._stop_event.set()
+        self.flush()